@@ -0,0 +1,213 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from types import ModuleType
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 같은 이름의 generic_search.py가 여러 디렉터리에 복사되어 있어 파일 경로로 각각 불러옴
+IMPLEMENTATIONS: Dict[str, str] = {
+    "search": os.path.join("search", "generic_search.py"),
+    "search/maze": os.path.join("search", "maze", "generic_search.py"),
+    "search/missionaries": os.path.join("search", "missionaries", "generic_search.py"),
+    "graph": os.path.join("graph", "generic_search.py"),
+    "dna_search": os.path.join("search", "dna_search", "dna_search.py"),
+}
+
+DEFAULT_CONTAINS_SIZES: List[int] = [10_000, 100_000, 1_000_000]
+DEFAULT_GRID_SIZES: List[int] = [50, 100, 200]
+
+Cell = Tuple[int, int]
+
+class Result(NamedTuple):
+    name: str # 측정한 함수
+    impl: str # 함수를 가져온 모듈 (IMPLEMENTATIONS의 키)
+    size: int # 문제 크기 (리스트 길이 또는 격자 한 변의 길이)
+    time: float # repeat번 실행 중 가장 짧은 시간 (초)
+    peak_memory: int # tracemalloc으로 잰 최대 메모리 (바이트)
+    # 탐색에서 successors를 부른 횟수 (contains는 0). 탐색 함수가 세는 visited_count와는 다름:
+    # 복사본마다 visited_count를 반환하는지가 달라 같은 기준으로 잴 수 있는 successors 호출 수를 씀
+    # (search/maze의 SearchStats.successors_calls와 같은 값)
+    successors_calls: int
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return self.name, self.impl, self.size
+
+def load_implementation(name: str) -> ModuleType:
+    path: str = os.path.join(ROOT, IMPLEMENTATIONS[name])
+    module_name: str = "bench_" + name.replace("/", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module) # type: ignore
+    return module
+
+class GridProblem:
+    """모든 generic_search 복사본에 똑같이 줄 수 있는, 시드로 재현되는 격자 탐색 문제.
+    (0, 0)에서 (size - 1, size - 1)까지 가며, 막힌 칸의 비율은 sparseness."""
+
+    def __init__(self, size: int, sparseness: float = 0.2, seed: int = 0) -> None:
+        rng: random.Random = random.Random(seed)
+        self.size: int = size
+        self.start: Cell = (0, 0)
+        self.goal: Cell = (size - 1, size - 1)
+        self.blocked: Set[Cell] = {(r, c) for r in range(size) for c in range(size)
+                                   if rng.random() < sparseness} - {self.start, self.goal}
+        self.calls: int = 0
+
+    def goal_test(self, cell: Cell) -> bool:
+        return cell == self.goal
+
+    def successors(self, cell: Cell) -> List[Cell]:
+        self.calls += 1
+        r, c = cell
+        return [n for n in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1))
+                if 0 <= n[0] < self.size and 0 <= n[1] < self.size and n not in self.blocked]
+
+    def heuristic(self, cell: Cell) -> float:
+        return abs(cell[0] - self.goal[0]) + abs(cell[1] - self.goal[1])
+
+# 한 번 실행할 함수를 만들어 돌려줌. 실행 후 successors 호출 수를 돌려주는 함수와 함께
+Case = Tuple[Callable[[], Any], Callable[[], int]]
+
+def contains_cases(module: ModuleType, size: int) -> Dict[str, Case]:
+    items: List[int] = list(range(size))
+    keys: List[int] = [size - 1, -1, size // 2] # 끝, 없는 값, 가운데
+    no_calls: Callable[[], int] = lambda: 0
+    return {
+        "linear_contains": (lambda: [module.linear_contains(items, k) for k in keys], no_calls),
+        "binary_contains": (lambda: [module.binary_contains(items, k) for k in keys], no_calls),
+    }
+
+def search_cases(module: ModuleType, size: int) -> Dict[str, Case]:
+    problem: GridProblem = GridProblem(size)
+    def run(search: Callable[..., Any], *args: Any) -> Callable[[], Any]:
+        def call() -> Any:
+            problem.calls = 0
+            return search(problem.start, problem.goal_test, problem.successors, *args)
+        return call
+    cases: Dict[str, Case] = {}
+    for name in ("dfs", "bfs"):
+        if hasattr(module, name):
+            cases[name] = (run(getattr(module, name)), lambda: problem.calls)
+    if hasattr(module, "astar"):
+        cases["astar"] = (run(module.astar, problem.heuristic), lambda: problem.calls)
+    return cases
+
+def measure(func: Callable[[], Any], calls: Callable[[], int], repeat: int) -> Tuple[float, int, int]:
+    best: float = float("inf")
+    for _ in range(repeat):
+        begin: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - begin)
+    # 메모리는 추적 비용이 시간에 섞이지 않도록 따로 한 번 더 실행해 잼
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, calls()
+
+def run_benchmarks(implementations: Optional[Sequence[str]] = None,
+                   contains_sizes: Sequence[int] = DEFAULT_CONTAINS_SIZES,
+                   grid_sizes: Sequence[int] = DEFAULT_GRID_SIZES,
+                   repeat: int = 3) -> List[Result]:
+    results: List[Result] = []
+    for impl in implementations or list(IMPLEMENTATIONS):
+        module: ModuleType = load_implementation(impl)
+        for builder, sizes in ((contains_cases, contains_sizes), (search_cases, grid_sizes)):
+            for size in sizes:
+                for name, (func, calls) in builder(module, size).items():
+                    elapsed, peak, successors_calls = measure(func, calls, repeat)
+                    results.append(Result(name, impl, size, elapsed, peak, successors_calls))
+    return results
+
+def save_results(results: List[Result], path: str) -> None:
+    data: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [r._asdict() for r in results],
+    }
+    with open(path, "w") as out:
+        json.dump(data, out, indent=2)
+
+def load_results(path: str) -> List[Result]:
+    with open(path) as f:
+        records: List[Dict[str, Any]] = json.load(f)["results"]
+    for r in records:
+        if "visited" in r: # 필드 이름이 visited였던 예전 결과 파일
+            r["successors_calls"] = r.pop("visited")
+    return [Result(**r) for r in records]
+
+class Regression(NamedTuple):
+    key: Tuple[str, str, int]
+    metric: str # "time", "peak_memory" 또는 "successors_calls"
+    before: float
+    after: float
+
+# 두 실행 결과를 비교해, 시간이나 메모리가 threshold 비율보다 더 늘었거나 successors 호출 수가 바뀐 항목
+# 아주 짧은 측정은 잡음이 크므로 시간은 min_time_delta초 넘게 늘어난 경우만 셈
+def compare_results(before: List[Result], after: List[Result], threshold: float = 0.1,
+                    min_time_delta: float = 0.001) -> List[Regression]:
+    baseline: Dict[Tuple[str, str, int], Result] = {r.key: r for r in before}
+    regressions: List[Regression] = []
+    for current in after:
+        old: Optional[Result] = baseline.get(current.key)
+        if old is None:
+            continue
+        if current.time > old.time * (1 + threshold) and current.time - old.time > min_time_delta:
+            regressions.append(Regression(current.key, "time", old.time, current.time))
+        if current.peak_memory > old.peak_memory * (1 + threshold):
+            regressions.append(Regression(current.key, "peak_memory", old.peak_memory, current.peak_memory))
+        # 같은 문제에서 successors 호출 수가 바뀌면 탐색 동작이 바뀐 것
+        if current.successors_calls != old.successors_calls:
+            regressions.append(Regression(current.key, "successors_calls", old.successors_calls, current.successors_calls))
+    return regressions
+
+def print_results(results: List[Result]) -> None:
+    print(f"{'함수':16} {'모듈':20} {'크기':>9} {'시간(ms)':>10} {'메모리(KiB)':>12} {'successors':>10}")
+    for r in results:
+        print(f"{r.name:16} {r.impl:20} {r.size:>9} {r.time * 1000:>10.3f} {r.peak_memory / 1024:>12.1f} {r.successors_calls:>10}")
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="generic_search 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="벤치마크를 실행하고 JSON으로 저장")
+    run.add_argument("-o", "--output", default="benchmark_results.json")
+    run.add_argument("--impl", action="append", choices=list(IMPLEMENTATIONS), help="측정할 모듈 (여러 번 지정 가능)")
+    run.add_argument("--contains-sizes", type=int, nargs="*", default=DEFAULT_CONTAINS_SIZES)
+    run.add_argument("--grid-sizes", type=int, nargs="*", default=DEFAULT_GRID_SIZES)
+    run.add_argument("--repeat", type=int, default=3)
+    compare = commands.add_parser("compare", help="두 결과 파일을 비교해 성능 저하를 찾음")
+    compare.add_argument("before")
+    compare.add_argument("after")
+    compare.add_argument("--threshold", type=float, default=0.1)
+    compare.add_argument("--min-time-delta", type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results: List[Result] = run_benchmarks(args.impl, args.contains_sizes, args.grid_sizes, args.repeat)
+        print_results(results)
+        save_results(results, args.output)
+        print(f"결과 저장: {args.output}")
+        return 0
+    regressions: List[Regression] = compare_results(load_results(args.before), load_results(args.after),
+                                                        args.threshold, args.min_time_delta)
+    for (name, impl, size), metric, before, after in regressions:
+        print(f"{name} [{impl}, 크기 {size}] {metric}: {before:g} -> {after:g}")
+    print(f"성능 저하 {len(regressions)}건")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
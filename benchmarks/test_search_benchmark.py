@@ -0,0 +1,48 @@
+from search_benchmark import (run_benchmarks, compare_results, save_results, load_results, main,
+                              GridProblem, IMPLEMENTATIONS)
+
+
+def small_run(implementations=None):
+    return run_benchmarks(implementations, contains_sizes=[100], grid_sizes=[10], repeat=1)
+
+
+def test_runs_every_implementation():
+    results = small_run()
+    names = {(r.impl, r.name) for r in results}
+    for impl in IMPLEMENTATIONS:
+        assert (impl, "linear_contains") in names
+        assert (impl, "binary_contains") in names
+    assert ("search/maze", "astar") in names
+    assert ("graph", "bfs") in names
+    # 같은 문제이므로 BFS의 successors 호출 수는 복사본마다 같아야 함
+    bfs_calls = {r.successors_calls for r in results if r.name == "bfs"}
+    assert len(bfs_calls) == 1
+
+
+def test_grid_problem_is_reproducible():
+    assert GridProblem(30, seed=1).blocked == GridProblem(30, seed=1).blocked
+
+
+def test_compare_flags_regressions(tmp_path):
+    before = small_run(["search/maze"])
+    path = tmp_path / "before.json"
+    save_results(before, str(path))
+    assert load_results(str(path)) == before
+    assert compare_results(before, before) == []
+
+    slower = [r._replace(time=r.time * 2 + 0.01, successors_calls=r.successors_calls + 1) for r in before]
+    regressions = compare_results(before, slower)
+    assert {reg.metric for reg in regressions} == {"time", "successors_calls"}
+    assert len([reg for reg in regressions if reg.metric == "time"]) == len(before)
+
+    after = tmp_path / "after.json"
+    save_results(slower, str(after))
+    assert main(["compare", str(path), str(path)]) == 0
+    assert main(["compare", str(path), str(after)]) == 1
+
+
+def test_loads_results_saved_with_visited_field(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text('{"results": [{"name": "bfs", "impl": "graph", "size": 10, "time": 0.1,'
+                    ' "peak_memory": 100, "visited": 42}]}')
+    assert load_results(str(path))[0].successors_calls == 42
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Optional, Tuple, Dict, Callable
+import random
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from mst import WeightedPath, print_weighted_path
+from priority_queue import IndexedPriorityQueue
+from dijkstra import dijkstra, dijkstra_to, path_dict_to_path
+
+V = TypeVar('V') # 그래프 정점(vertex) 타입
+
+# 이미 고른 랜드마크들에서 가장 먼 정점을 차례로 고름 (farthest-point 선택)
+# 첫 랜드마크는 무작위 정점에서 가장 먼 정점. 무향 그래프를 가정함
+def select_landmarks(wg: WeightedGraph[V], count: int, seed: int = 0) -> List[int]:
+    if wg.vertex_count == 0 or count <= 0:
+        return []
+    rng: random.Random = random.Random(seed)
+    start: int = rng.randrange(wg.vertex_count)
+    # 가장 가까운 랜드마크까지의 거리. 아직 랜드마크가 없을 때는 시작 정점에서의 거리
+    nearest: List[Optional[float]] = dijkstra(wg, wg.vertex_at(start))[0]
+    landmarks: List[int] = []
+    while len(landmarks) < min(count, wg.vertex_count):
+        # 시작 정점과 다른 연결 요소의 정점(거리 None)은 고르지 않음
+        candidates: List[int] = [v for v in range(wg.vertex_count)
+                                 if v not in landmarks and nearest[v] is not None]
+        if not candidates:
+            break
+        landmark: int = max(candidates, key=lambda v: nearest[v])
+        distances: List[Optional[float]] = dijkstra(wg, wg.vertex_at(landmark))[0]
+        if landmarks:
+            nearest = [n if d is None or n <= d else d for n, d in zip(nearest, distances)]
+        else:
+            nearest = distances
+        landmarks.append(landmark)
+    return landmarks
+
+class LandmarkTable(Generic[V]):
+    """랜드마크마다 모든 정점까지의 최단 거리를 미리 구해 둔 표.
+    삼각 부등식에 의해 |d(L, t) - d(L, v)| <= d(v, t)이므로, 랜드마크들 중 최댓값은
+    좌표가 없는 그래프에서도 A*에 쓸 수 있는 허용 가능한(admissible) 휴리스틱이 된다."""
+
+    def __init__(self, wg: WeightedGraph[V], landmarks: List[int]) -> None:
+        if wg._directed:
+            raise ValueError("landmark heuristics need an undirected graph")
+        self._wg: WeightedGraph[V] = wg
+        self.landmarks: List[int] = landmarks
+        self._distances: List[List[Optional[float]]] = [dijkstra(wg, wg.vertex_at(l))[0] for l in landmarks]
+
+    @classmethod
+    def build(cls, wg: WeightedGraph[V], count: int = 4, seed: int = 0) -> LandmarkTable[V]:
+        return cls(wg, select_landmarks(wg, count, seed))
+
+    # 정점 인덱스 v에서 target까지 거리의 하한
+    def lower_bound(self, v: int, target: int) -> float:
+        bound: float = 0
+        for distances in self._distances:
+            dv: Optional[float] = distances[v]
+            dt: Optional[float] = distances[target]
+            if dv is not None and dt is not None and abs(dt - dv) > bound:
+                bound = abs(dt - dv)
+        return bound
+
+    # 다른 A* 구현에 넘길 수 있는 정점 -> 하한 함수
+    def heuristic_for(self, target: V) -> Callable[[V], float]:
+        last: int = self._wg.index_of(target)
+        return lambda vertex: self.lower_bound(self._wg.index_of(vertex), last)
+
+# 랜드마크 하한을 휴리스틱으로 쓰는 A*. dijkstra_to와 같이 (경로, 확정한 정점 수)를 반환
+def alt_search(wg: WeightedGraph[V], table: LandmarkTable[V],
+               root: V, target: V) -> Tuple[Optional[WeightedPath], int]:
+    first: int = wg.index_of(root)
+    last: int = wg.index_of(target)
+    distances: Dict[int, float] = {first: 0}
+    path_dict: Dict[int, WeightedEdge] = {}
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    pq.push(first, table.lower_bound(first, last))
+    settled: int = 0
+
+    while not pq.empty:
+        u, _ = pq.pop()
+        settled += 1
+        if u == last:
+            return path_dict_to_path(first, last, path_dict) if u != first else [], settled
+        dist_u: float = distances[u]
+        for we in wg.edges_for_index(u):
+            dist_v: Optional[float] = distances.get(we.v)
+            if dist_v is None or dist_v > we.weight + dist_u:
+                distances[we.v] = we.weight + dist_u
+                path_dict[we.v] = we
+                # 휴리스틱이 일관적(consistent)이므로 확정된 정점의 거리는 다시 줄지 않음
+                priority: float = we.weight + dist_u + table.lower_bound(we.v, last)
+                if we.v in pq:
+                    pq.decrease_key(we.v, priority)
+                else:
+                    pq.push(we.v, priority)
+    return None, settled
+
+# 무작위 질의마다 확정한 정점 수를 전체 dijkstra, dijkstra_to, ALT로 비교
+def compare_settled(wg: WeightedGraph[V], table: LandmarkTable[V],
+                    queries: int = 100, seed: int = 0) -> Tuple[int, int, int]:
+    rng: random.Random = random.Random(seed)
+    full = to = alt = 0
+    for _ in range(queries):
+        root: V = wg.vertex_at(rng.randrange(wg.vertex_count))
+        target: V = wg.vertex_at(rng.randrange(wg.vertex_count))
+        full += sum(1 for d in dijkstra(wg, root)[0] if d is not None)
+        to += dijkstra_to(wg, root, target)[1]
+        alt += alt_search(wg, table, root, target)[1]
+    return full, to, alt
+
+if __name__ == "__main__":
+    from random_graph import random_weighted_graph
+    from contraction_hierarchy import grid_road_graph
+    city_graph: WeightedGraph[str] = WeightedGraph(["Seattle", "San Francisco", "Los Angeles", "Riverside", "Phoenix", "Chicago", "Boston", "New York", "Atlanta", "Miami", "Dallas", "Houston", "Detroit", "Philadelphia", "Washington"])
+    for first, second, weight in (("Seattle", "Chicago", 1737), ("Seattle", "San Francisco", 678),
+                                  ("San Francisco", "Riverside", 386), ("San Francisco", "Los Angeles", 348),
+                                  ("Los Angeles", "Riverside", 50), ("Los Angeles", "Phoenix", 357),
+                                  ("Riverside", "Phoenix", 307), ("Riverside", "Chicago", 1704),
+                                  ("Phoenix", "Dallas", 887), ("Phoenix", "Houston", 1015),
+                                  ("Dallas", "Chicago", 805), ("Dallas", "Atlanta", 721),
+                                  ("Dallas", "Houston", 225), ("Houston", "Atlanta", 702),
+                                  ("Houston", "Miami", 968), ("Atlanta", "Chicago", 588),
+                                  ("Atlanta", "Washington", 543), ("Atlanta", "Miami", 604),
+                                  ("Miami", "Washington", 923), ("Chicago", "Detroit", 238),
+                                  ("Detroit", "Boston", 613), ("Detroit", "Washington", 396),
+                                  ("Detroit", "New York", 482), ("Boston", "New York", 190),
+                                  ("New York", "Philadelphia", 81), ("Philadelphia", "Washington", 123)):
+        city_graph.add_edge_by_vertices(first, second, weight)
+
+    path, settled = alt_search(city_graph, LandmarkTable.build(city_graph, 2), "Los Angeles", "Boston")
+    print(f"ALT Los Angeles -> Boston: 확정한 정점 {settled}개 "
+          f"(dijkstra_to: {dijkstra_to(city_graph, 'Los Angeles', 'Boston')[1]}개)")
+    print_weighted_path(city_graph, path)
+    print("")
+    for name, wg, count in (("도시 그래프", city_graph, 2),
+                            ("격자 100 x 100", grid_road_graph(100, 100), 8),
+                            ("무작위 20000 / 60000", random_weighted_graph(20000, 60000), 8)):
+        table: LandmarkTable = LandmarkTable.build(wg, count)
+        full, to, alt = compare_settled(wg, table, queries=30)
+        print(f"[{name}, 랜드마크 {count}개] 확정한 정점 수 합계 - dijkstra: {full}, dijkstra_to: {to}, ALT: {alt}")
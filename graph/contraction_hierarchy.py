@@ -0,0 +1,266 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Optional, Tuple, Dict, Sequence, Any
+from heapq import heappush, heappop
+import json
+import random
+import time
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from mst import WeightedPath, total_weight
+from priority_queue import IndexedPriorityQueue
+from dijkstra import dijkstra
+
+V = TypeVar('V') # 그래프 정점(vertex) 타입
+
+FORMAT_VERSION: int = 1
+NO_MIDDLE: int = -1 # 원래 그래프의 에지 (지름길이 아님)
+
+# 에지 사전의 키 (무향이므로 작은 인덱스가 앞)
+def _edge_key(u: int, v: int) -> Tuple[int, int]:
+    return (u, v) if u < v else (v, u)
+
+class ContractionHierarchy(Generic[V]):
+    """정적인 무향 WeightedGraph에 대한 축약 계층(contraction hierarchy).
+    정점을 중요도가 낮은 순서로 하나씩 축약하면서 최단 거리를 보존하는 지름길(shortcut) 에지를 더해 두면,
+    질의할 때는 양쪽 끝에서 순위가 높아지는 방향의 에지만 따라가는 작은 양방향 다익스트라로 답할 수 있다."""
+
+    def __init__(self, vertices: Sequence[V], rank: List[int],
+                 edges: Dict[Tuple[int, int], Tuple[float, int]]) -> None:
+        self._vertices: List[V] = list(vertices)
+        self._indices: Dict[V, int] = {vertex: i for i, vertex in enumerate(self._vertices)}
+        self.rank: List[int] = rank # 축약된 순서 (클수록 중요한 정점)
+        self._edges: Dict[Tuple[int, int], Tuple[float, int]] = edges # (u, v) -> (가중치, 지름길의 가운데 정점)
+        # 순위가 낮은 쪽에서 높은 쪽으로 가는 에지만 모은 상향 그래프 (정방향, 역방향 탐색 모두 사용)
+        self._up: List[List[Tuple[int, float]]] = [[] for _ in self._vertices]
+        for (u, v), (weight, _) in edges.items():
+            low, high = (u, v) if rank[u] < rank[v] else (v, u)
+            self._up[low].append((high, weight))
+
+    @classmethod
+    def build(cls, wg: WeightedGraph[V], witness_limit: int = 64) -> ContractionHierarchy[V]:
+        if wg._directed:
+            raise ValueError("contraction hierarchy needs an undirected graph")
+        n: int = wg.vertex_count
+        edges: Dict[Tuple[int, int], Tuple[float, int]] = {}
+        # 아직 축약하지 않은 정점들 사이의 인접 사전 (평행 에지는 가장 가벼운 것만)
+        adjacency: List[Dict[int, float]] = [{} for _ in range(n)]
+        for u in range(n):
+            for we in wg.edges_for_index(u):
+                if we.u == we.v:
+                    continue
+                key: Tuple[int, int] = _edge_key(we.u, we.v)
+                if key not in edges or we.weight < edges[key][0]:
+                    edges[key] = (we.weight, NO_MIDDLE)
+                    adjacency[we.u][we.v] = we.weight
+                    adjacency[we.v][we.u] = we.weight
+        contracted_neighbors: List[int] = [0] * n
+
+        # v를 축약할 때 필요한 지름길 (u, w, 가중치) 목록
+        def shortcuts_for(v: int) -> List[Tuple[int, int, float]]:
+            neighbors: List[Tuple[int, float]] = list(adjacency[v].items())
+            shortcuts: List[Tuple[int, int, float]] = []
+            for i, (u, weight_u) in enumerate(neighbors):
+                targets: Dict[int, float] = {w: weight_u + weight_w for w, weight_w in neighbors[i + 1:]}
+                if not targets:
+                    continue
+                witness: Dict[int, float] = _witness_search(adjacency, u, v, targets, witness_limit)
+                for w, through_v in targets.items():
+                    if witness.get(w, float("inf")) > through_v: # v를 거치지 않는 더 짧은 길이 없음
+                        shortcuts.append((u, w, through_v))
+            return shortcuts
+
+        # 중요도: 지름길 수 - 없어지는 에지 수 + 이미 축약된 이웃 수 (작을수록 먼저 축약)
+        # 계산에 쓴 지름길 목록도 함께 반환하여 바로 축약할 때 위트니스 탐색을 다시 하지 않게 함
+        def importance(v: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            shortcuts: List[Tuple[int, int, float]] = shortcuts_for(v)
+            return len(shortcuts) - len(adjacency[v]) + contracted_neighbors[v], shortcuts
+
+        pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+        for v in range(n):
+            pq.push(v, importance(v)[0])
+        rank: List[int] = [0] * n
+        next_rank: int = 0
+        while not pq.empty:
+            v, _ = pq.pop()
+            # 중요도는 이웃이 축약되면서 바뀌므로 꺼낼 때 다시 계산하고, 더 이상 최소가 아니면 다시 넣음 (lazy update)
+            current, shortcuts = importance(v)
+            if not pq.empty and current > pq.peek()[1]:
+                pq.push(v, current)
+                continue
+            for u, w, weight in shortcuts:
+                key = _edge_key(u, w)
+                if key not in edges or weight < edges[key][0]:
+                    edges[key] = (weight, v)
+                    adjacency[u][w] = weight
+                    adjacency[w][u] = weight
+            for u in adjacency[v]:
+                del adjacency[u][v]
+                contracted_neighbors[u] += 1
+            adjacency[v] = {}
+            rank[v] = next_rank
+            next_rank += 1
+        return cls(wg._vertices, rank, edges)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def shortcut_count(self) -> int:
+        return sum(1 for _, middle in self._edges.values() if middle != NO_MIDDLE)
+
+    def vertex_at(self, index: int) -> V:
+        return self._vertices[index]
+
+    def index_of(self, vertex: V) -> int:
+        return self._indices[vertex]
+
+    # 양쪽에서 상향 에지만 따라가는 다익스트라. (최단 거리, 만나는 정점, 정방향 부모, 역방향 부모)
+    def _search(self, first: int, last: int) -> Tuple[float, int, Dict[int, int], Dict[int, int]]:
+        distances: Tuple[Dict[int, float], Dict[int, float]] = ({first: 0}, {last: 0})
+        parents: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+        queues: Tuple[List[Tuple[float, int]], List[Tuple[float, int]]] = ([(0, first)], [(0, last)])
+        best: float = float("inf")
+        meeting: int = -1
+        up: List[List[Tuple[int, float]]] = self._up
+        while queues[0] or queues[1]:
+            for side in (0, 1):
+                queue: List[Tuple[float, int]] = queues[side]
+                if not queue:
+                    continue
+                dist_u, u = heappop(queue)
+                if dist_u >= best: # 이쪽은 더 볼 필요가 없음
+                    queue.clear()
+                    continue
+                if dist_u > distances[side][u]:
+                    continue # 오래된 항목
+                other: Dict[int, float] = distances[1 - side]
+                if u in other and dist_u + other[u] < best:
+                    best = dist_u + other[u]
+                    meeting = u
+                mine: Dict[int, float] = distances[side]
+                for v, weight in up[u]:
+                    if v not in mine or dist_u + weight < mine[v]:
+                        mine[v] = dist_u + weight
+                        parents[side][v] = u
+                        heappush(queue, (dist_u + weight, v))
+        return best, meeting, parents[0], parents[1]
+
+    # root에서 target까지의 최단 거리 (도달할 수 없으면 None)
+    def distance(self, root: V, target: V) -> Optional[float]:
+        best, _, _, _ = self._search(self.index_of(root), self.index_of(target))
+        return None if best == float("inf") else best
+
+    # 지름길을 원래 에지로 풀어 쓴 최단 경로 (도달할 수 없으면 None)
+    def path(self, root: V, target: V) -> Optional[WeightedPath]:
+        first: int = self.index_of(root)
+        last: int = self.index_of(target)
+        best, meeting, forward, backward = self._search(first, last)
+        if best == float("inf"):
+            return None
+        hops: List[int] = [meeting]
+        while hops[-1] != first:
+            hops.append(forward[hops[-1]])
+        hops.reverse()
+        while hops[-1] != last:
+            hops.append(backward[hops[-1]])
+        result: WeightedPath = []
+        for u, v in zip(hops, hops[1:]):
+            self._unpack(u, v, result)
+        return result
+
+    def _unpack(self, u: int, v: int, result: WeightedPath) -> None:
+        # 지름길 (u, v)는 (u, 가운데)와 (가운데, v)로 이루어짐. 깊은 재귀를 피하려고 스택을 씀
+        stack: List[Tuple[int, int]] = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            weight, middle = self._edges[_edge_key(a, b)]
+            if middle == NO_MIDDLE:
+                result.append(WeightedEdge(a, b, weight))
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def save(self, path: str) -> None:
+        data = {
+            "version": FORMAT_VERSION,
+            "vertices": self._vertices,
+            "rank": self.rank,
+            "edges": [[u, v, weight, middle] for (u, v), (weight, middle) in self._edges.items()],
+        }
+        with open(path, "w") as out:
+            json.dump(data, out)
+
+    @classmethod
+    def load(cls, path: str) -> ContractionHierarchy:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} contraction hierarchy")
+        edges: Dict[Tuple[int, int], Tuple[float, int]] = {(u, v): (weight, middle)
+                                                           for u, v, weight, middle in data["edges"]}
+        return cls([_from_json(vertex) for vertex in data["vertices"]], data["rank"], edges)
+
+# JSON은 튜플을 리스트로 저장함. 리스트는 정점(사전 키)이 될 수 없으므로 튜플로 되돌림 (격자 좌표 등)
+def _from_json(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_from_json(item) for item in value)
+    return value
+
+# u에서 v를 거치지 않고 targets까지 가는 거리. targets의 최댓값을 넘거나 limit개를 확정하면 멈춤
+def _witness_search(adjacency: List[Dict[int, float]], u: int, v: int,
+                    targets: Dict[int, float], limit: int) -> Dict[int, float]:
+    max_distance: float = max(targets.values())
+    distances: Dict[int, float] = {u: 0}
+    queue: List[Tuple[float, int]] = [(0, u)]
+    settled: int = 0
+    while queue and settled < limit:
+        dist_x, x = heappop(queue)
+        if dist_x > max_distance:
+            break
+        if dist_x > distances[x]:
+            continue
+        settled += 1
+        for y, weight in adjacency[x].items():
+            if y == v:
+                continue
+            if y not in distances or dist_x + weight < distances[y]:
+                distances[y] = dist_x + weight
+                heappush(queue, (dist_x + weight, y))
+    return distances
+
+# 도로망과 비슷한 rows x columns 격자 그래프 (이웃끼리 연결, 가중치는 무작위)
+def grid_road_graph(rows: int, columns: int, seed: int = 0) -> WeightedGraph[int]:
+    rng: random.Random = random.Random(seed)
+    wg: WeightedGraph[int] = WeightedGraph(list(range(rows * columns)))
+    for r in range(rows):
+        for c in range(columns):
+            if c + 1 < columns:
+                wg.add_edge_by_indices(r * columns + c, r * columns + c + 1, rng.randint(10, 100))
+            if r + 1 < rows:
+                wg.add_edge_by_indices(r * columns + c, (r + 1) * columns + c, rng.randint(10, 100))
+    return wg
+
+if __name__ == "__main__":
+    wg: WeightedGraph[int] = grid_road_graph(60, 60)
+    begin: float = time.perf_counter()
+    ch: ContractionHierarchy[int] = ContractionHierarchy.build(wg)
+    print(f"[격자 60 x 60] 전처리: {time.perf_counter() - begin:.2f} 초, 지름길 {ch.shortcut_count}개")
+
+    rng: random.Random = random.Random(1)
+    pairs: List[Tuple[int, int]] = [(rng.randrange(wg.vertex_count), rng.randrange(wg.vertex_count)) for _ in range(200)]
+    begin = time.perf_counter()
+    for root, target in pairs:
+        dijkstra(wg, root)
+    print(f"dijkstra:          질의당 {(time.perf_counter() - begin) / len(pairs) * 1e6:.0f} µs")
+    begin = time.perf_counter()
+    for root, target in pairs:
+        ch.distance(root, target)
+    print(f"축약 계층 distance: 질의당 {(time.perf_counter() - begin) / len(pairs) * 1e6:.0f} µs")
+    begin = time.perf_counter()
+    for root, target in pairs:
+        ch.path(root, target)
+    print(f"축약 계층 path:     질의당 {(time.perf_counter() - begin) / len(pairs) * 1e6:.0f} µs")
+    root, target = pairs[0]
+    print(f"{root} -> {target}: {ch.distance(root, target)} (dijkstra: {dijkstra(wg, root)[0][target]}),"
+          f" 경로 가중치 {total_weight(ch.path(root, target))}")
@@ -0,0 +1,261 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, List, Optional, Tuple, Dict, Iterable, Sequence
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+import sys
+import time
+from graph import Graph
+from weighted_graph import WeightedGraph
+from weighted_directed_graph import WeightedDirectedGraph
+from weighted_edge import WeightedEdge
+from mst import WeightedPath, total_weight, mst
+from dijkstra import dijkstra
+
+try:
+    import numpy as np
+except ImportError: # numpy가 없으면 as_numpy()만 쓸 수 없음
+    np = None
+
+V = TypeVar('V') # 그래프 정점(vertex) 타입
+
+class CSRGraph(Generic[V]):
+    """만든 뒤에는 바꿀 수 없는 압축 희소 행(CSR) 그래프.
+    정점 i의 에지는 targets[offsets[i]:offsets[i + 1]]에 (가중치는 weights의 같은 구간에) 있으므로,
+    에지마다 객체를 두지 않고 연속된 배열 세 개만으로 그래프를 표현한다."""
+
+    def __init__(self, vertices: Sequence[V], offsets: array, targets: array,
+                 weights: Optional[array] = None) -> None:
+        if len(offsets) != len(vertices) + 1 or offsets[-1] != len(targets):
+            raise ValueError("offsets do not match vertices and targets")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("weights must have one entry per target")
+        self._vertices: List[V] = list(vertices)
+        self._indices: Dict[V, int] = {}
+        for i, vertex in enumerate(self._vertices): # Graph와 같이 중복된 정점은 처음 인덱스
+            self._indices.setdefault(vertex, i)
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: Optional[array] = weights
+
+    # 기존 Graph/WeightedGraph의 인접 리스트를 같은 순서 그대로 배열에 옮김
+    @classmethod
+    def from_graph(cls, g: Graph[V]) -> CSRGraph[V]:
+        offsets: array = array('q', [0])
+        targets: array = array('i')
+        # WeightedDirectedGraph는 WeightedGraph의 서브클래스가 아니므로 두 타입을 모두 보고,
+        # 그 밖의 Graph도 에지가 WeightedEdge면 가중치 그래프로 봄
+        weighted: bool = isinstance(g, (WeightedGraph, WeightedDirectedGraph)) or any(
+            isinstance(edge, WeightedEdge) for i in range(g.vertex_count) for edge in g.edges_for_index(i))
+        weights: Optional[array] = array('d') if weighted else None
+        for i in range(g.vertex_count):
+            edges = g.edges_for_index(i)
+            targets.extend(e.v for e in edges)
+            if weights is not None:
+                weights.extend(e.weight for e in edges)
+            offsets.append(len(targets))
+        return cls(g._vertices, offsets, targets, weights)
+
+    # (u, v, 가중치) 목록에서 Edge 객체 없이 바로 만듦. 무향이면 양방향으로 넣음
+    @classmethod
+    def from_edges(cls, vertices: Sequence[V], edges: Iterable[Tuple[int, int, float]],
+                   directed: bool = False) -> CSRGraph[V]:
+        sources: array = array('i')
+        destinations: array = array('i')
+        costs: array = array('d')
+        for u, v, weight in edges:
+            sources.append(u)
+            destinations.append(v)
+            costs.append(weight)
+            if not directed:
+                sources.append(v)
+                destinations.append(u)
+                costs.append(weight)
+        # 계수 정렬: 정점마다 에지 수를 세어 시작 위치를 정한 뒤 제자리에 채움
+        counts: List[int] = [0] * (len(vertices) + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for i in range(len(vertices)):
+            counts[i + 1] += counts[i]
+        offsets: array = array('q', counts)
+        cursor: List[int] = counts[:-1]
+        targets: array = array('i', bytes(4 * len(sources)))
+        weights: array = array('d', bytes(8 * len(sources)))
+        for u, v, weight in zip(sources, destinations, costs):
+            targets[cursor[u]] = v
+            weights[cursor[u]] = weight
+            cursor[u] += 1
+        return cls(vertices, offsets, targets, weights)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    @property
+    def weighted(self) -> bool:
+        return self.weights is not None
+
+    def vertex_at(self, index: int) -> V:
+        return self._vertices[index]
+
+    def index_of(self, vertex: V) -> int:
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise ValueError(f"{vertex!r} is not in graph") from None
+
+    def neighbors_for_index(self, index: int) -> array:
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def weights_for_index(self, index: int) -> array:
+        if self.weights is None:
+            raise ValueError("graph is not weighted")
+        return self.weights[self.offsets[index]:self.offsets[index + 1]]
+
+    # 배열 버퍼를 복사하지 않고 numpy 배열로 봄
+    def as_numpy(self) -> Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]:
+        if np is None:
+            raise ImportError("numpy is required for CSRGraph.as_numpy")
+        weights = None if self.weights is None else np.frombuffer(self.weights, dtype=np.float64)
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int32), weights)
+
+    # 세 배열이 차지하는 바이트 수
+    def nbytes(self) -> int:
+        total: int = sys.getsizeof(self.offsets) + sys.getsizeof(self.targets)
+        if self.weights is not None:
+            total += sys.getsizeof(self.weights)
+        return total
+
+    def __str__(self) -> str:
+        desc: str = ""
+        for i in range(self.vertex_count):
+            desc += f"{self.vertex_at(i)} -> {[self.vertex_at(v) for v in self.neighbors_for_index(i)]}\n"
+        return desc
+
+# start에서 각 정점까지의 에지 수 (도달할 수 없으면 -1)와 BFS 트리의 부모 (-1이면 없음)
+def csr_bfs(csr: CSRGraph[V], start: int) -> Tuple[array, array]:
+    n: int = csr.vertex_count
+    hops: array = array('i', [-1]) * n
+    parents: array = array('i', [-1]) * n
+    offsets, targets = csr.offsets, csr.targets
+    hops[start] = 0
+    frontier: deque = deque([start])
+    while frontier:
+        u: int = frontier.popleft()
+        next_hops: int = hops[u] + 1
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if hops[v] < 0:
+                hops[v] = next_hops
+                parents[v] = u
+                frontier.append(v)
+    return hops, parents
+
+# 부모 배열을 따라 start에서 end까지의 정점 인덱스 목록 (도달할 수 없으면 None)
+def csr_path(parents: array, start: int, end: int) -> Optional[List[int]]:
+    if start != end and parents[end] < 0:
+        return None
+    path: List[int] = [end]
+    while path[-1] != start:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+# dijkstra()와 같은 최단 거리 (도달할 수 없으면 None)와 최단 경로 트리의 부모 (-1이면 없음)
+# (거리, 정점) 튜플을 heapq에 넣고, 이미 확정된 정점의 오래된 항목은 꺼낼 때 건너뜀
+def csr_dijkstra(csr: CSRGraph[V], root: int) -> Tuple[List[Optional[float]], array]:
+    if csr.weights is None:
+        raise ValueError("dijkstra needs a weighted graph")
+    n: int = csr.vertex_count
+    distances: List[Optional[float]] = [None] * n
+    parents: array = array('i', [-1]) * n
+    settled: bytearray = bytearray(n)
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    distances[root] = 0
+    pq: List[Tuple[float, int]] = [(0, root)]
+    while pq:
+        dist_u, u = heappop(pq)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        begin, end = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[begin:end], weights[begin:end]):
+            dist_v: Optional[float] = distances[v]
+            if dist_v is None or dist_v > dist_u + weight:
+                distances[v] = dist_u + weight
+                parents[v] = u
+                heappush(pq, (dist_u + weight, v))
+    return distances, parents
+
+# 부모 배열로 찾은 경로를 WeightedEdge 목록으로 바꿔 print_weighted_path, total_weight에 쓸 수 있게 함
+def csr_weighted_path(csr: CSRGraph[V], parents: array, start: int, end: int) -> WeightedPath:
+    path: Optional[List[int]] = csr_path(parents, start, end)
+    if path is None:
+        return []
+    return [WeightedEdge(u, v, _edge_weight(csr, u, v)) for u, v in zip(path, path[1:])]
+
+# u -> v 에지 중 가장 가벼운 가중치
+def _edge_weight(csr: CSRGraph[V], u: int, v: int) -> float:
+    begin, end = csr.offsets[u], csr.offsets[u + 1]
+    return min(w for t, w in zip(csr.targets[begin:end], csr.weights[begin:end]) if t == v)
+
+# mst()와 같은 프림 알고리즘. 우선순위 큐에 (가중치, u, v) 튜플만 넣음
+def csr_mst(csr: CSRGraph[V], start: int = 0) -> Optional[WeightedPath]:
+    if start > (csr.vertex_count - 1) or start < 0:
+        return None
+    if csr.weights is None:
+        raise ValueError("mst needs a weighted graph")
+    result: WeightedPath = []
+    visited: bytearray = bytearray(csr.vertex_count)
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    pq: List[Tuple[float, int, int]] = []
+
+    def visit(u: int) -> None:
+        visited[u] = 1
+        begin, end = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[begin:end], weights[begin:end]):
+            if not visited[v]:
+                heappush(pq, (weight, u, v))
+
+    visit(start)
+    while pq:
+        weight, u, v = heappop(pq)
+        if visited[v]:
+            continue
+        result.append(WeightedEdge(u, v, weight))
+        visit(v)
+    return result
+
+if __name__ == "__main__":
+    import tracemalloc
+    from random_graph import random_weighted_graph
+    vertex_count, edge_count = 100_000, 400_000
+    tracemalloc.start()
+    wg: WeightedGraph[int] = random_weighted_graph(vertex_count, edge_count, seed=0)
+    graph_bytes: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    csr: CSRGraph[int] = CSRGraph.from_graph(wg)
+    print(f"[정점 {vertex_count}개, 에지 {wg.edge_count // 2}개]")
+    print(f"WeightedGraph: {graph_bytes / 1024 / 1024:.1f} MiB, CSRGraph: {csr.nbytes() / 1024 / 1024:.1f} MiB")
+
+    begin: float = time.perf_counter()
+    distances, _ = dijkstra(wg, 0)
+    print(f"dijkstra:      {time.perf_counter() - begin:.3f} 초")
+    begin = time.perf_counter()
+    csr_distances, _ = csr_dijkstra(csr, 0)
+    print(f"csr_dijkstra:  {time.perf_counter() - begin:.3f} 초 (같은 결과: {distances == csr_distances})")
+
+    begin = time.perf_counter()
+    tree: Optional[WeightedPath] = mst(wg)
+    print(f"mst:           {time.perf_counter() - begin:.3f} 초")
+    begin = time.perf_counter()
+    csr_tree: Optional[WeightedPath] = csr_mst(csr)
+    print(f"csr_mst:       {time.perf_counter() - begin:.3f} 초 (같은 총 가중치: {total_weight(tree) == total_weight(csr_tree)})")
+
+    begin = time.perf_counter()
+    csr_bfs(csr, 0)
+    print(f"csr_bfs:       {time.perf_counter() - begin:.3f} 초")
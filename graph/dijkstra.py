@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TypeVar, List, Optional, Tuple, Dict
+from typing import TypeVar, Generic, List, Optional, Tuple, Dict
+from collections import OrderedDict
 from dataclasses import dataclass
 from mst import WeightedPath, print_weighted_path
 from weighted_graph import WeightedGraph
 from weighted_edge import WeightedEdge
-from priority_queue import PriorityQueue
+from priority_queue import IndexedPriorityQueue
 
 V = TypeVar('V')
 
@@ -25,12 +26,12 @@ def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict
     distances: List[Optional[float]] = [None] * wg.vertex_count
     distances[first] = 0 # 루트(root)에서 루트 자신의 거리는 0임
     path_dict: Dict[int, WeightedEdge] = {} # 정점에 대한 경로
-    pq: PriorityQueue[DijkstraNode] = PriorityQueue()
-    pq.push(DijkstraNode(first, 0))
+    # 정점마다 항목을 하나만 두고 거리가 줄면 decrease_key로 갱신
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    pq.push(first, 0)
 
     while not pq.empty:
-        u: int = pq.pop().vertex # 다음 가까운 정점을 탐색
-        dist_u: float = distances[u] # 이 정점에 대한 거리를 이미 알고 있음
+        u, dist_u = pq.pop() # 다음 가까운 정점을 탐색 (이 정점에 대한 거리는 이미 확정됨)
         # 이 정점에서 모든 에지 및 정점을 살펴봄
         for we in wg.edges_for_index(u):
             # 이 정점에 대한 이전 거리
@@ -41,8 +42,11 @@ def dijkstra(wg: WeightedGraph[V], root: V) -> Tuple[List[Optional[float]], Dict
                 distances[we.v] = we.weight + dist_u
                 # 정점의 최단 경로 에지를 갱신
                 path_dict[we.v] = we
-                # 해당 정점을 나중에 곧 탐색
-                pq.push(DijkstraNode(we.v, we.weight + dist_u))
+                # 해당 정점을 나중에 곧 탐색 (이미 큐에 있다면 우선순위만 낮춤)
+                if we.v in pq:
+                    pq.decrease_key(we.v, we.weight + dist_u)
+                else:
+                    pq.push(we.v, we.weight + dist_u)
     return distances, path_dict
 
 # 다익스트라 알고리즘 결과를 더 쉽게 접근하게 하는 헬퍼 함수
@@ -65,6 +69,129 @@ def path_dict_to_path(start: int, end: int, path_dict: Dict[int, WeightedEdge])
         edge_path.append(e)
     return list(reversed(edge_path))
 
+# root에서 target까지의 최단 경로만 필요할 때: target이 확정되면 바로 멈춤
+# (경로, 확정한 정점 수). root == target이면 빈 경로, 도달할 수 없으면 None
+def dijkstra_to(wg: WeightedGraph[V], root: V, target: V) -> Tuple[Optional[WeightedPath], int]:
+    first: int = wg.index_of(root)
+    last: int = wg.index_of(target)
+    distances: Dict[int, float] = {first: 0}
+    path_dict: Dict[int, WeightedEdge] = {}
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    pq.push(first, 0)
+    settled: int = 0
+
+    while not pq.empty:
+        u, dist_u = pq.pop()
+        settled += 1
+        if u == last:
+            return path_dict_to_path(first, last, path_dict) if u != first else [], settled
+        for we in wg.edges_for_index(u):
+            dist_v: Optional[float] = distances.get(we.v)
+            if dist_v is None or dist_v > we.weight + dist_u:
+                distances[we.v] = we.weight + dist_u
+                path_dict[we.v] = we
+                if we.v in pq:
+                    pq.decrease_key(we.v, we.weight + dist_u)
+                else:
+                    pq.push(we.v, we.weight + dist_u)
+    return None, settled
+
+# 양쪽 끝에서 동시에 다익스트라를 진행하는 양방향 탐색 (무향 WeightedGraph 전용)
+# 두 큐의 최솟값 합이 지금까지 찾은 최단 거리 이상이 되면 멈춤. (경로, 두 방향에서 확정한 정점 수)
+def bidirectional_dijkstra(wg: WeightedGraph[V], root: V, target: V) -> Tuple[Optional[WeightedPath], int]:
+    if wg._directed:
+        raise ValueError("bidirectional_dijkstra needs an undirected graph")
+    first: int = wg.index_of(root)
+    last: int = wg.index_of(target)
+    if first == last:
+        return [], 1
+    # [0]은 root에서 정방향, [1]은 target에서 역방향
+    distances: Tuple[Dict[int, float], Dict[int, float]] = ({first: 0}, {last: 0})
+    path_dicts: Tuple[Dict[int, WeightedEdge], Dict[int, WeightedEdge]] = ({}, {})
+    settled_sets: Tuple[set, set] = (set(), set())
+    queues: Tuple[IndexedPriorityQueue[int], IndexedPriorityQueue[int]] = (IndexedPriorityQueue(), IndexedPriorityQueue())
+    queues[0].push(first, 0)
+    queues[1].push(last, 0)
+    best: float = float("inf")
+    meeting: Optional[int] = None
+
+    while not queues[0].empty and not queues[1].empty:
+        if queues[0].peek()[1] + queues[1].peek()[1] >= best:
+            break
+        side: int = 0 if queues[0].peek()[1] <= queues[1].peek()[1] else 1 # 더 가까운 쪽을 한 걸음 진행
+        other: int = 1 - side
+        u, dist_u = queues[side].pop()
+        settled_sets[side].add(u)
+        for we in wg.edges_for_index(u):
+            if we.v in settled_sets[side]:
+                continue
+            dist_v: Optional[float] = distances[side].get(we.v)
+            if dist_v is None or dist_v > we.weight + dist_u:
+                distances[side][we.v] = we.weight + dist_u
+                path_dicts[side][we.v] = we
+                if we.v in queues[side]:
+                    queues[side].decrease_key(we.v, we.weight + dist_u)
+                else:
+                    queues[side].push(we.v, we.weight + dist_u)
+            # 반대쪽에서 이미 닿은 정점이면 두 탐색을 잇는 경로 후보
+            if we.v in distances[other] and distances[side][we.v] + distances[other][we.v] < best:
+                best = distances[side][we.v] + distances[other][we.v]
+                meeting = we.v
+
+    settled: int = len(settled_sets[0]) + len(settled_sets[1])
+    if meeting is None:
+        return None, settled
+    path: WeightedPath = path_dict_to_path(first, meeting, path_dicts[0]) if meeting != first else []
+    # 역방향 트리의 에지는 target 쪽에서 나가는 방향이므로 뒤집어서 이어 붙임
+    v: int = meeting
+    while v != last:
+        e: WeightedEdge = path_dicts[1][v]
+        path.append(e.reversed())
+        v = e.u
+    return path, settled
+
+class DijkstraCache(Generic[V]):
+    """최근에 계산한 루트 정점별 다익스트라 결과(distances, path_dict)를 maxsize개까지 보관하는 LRU 캐시.
+    같은 출발지에서 반복되는 질의는 다시 계산하지 않는다. 그래프를 고치면 clear()를 호출해야 한다."""
+
+    def __init__(self, wg: WeightedGraph[V], maxsize: int = 16) -> None:
+        self._wg: WeightedGraph[V] = wg
+        self._maxsize: int = maxsize
+        self._trees: OrderedDict = OrderedDict() # 루트 정점 -> (distances, path_dict)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def tree(self, root: V) -> Tuple[List[Optional[float]], Dict[int, WeightedEdge]]:
+        if root in self._trees:
+            self.hits += 1
+            self._trees.move_to_end(root)
+            return self._trees[root]
+        self.misses += 1
+        result = dijkstra(self._wg, root)
+        self._trees[root] = result
+        if len(self._trees) > self._maxsize:
+            self._trees.popitem(last=False) # 가장 오래 쓰지 않은 루트를 버림
+        return result
+
+    def distance(self, root: V, target: V) -> Optional[float]:
+        distances, _ = self.tree(root)
+        return distances[self._wg.index_of(target)]
+
+    # root에서 target까지의 경로 (도달할 수 없으면 None)
+    def path(self, root: V, target: V) -> Optional[WeightedPath]:
+        distances, path_dict = self.tree(root)
+        first: int = self._wg.index_of(root)
+        last: int = self._wg.index_of(target)
+        if distances[last] is None:
+            return None
+        return path_dict_to_path(first, last, path_dict) if first != last else []
+
+    def clear(self) -> None:
+        self._trees.clear()
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
 if __name__ == "__main__":
     city_graph2: WeightedGraph[str] = WeightedGraph(["Seattle", "San Francisco", "Los Angeles", "Riverside", "Phoenix", "Chicago", "Boston", "New York", "Atlanta", "Miami", "Dallas", "Houston", "Detroit", "Philadelphia", "Washington"])
 
@@ -104,4 +231,11 @@ if __name__ == "__main__":
 
     print("Shortest path from Los Angeles to Boston:")
     path: WeightedPath = path_dict_to_path(city_graph2.index_of("Los Angeles"), city_graph2.index_of("Boston"), path_dict)
-    print_weighted_path(city_graph2, path)
\ No newline at end of file
+    print_weighted_path(city_graph2, path)
+
+    print("")
+    path, settled = dijkstra_to(city_graph2, "Los Angeles", "Boston")
+    print(f"dijkstra_to: 확정한 정점 {settled}개 / {city_graph2.vertex_count}개")
+    path, settled = bidirectional_dijkstra(city_graph2, "Los Angeles", "Boston")
+    print(f"bidirectional_dijkstra: 확정한 정점 {settled}개")
+    print_weighted_path(city_graph2, path)
@@ -5,12 +5,10 @@ from graph import Graph
 V = TypeVar("V")
 
 class DirectedGraph(Generic[V], Graph[V]):
+    _directed: bool = True
+
     def __init__(self, vertices: List[V] = None) -> None:
-        if vertices is None:
-            vertices = []
-        # Graph 초기화
-        self._vertices: List[V] = vertices
-        self._edges: List[List[Edge]] = [[] for _ in vertices]
+        super().__init__(vertices)
 
     # 무향 그래프와 다르게 reversed()를 추가하지 않는다!
     def add_edge(self, edge: Edge) -> None:
@@ -21,6 +19,6 @@ class DirectedGraph(Generic[V], Graph[V]):
         self.add_edge(edge)
 
     def add_edge_by_vertices(self, first: V, second: V) -> None:
-        u = self._vertices.index(first)
-        v = self._vertices.index(second)
+        u = self.index_of(first)
+        v = self.index_of(second)
         self.add_edge_by_indices(u, v)
@@ -1,9 +1,11 @@
-from typing import TypeVar, Generic, List, Optional
+from typing import TypeVar, Generic, List, Optional, Dict, Set
+from dataclasses import replace
 from edge import Edge
 
 V = TypeVar('V') # 그래프 정점(vertice) 타입
 
 class Graph(Generic[V]):
+    _directed: bool = False # 유향 그래프 서브클래스는 True
     # def __init__(self, vertices: List[V] = []) -> None:
     #     self._vertices: List[V] = vertices
     #     self._edges: List[List[Edge]] = [[] for _ in vertices]
@@ -13,6 +15,22 @@ class Graph(Generic[V]):
             vertices = []
         self._vertices: List[V] = vertices
         self._edges: List[List[Edge]] = [[] for _ in vertices]
+        self._removed: Set[int] = set() # remove_vertex로 제거 표시된 정점 인덱스
+        self._reindex()
+
+    # 정점 -> 인덱스 사전을 다시 만듦. 같은 정점이 여러 번 있으면 list.index처럼 처음 인덱스
+    # 여러 번 있는 정점만 _duplicates에 살아 있는 인덱스를 모두 (오름차순으로) 기록해 둠
+    def _reindex(self) -> None:
+        self._indices: Dict[V, int] = {}
+        self._duplicates: Dict[V, List[int]] = {}
+        for index, vertex in enumerate(self._vertices):
+            if index not in self._removed:
+                self._add_index(vertex, index)
+
+    def _add_index(self, vertex: V, index: int) -> None:
+        first: int = self._indices.setdefault(vertex, index)
+        if first != index:
+            self._duplicates.setdefault(vertex, [first]).append(index)
 
     @property
     def vertex_count(self) -> int:
@@ -26,6 +44,7 @@ class Graph(Generic[V]):
     def add_vertex(self, vertex: V) -> int:
         self._vertices.append(vertex)
         self._edges.append([]) # 에지에 빈 리스트를 추가
+        self._add_index(vertex, self.vertex_count - 1)
         return self.vertex_count - 1 # 추가된 정점의 인덱스를 반환
 
     # 무향(undirected) 그래프이므로 항상 양방향으로 에지 추가
@@ -40,17 +59,20 @@ class Graph(Generic[V]):
 
     # 정점 인덱스를 참조하여 에지를 추가(헬퍼 메서드)
     def add_edge_by_vertices(self, first: V, second: V) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self.index_of(first)
+        v: int = self.index_of(second)
         self.add_edge_by_indices(u, v)
 
     # 특정 인덱스에서 정점을 찾음
     def vertex_at(self, index: int) -> V:
         return self._vertices[index]
 
-    # 정점 인덱스를 찾음
+    # 정점 인덱스를 찾음 (사전 조회이므로 O(1), 없으면 list.index처럼 ValueError)
     def index_of(self, vertex: V) -> int:
-        return self._vertices.index(vertex)
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise ValueError(f"{vertex!r} is not in graph") from None
 
     # 정점 인덱스에 연결된 이웃 정점을 찾음
     def neighbors_for_index(self, index: int) -> List[V]:
@@ -72,52 +94,85 @@ class Graph(Generic[V]):
     def __str__(self) -> str:
         desc: str = ""
         for i in range(self.vertex_count):
-            desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index(i)}\n"
+            if i not in self._removed:
+                desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index(i)}\n"
         return desc
 
-    def remove_vertex(self, index: int) -> None:
-        """index 위치의 정점을 제거하고,
-        그 정점과 연결된 에지 및 인덱스도 모두 정리한다."""
-        if index < 0 or index >= self.vertex_count:
-            raise IndexError("vertex index out of range")
-
-        # 1) 정점 제거
-        self._vertices.pop(index)
-
-        # 2) 해당 정점의 에지 리스트 제거
-        self._edges.pop(index)
-
-        # 3) 나머지 에지 리스트에서:
-        #    - 삭제된 정점과 연결된 에지 제거
-        #    - index보다 큰 정점을 가리키는 u, v 인덱스는 1씩 감소 조정
-        for u_idx in range(len(self._edges)):
-            new_adj: List[Edge] = []
-            for e in self._edges[u_idx]:
-                # 삭제된 정점(index)와 연결된 에지는 버림
-                if e.u == index or e.v == index:
-                    continue
+    # 제거된 정점인지 확인 (제거된 자리는 compact() 전까지 인덱스만 차지함)
+    def is_removed(self, index: int) -> bool:
+        return index in self._removed
 
-                new_u = e.u
-                new_v = e.v
-
-                # 정점 인덱스가 하나씩 당겨졌으므로,
-                # 삭제된 index보다 큰 인덱스는 -1 해줘야 함
-                if new_u > index:
-                    new_u -= 1
-                if new_v > index:
-                    new_v -= 1
+    @property
+    def removed_count(self) -> int:
+        return len(self._removed)
 
-                # u는 항상 현재 리스트의 인덱스를 가리켜야 하므로 보정
-                # (지금 순회 중인 u_idx 자체도 index보다 크면 이미 -1 당겨진 상태)
-                new_adj.append(Edge(new_u, new_v))
+    def remove_vertex(self, index: int) -> None:
+        """index 위치의 정점을 제거하고 그 정점과 연결된 에지를 정리한다.
+        정점 자리는 표시만 해 두므로(tombstone) 다른 정점의 인덱스는 바뀌지 않고,
+        이웃의 에지 리스트만 고치므로 전체 그래프를 다시 만들지 않는다.
+        자리를 실제로 비우려면 compact()를 호출한다."""
+        if index < 0 or index >= self.vertex_count or index in self._removed:
+            raise IndexError("vertex index out of range")
 
-            self._edges[u_idx] = new_adj
+        # 1) 이 정점을 가리키는 에지 제거
+        if self._directed: # 유향 그래프는 들어오는 에지를 모르므로 모든 리스트를 확인
+            for u in range(self.vertex_count):
+                self._remove_edges_to(u, index)
+        else: # 무향 그래프는 이웃의 리스트에만 되돌아오는 에지가 있음
+            for v in {e.v for e in self._edges[index]}:
+                self._remove_edges_to(v, index)
+
+        # 2) 해당 정점의 에지 리스트를 비우고 제거 표시
+        self._edges[index] = []
+        self._removed.add(index)
+        vertex: V = self._vertices[index]
+        copies: Optional[List[int]] = self._duplicates.get(vertex)
+        if copies is None: # 한 번만 있는 정점
+            del self._indices[vertex]
+        else: # 같은 정점이 남아 있으면 사전이 그중 처음 인덱스를 가리키게 함
+            copies.remove(index)
+            self._indices[vertex] = copies[0]
+            if len(copies) == 1:
+                del self._duplicates[vertex]
+
+    # 제거 표시된 정점 자리를 없애고 인덱스를 앞으로 당김
+    # 반환값은 예전 인덱스 -> 새 인덱스 (제거된 정점은 -1)
+    def compact(self) -> List[int]:
+        mapping: List[int] = []
+        next_index: int = 0
+        for index in range(self.vertex_count):
+            if index in self._removed:
+                mapping.append(-1)
+            else:
+                mapping.append(next_index)
+                next_index += 1
+        if not self._removed:
+            return mapping
+        kept: List[int] = [index for index in range(self.vertex_count) if index not in self._removed]
+        self._vertices[:] = [self._vertices[index] for index in kept]
+        # replace로 u, v만 바꾸므로 WeightedEdge의 가중치도 그대로 유지됨
+        self._edges = [[replace(e, u=mapping[e.u], v=mapping[e.v]) for e in self._edges[index]]
+                       for index in kept]
+        self._removed = set()
+        self._reindex()
+        return mapping
+
+    # u의 에지 리스트에서 v로 가는 에지를 모두 제거 (마지막 에지와 바꿔 pop하므로 순서는 바뀜)
+    def _remove_edges_to(self, u: int, v: int) -> None:
+        edges: List[Edge] = self._edges[u]
+        i: int = 0
+        while i < len(edges):
+            if edges[i].v == v:
+                edges[i] = edges[-1]
+                edges.pop()
+            else:
+                i += 1
 
     def remove_edge_by_indices(self, u: int, v: int) -> None:
         # u -> v 방향 에지 제거
-        self._edges[u] = [e for e in self._edges[u] if e.v != v]
+        self._remove_edges_to(u, v)
         # 무향 그래프이므로 v -> u 도 제거
-        self._edges[v] = [e for e in self._edges[v] if e.v != u]
+        self._remove_edges_to(v, u)
 
     def remove_edge_by_vertices(self, first: V, second: V) -> None:
         u = self.index_of(first)
@@ -0,0 +1,65 @@
+from typing import List, Optional, Tuple
+import time
+from weighted_graph import WeightedGraph
+from priority_queue import PriorityQueue, IndexedPriorityQueue
+from dijkstra import DijkstraNode
+from random_graph import random_weighted_graph
+
+# 기존 방식: 거리가 줄 때마다 항목을 새로 push하고 오래된 항목도 그대로 pop
+def lazy_dijkstra_stats(wg: WeightedGraph[int], first: int) -> Tuple[List[Optional[float]], int, int]:
+    distances: List[Optional[float]] = [None] * wg.vertex_count
+    distances[first] = 0
+    pq: PriorityQueue[DijkstraNode] = PriorityQueue()
+    pq.push(DijkstraNode(first, 0))
+    pops: int = 0
+    peak: int = 1 # 힙의 최대 크기
+    while not pq.empty:
+        u: int = pq.pop().vertex
+        pops += 1
+        dist_u: float = distances[u]
+        for we in wg.edges_for_index(u):
+            dist_v: Optional[float] = distances[we.v]
+            if dist_v is None or dist_v > we.weight + dist_u:
+                distances[we.v] = we.weight + dist_u
+                pq.push(DijkstraNode(we.v, we.weight + dist_u))
+                peak = max(peak, len(pq._container))
+    return distances, pops, peak
+
+# 인덱스 힙 방식: 정점마다 항목 하나, decrease_key로 갱신
+def indexed_dijkstra_stats(wg: WeightedGraph[int], first: int) -> Tuple[List[Optional[float]], int, int]:
+    distances: List[Optional[float]] = [None] * wg.vertex_count
+    distances[first] = 0
+    pq: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    pq.push(first, 0)
+    pops: int = 0
+    peak: int = 1
+    while not pq.empty:
+        u, dist_u = pq.pop()
+        pops += 1
+        for we in wg.edges_for_index(u):
+            dist_v: Optional[float] = distances[we.v]
+            if dist_v is None or dist_v > we.weight + dist_u:
+                distances[we.v] = we.weight + dist_u
+                if we.v in pq:
+                    pq.decrease_key(we.v, we.weight + dist_u)
+                else:
+                    pq.push(we.v, we.weight + dist_u)
+                    peak = max(peak, len(pq))
+    return distances, pops, peak
+
+def run_heap_benchmark(vertex_count: int, edge_count: int, seed: int = 0) -> None:
+    wg: WeightedGraph[int] = random_weighted_graph(vertex_count, edge_count, seed)
+    print(f"\n[정점 {vertex_count}개, 에지 {wg.edge_count // 2}개]")
+    results = []
+    for name, func in (("PriorityQueue (lazy)", lazy_dijkstra_stats),
+                       ("IndexedPriorityQueue", indexed_dijkstra_stats)):
+        start = time.perf_counter()
+        distances, pops, peak = func(wg, 0)
+        elapsed = time.perf_counter() - start
+        results.append(distances)
+        print(f"{name:22} pop 횟수: {pops:>9}  최대 힙 크기: {peak:>9}  시간: {elapsed * 1000:.1f} ms")
+    assert results[0] == results[1] # 두 방식의 최단 거리는 같아야 함
+
+if __name__ == "__main__":
+    run_heap_benchmark(10_000, 50_000)
+    run_heap_benchmark(100_000, 500_000)
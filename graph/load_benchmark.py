@@ -0,0 +1,70 @@
+from typing import List, Tuple, TypeVar
+import random
+import time
+from weighted_graph import WeightedGraph
+
+V = TypeVar('V')
+
+# 비교용: 정점 -> 인덱스 사전 없이 예전처럼 리스트를 처음부터 훑어 인덱스를 찾는 그래프
+class ListIndexWeightedGraph(WeightedGraph[V]):
+    def index_of(self, vertex: V) -> int:
+        return self._vertices.index(vertex)
+
+# 이름이 붙은 정점 vertex_count개와 무작위 에지 edge_count개 (정점 이름으로 에지를 추가함)
+def random_named_edges(vertex_count: int, edge_count: int, seed: int = 0) -> Tuple[List[str], List[Tuple[str, str, int]]]:
+    rng: random.Random = random.Random(seed)
+    names: List[str] = [f"v{i}" for i in range(vertex_count)]
+    edges: List[Tuple[str, str, int]] = [(rng.choice(names), rng.choice(names), rng.randint(1, 1000))
+                                         for _ in range(edge_count)]
+    return names, edges
+
+def bulk_load(graph_class: type, names: List[str], edges: List[Tuple[str, str, int]]) -> float:
+    begin: float = time.perf_counter()
+    wg: WeightedGraph[str] = graph_class([])
+    for name in names:
+        wg.add_vertex(name)
+    for first, second, weight in edges:
+        wg.add_edge_by_vertices(first, second, weight)
+    return time.perf_counter() - begin
+
+def run_load_benchmark(sizes: List[int]) -> None:
+    for vertex_count in sizes:
+        names, edges = random_named_edges(vertex_count, vertex_count * 3)
+        print(f"\n[정점 {vertex_count}개, 에지 {len(edges)}개를 정점 이름으로 추가]")
+        print(f"정점 -> 인덱스 사전: {bulk_load(WeightedGraph, names, edges):.3f} 초")
+        if vertex_count <= 10_000: # 리스트 탐색은 O(V·E)라 큰 그래프에서는 생략
+            print(f"list.index:          {bulk_load(ListIndexWeightedGraph, names, edges):.3f} 초")
+
+# 정점을 하나씩 제거: 제거 표시만 하는 방식과, 제거할 때마다 compact()로 전체를 다시 만드는 방식(예전 remove_vertex와 같은 비용)
+def _named_graph(names: List[str], edges: List[Tuple[str, str, float]]) -> WeightedGraph[str]:
+    wg: WeightedGraph[str] = WeightedGraph(list(names))
+    for first, second, weight in edges:
+        wg.add_edge_by_vertices(first, second, weight)
+    return wg
+
+# 크기별로 정점의 fraction만큼을 제거 표시한 뒤 한 번 compact()하고, 제거 한 번당 시간을 잼
+# 제거가 차수에만 비례하면 그래프가 커져도 한 번당 시간이 거의 같아야 함
+# 매번 compact()하는 방식은 제거마다 O(V + E)이므로 compact_removals개만 잼
+def run_removal_benchmark(vertex_counts: List[int], fraction: float = 0.25,
+                          compact_removals: int = 3, seed: int = 0) -> None:
+    for vertex_count in vertex_counts:
+        rng: random.Random = random.Random(seed)
+        names, edges = random_named_edges(vertex_count, vertex_count * 3, seed)
+        removals: int = int(vertex_count * fraction)
+        print(f"\n[정점 {vertex_count}개]")
+        for label, count, compact_each_time in ((f"제거 표시 {removals}개 후 한 번 compact()", removals, False),
+                                                (f"매번 compact() ({compact_removals}개)", compact_removals, True)):
+            wg: WeightedGraph[str] = _named_graph(names, edges)
+            victims: List[str] = rng.sample(names, count)
+            begin: float = time.perf_counter()
+            for name in victims:
+                wg.remove_vertex(wg.index_of(name))
+                if compact_each_time:
+                    wg.compact()
+            wg.compact()
+            elapsed: float = time.perf_counter() - begin
+            print(f"{label:34} {elapsed:.3f} 초, 제거 한 번당 {elapsed / count * 1e6:.1f} µs")
+
+if __name__ == "__main__":
+    run_load_benchmark([1_000, 10_000, 500_000])
+    run_removal_benchmark([20_000, 40_000, 80_000])
@@ -1,4 +1,4 @@
-from typing import TypeVar, List, Optional
+from typing import TypeVar, List, Optional, Tuple
 from weighted_graph import WeightedGraph
 from weighted_edge import WeightedEdge
 from priority_queue import PriorityQueue
@@ -13,9 +13,15 @@ def total_weight(wp: WeightedPath) -> float:
 def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
     if start > (wg.vertex_count - 1) or start < 0:
         return None
-    result: WeightedPath = [] # 최소 신장 트리 결과
+    # 연결 그래프가 아니면 start가 속한 연결 요소의 트리만 반환함 (전체는 minimum_spanning_forest)
     pq: PriorityQueue[WeightedEdge] = PriorityQueue()
-    visited: [bool] = [False] * wg.vertex_count # 방문한 곳
+    visited: List[bool] = [False] * wg.vertex_count # 방문한 곳
+    return _grow_tree(wg, start, pq, visited)
+
+# start에서 프림 알고리즘으로 트리를 키움. 끝나면 pq는 비어 있으므로 다음 연결 요소에 다시 쓸 수 있음
+def _grow_tree(wg: WeightedGraph[V], start: int, pq: PriorityQueue[WeightedEdge],
+               visited: List[bool]) -> WeightedPath:
+    result: WeightedPath = [] # 최소 신장 트리 결과
 
     def visit(index: int):
         visited[index] = True # 방문한 곳으로 표시
@@ -35,6 +41,20 @@ def mst(wg: WeightedGraph[V], start: int = 0) -> Optional[WeightedPath]:
 
     return result
 
+# 최소 신장 포레스트: 연결 요소마다 (시작 정점 인덱스, 최소 신장 트리, 가중치 총합)
+# 방문하지 않은 정점에서 차례로 트리를 키우므로 모든 정점과 에지를 한 번씩만 보고,
+# 우선순위 큐와 방문 표시는 모든 연결 요소가 함께 씀. 고립된 정점은 빈 트리, 삭제된 정점은 제외
+def minimum_spanning_forest(wg: WeightedGraph[V]) -> List[Tuple[int, WeightedPath, float]]:
+    pq: PriorityQueue[WeightedEdge] = PriorityQueue()
+    visited: List[bool] = [False] * wg.vertex_count
+    forest: List[Tuple[int, WeightedPath, float]] = []
+    for root in range(wg.vertex_count):
+        if visited[root] or wg.is_removed(root):
+            continue
+        tree: WeightedPath = _grow_tree(wg, root, pq, visited)
+        forest.append((root, tree, total_weight(tree)))
+    return forest
+
 def print_weighted_path(wg:WeightedGraph, wp: WeightedPath) -> None:
     for edge in wp:
         print(f"{wg.vertex_at(edge.u)} {edge.weight} > {wg.vertex_at(edge.v)}")
@@ -1,4 +1,4 @@
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Dict, Tuple, Any
 from heapq import heappush, heappop
 
 T = TypeVar('T')
@@ -18,4 +18,103 @@ class PriorityQueue(Generic[T]):
         return heappop(self._container)
 
     def __repr__(self) -> str:
-        return repr(self._container)
\ No newline at end of file
+        return repr(self._container)
+
+K = TypeVar('K') # 인덱스 힙의 키 타입
+
+class IndexedPriorityQueue(Generic[K]):
+    """키마다 항목을 하나만 유지하는 이진 힙.
+    키의 힙 위치를 딕셔너리로 기억하므로 contains와 decrease_key가 가능하고,
+    같은 정점이 중복으로 쌓이거나 오래된 항목을 pop하는 일이 없다."""
+
+    def __init__(self) -> None:
+        self._keys: List[K] = []
+        self._priorities: List[Any] = []
+        self._positions: Dict[K, int] = {} # 키 -> 힙 배열에서의 위치
+
+    @property
+    def empty(self) -> bool:
+        return not self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._positions
+
+    def contains(self, key: K) -> bool:
+        return key in self._positions
+
+    def priority(self, key: K) -> Any:
+        return self._priorities[self._positions[key]]
+
+    def push(self, key: K, priority: Any) -> None:
+        if key in self._positions:
+            raise KeyError(f"{key!r} is already in the queue")
+        self._keys.append(key)
+        self._priorities.append(priority)
+        self._positions[key] = len(self._keys) - 1
+        self._sift_up(len(self._keys) - 1)
+
+    def decrease_key(self, key: K, priority: Any) -> None:
+        position: int = self._positions[key]
+        if self._priorities[position] < priority:
+            raise ValueError("new priority is greater than the current priority")
+        self._priorities[position] = priority
+        self._sift_up(position)
+
+    def peek(self) -> Tuple[K, Any]:
+        return self._keys[0], self._priorities[0]
+
+    def pop(self) -> Tuple[K, Any]:
+        key: K = self._keys[0]
+        priority: Any = self._priorities[0]
+        last_key: K = self._keys.pop()
+        last_priority: Any = self._priorities.pop()
+        del self._positions[key]
+        if self._keys: # 마지막 항목을 루트로 옮기고 아래로 내림
+            self._keys[0] = last_key
+            self._priorities[0] = last_priority
+            self._positions[last_key] = 0
+            self._sift_down(0)
+        return key, priority
+
+    def _sift_up(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        key: K = keys[position]
+        priority: Any = priorities[position]
+        while position > 0:
+            parent: int = (position - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            keys[position] = keys[parent]
+            priorities[position] = priorities[parent]
+            positions[keys[position]] = position
+            position = parent
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+    def _sift_down(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        size: int = len(keys)
+        key: K = keys[position]
+        priority: Any = priorities[position]
+        while True:
+            child: int = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            keys[position] = keys[child]
+            priorities[position] = priorities[child]
+            positions[keys[position]] = position
+            position = child
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+    def __repr__(self) -> str:
+        return repr(list(zip(self._keys, self._priorities)))
@@ -0,0 +1,21 @@
+from typing import List
+import random
+from weighted_graph import WeightedGraph
+
+# 벤치마크용 무작위 가중치 그래프 (정점은 0 ~ vertex_count - 1 정수)
+def random_weighted_graph(vertex_count: int, edge_count: int,
+                          seed: int = 0, max_weight: int = 1000) -> WeightedGraph[int]:
+    rng: random.Random = random.Random(seed) # 시드가 같으면 같은 그래프
+    wg: WeightedGraph[int] = WeightedGraph(list(range(vertex_count)))
+    # 먼저 무작위 신장 트리로 모든 정점을 연결하여 연결 그래프를 만듦
+    order: List[int] = list(range(vertex_count))
+    rng.shuffle(order)
+    for i in range(1, vertex_count):
+        wg.add_edge_by_indices(order[i], order[rng.randrange(i)], rng.randint(1, max_weight))
+    # 나머지 에지는 임의의 두 정점 사이에 추가
+    for _ in range(edge_count - (vertex_count - 1)):
+        u: int = rng.randrange(vertex_count)
+        v: int = rng.randrange(vertex_count)
+        if u != v:
+            wg.add_edge_by_indices(u, v, rng.randint(1, max_weight))
+    return wg
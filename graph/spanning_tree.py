@@ -0,0 +1,158 @@
+from __future__ import annotations
+from typing import TypeVar, List, Dict, Tuple, Iterable, Optional
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import time
+from weighted_graph import WeightedGraph
+from weighted_edge import WeightedEdge
+from mst import WeightedPath, total_weight, print_weighted_path, mst
+
+V = TypeVar('V') # 그래프의 정점(vertex) 타입
+
+# (가중치, 작은 정점 인덱스, 큰 정점 인덱스). 튜플 비교가 곧 동률 처리 규칙이 되므로
+# 가중치가 같은 에지가 있어도 kruskal과 boruvka가 같은 트리를 고름
+EdgeKey = Tuple[float, int, int]
+
+class UnionFind:
+    """경로 압축(path halving)과 크기 기준 합치기를 쓰는 분리 집합 (정수 원소 0 ~ size - 1).
+    count는 남은 집합의 수로, kruskal은 이것이 1이 되면 멈춘다."""
+
+    def __init__(self, size: int) -> None:
+        self._parents: array = array('i', range(size))
+        self._sizes: array = array('i', [1]) * size
+        self.count: int = size
+
+    def find(self, x: int) -> int:
+        parents: array = self._parents
+        while parents[x] != x:
+            parents[x] = parents[parents[x]] # 할아버지를 가리키게 하여 경로를 절반으로 줄임
+            x = parents[x]
+        return x
+
+    # 두 원소의 집합을 합치고, 실제로 합쳤다면 True
+    def union(self, a: int, b: int) -> bool:
+        root_a: int = self.find(a)
+        root_b: int = self.find(b)
+        if root_a == root_b:
+            return False
+        if self._sizes[root_a] < self._sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parents[root_b] = root_a # 작은 집합을 큰 집합 아래에 붙임
+        self._sizes[root_a] += self._sizes[root_b]
+        self.count -= 1
+        return True
+
+# 무향 그래프의 에지를 한 번씩만 담은 목록 (양방향으로 저장된 에지 중 u < v인 쪽)
+def edge_keys(wg: WeightedGraph[V]) -> List[EdgeKey]:
+    if wg._directed:
+        raise ValueError("spanning trees need an undirected graph")
+    return [(we.weight, u, we.v) for u in range(wg.vertex_count)
+            for we in wg.edges_for_index(u) if u < we.v]
+
+# 크루스칼 알고리즘: 정렬된 에지 배열을 가벼운 순서로 보며 사이클을 만들지 않는 에지만 고름
+# 연결되지 않은 그래프에서는 연결 요소마다의 트리를 모은 신장 포레스트를 반환
+def kruskal(wg: WeightedGraph[V]) -> WeightedPath:
+    edges: List[EdgeKey] = sorted(edge_keys(wg))
+    components: UnionFind = UnionFind(wg.vertex_count)
+    result: WeightedPath = []
+    for weight, u, v in edges:
+        if components.union(u, v):
+            result.append(WeightedEdge(u, v, weight))
+            if components.count == 1:
+                break
+    return result
+
+# 정점마다 속한 요소(union-find 루트)를 보고, 서로 다른 요소를 잇는 에지 중 요소마다 가장 가벼운 것
+def _cheapest_edges(edges: List[EdgeKey], labels: array) -> Dict[int, EdgeKey]:
+    cheapest: Dict[int, EdgeKey] = {}
+    for key in edges:
+        cu: int = labels[key[1]]
+        cv: int = labels[key[2]]
+        if cu == cv:
+            continue
+        best: Optional[EdgeKey] = cheapest.get(cu)
+        if best is None or key < best:
+            cheapest[cu] = key
+        best = cheapest.get(cv)
+        if best is None or key < best:
+            cheapest[cv] = key
+    return cheapest
+
+_worker_edges: List[EdgeKey] = [] # 워커 프로세스마다 처음 한 번만 받아 두는 에지 목록
+
+def _load_edges(edges: List[EdgeKey]) -> None:
+    global _worker_edges
+    _worker_edges = edges
+
+# 워커 프로세스에서 실행: 에지 목록을 parts개로 나눈 것 중 part번째 구간만 훑음
+def _cheapest_edges_in_part(labels: array, part: int, parts: int) -> Dict[int, EdgeKey]:
+    size: int = -(-len(_worker_edges) // parts)
+    return _cheapest_edges(_worker_edges[part * size:(part + 1) * size], labels)
+
+# 보루프카 알고리즘: 라운드마다 모든 요소가 자기에게서 나가는 가장 가벼운 에지를 동시에 고름
+# 라운드마다 요소 수가 절반 이하로 줄어 많아야 log V 라운드. 결과는 kruskal과 같은 트리(포레스트)
+# workers가 1보다 크면 요소별 최소 에지 탐색을 프로세스 풀에서 나눠 실행함. 에지 목록은 워커가
+# 시작할 때 한 번만 넘기고, 라운드마다는 정점별 요소 번호 배열만 보냄
+def boruvka(wg: WeightedGraph[V], workers: int = 1) -> WeightedPath:
+    edges: List[EdgeKey] = edge_keys(wg)
+    components: UnionFind = UnionFind(wg.vertex_count)
+    result: WeightedPath = []
+    executor: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_load_edges, initargs=(edges,))
+    try:
+        while True:
+            labels: array = array('i', [components.find(x) for x in range(wg.vertex_count)])
+            if executor is not None:
+                partials: Iterable[Dict[int, EdgeKey]] = executor.map(
+                    _cheapest_edges_in_part, [labels] * workers, range(workers), [workers] * workers)
+            else:
+                # 직렬일 때는 이미 같은 요소가 된 에지를 버려 라운드마다 훑을 에지를 줄임
+                edges = [key for key in edges if labels[key[1]] != labels[key[2]]]
+                partials = [_cheapest_edges(edges, labels)]
+            cheapest: Dict[int, EdgeKey] = {}
+            for partial in partials:
+                for component, key in partial.items():
+                    if component not in cheapest or key < cheapest[component]:
+                        cheapest[component] = key
+            if not cheapest: # 남은 요소끼리 잇는 에지가 없음
+                break
+            # 두 요소가 같은 에지를 고를 수 있으므로 union이 성공한 에지만 추가
+            for weight, u, v in sorted(set(cheapest.values())):
+                if components.union(u, v):
+                    result.append(WeightedEdge(u, v, weight))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return result
+
+if __name__ == "__main__":
+    from random_graph import random_weighted_graph
+    vertex_count, edge_count = 100_000, 400_000
+    wg: WeightedGraph[int] = random_weighted_graph(vertex_count, edge_count, seed=0)
+    print(f"[정점 {vertex_count}개, 에지 {edge_count}개]")
+    for name, build in (("mst (프림)", lambda: mst(wg)),
+                        ("kruskal", lambda: kruskal(wg)),
+                        ("boruvka", lambda: boruvka(wg)),
+                        ("boruvka, 워커 4개", lambda: boruvka(wg, workers=4))):
+        begin: float = time.perf_counter()
+        tree: WeightedPath = build()
+        print(f"{name:18} {time.perf_counter() - begin:.3f} 초, 에지 {len(tree)}개, 가중치 총합 {total_weight(tree)}")
+
+    city_graph: WeightedGraph[str] = WeightedGraph(["Seattle", "San Francisco", "Los Angeles", "Riverside", "Phoenix", "Chicago", "Boston", "New York", "Atlanta", "Miami", "Dallas", "Houston", "Detroit", "Philadelphia", "Washington"])
+    for first, second, weight in (("Seattle", "Chicago", 1737), ("Seattle", "San Francisco", 678),
+                                  ("San Francisco", "Riverside", 386), ("San Francisco", "Los Angeles", 348),
+                                  ("Los Angeles", "Riverside", 50), ("Los Angeles", "Phoenix", 357),
+                                  ("Riverside", "Phoenix", 307), ("Riverside", "Chicago", 1704),
+                                  ("Phoenix", "Dallas", 887), ("Phoenix", "Houston", 1015),
+                                  ("Dallas", "Chicago", 805), ("Dallas", "Atlanta", 721),
+                                  ("Dallas", "Houston", 225), ("Houston", "Atlanta", 702),
+                                  ("Houston", "Miami", 968), ("Atlanta", "Chicago", 588),
+                                  ("Atlanta", "Washington", 543), ("Atlanta", "Miami", 604),
+                                  ("Miami", "Washington", 923), ("Chicago", "Detroit", 238),
+                                  ("Detroit", "Boston", 613), ("Detroit", "Washington", 396),
+                                  ("Detroit", "New York", 482), ("Boston", "New York", 190),
+                                  ("New York", "Philadelphia", 81), ("Philadelphia", "Washington", 123)):
+        city_graph.add_edge_by_vertices(first, second, weight)
+    print("")
+    print_weighted_path(city_graph, kruskal(city_graph))
@@ -0,0 +1,393 @@
+import random
+import pytest
+from weighted_graph import WeightedGraph
+from priority_queue import IndexedPriorityQueue
+from dijkstra import (dijkstra, distance_array_to_vertex_dict, path_dict_to_path, dijkstra_to,
+                      bidirectional_dijkstra, DijkstraCache)
+from mst import total_weight, mst, minimum_spanning_forest
+from random_graph import random_weighted_graph
+from heap_benchmark import lazy_dijkstra_stats
+from graph import Graph
+from directed_graph import DirectedGraph
+from weighted_directed_graph import WeightedDirectedGraph
+from contraction_hierarchy import ContractionHierarchy, grid_road_graph
+from alt import select_landmarks, LandmarkTable, alt_search
+from spanning_tree import UnionFind, kruskal, boruvka
+from csr_graph import CSRGraph, csr_bfs, csr_path, csr_dijkstra, csr_weighted_path, csr_mst
+
+CITIES = ["Seattle", "San Francisco", "Los Angeles", "Riverside", "Phoenix", "Chicago", "Boston",
+          "New York", "Atlanta", "Miami", "Dallas", "Houston", "Detroit", "Philadelphia", "Washington"]
+CITY_EDGES = [
+    ("Seattle", "Chicago", 1737), ("Seattle", "San Francisco", 678), ("San Francisco", "Riverside", 386),
+    ("San Francisco", "Los Angeles", 348), ("Los Angeles", "Riverside", 50), ("Los Angeles", "Phoenix", 357),
+    ("Riverside", "Phoenix", 307), ("Riverside", "Chicago", 1704), ("Phoenix", "Dallas", 887),
+    ("Phoenix", "Houston", 1015), ("Dallas", "Chicago", 805), ("Dallas", "Atlanta", 721),
+    ("Dallas", "Houston", 225), ("Houston", "Atlanta", 702), ("Houston", "Miami", 968),
+    ("Atlanta", "Chicago", 588), ("Atlanta", "Washington", 543), ("Atlanta", "Miami", 604),
+    ("Miami", "Washington", 923), ("Chicago", "Detroit", 238), ("Detroit", "Boston", 613),
+    ("Detroit", "Washington", 396), ("Detroit", "New York", 482), ("Boston", "New York", 190),
+    ("New York", "Philadelphia", 81), ("Philadelphia", "Washington", 123),
+]
+
+
+def city_graph() -> WeightedGraph[str]:
+    wg: WeightedGraph[str] = WeightedGraph(list(CITIES))
+    for first, second, weight in CITY_EDGES:
+        wg.add_edge_by_vertices(first, second, weight)
+    return wg
+
+
+def test_indexed_priority_queue_orders_and_decreases_keys():
+    pq = IndexedPriorityQueue()
+    rng = random.Random(1)
+    priorities = {key: rng.randint(0, 1000) for key in range(200)}
+    for key, priority in priorities.items():
+        pq.push(key, priority)
+    for key in range(0, 200, 3):
+        priorities[key] -= rng.randint(0, 500)
+        pq.decrease_key(key, priorities[key])
+    assert 5 in pq and pq.contains(5) and len(pq) == 200
+    popped = [pq.pop() for _ in range(len(pq))]
+    assert [p for _, p in popped] == sorted(priorities.values())
+    assert all(priorities[k] == p for k, p in popped)
+    assert pq.empty
+
+
+def test_indexed_priority_queue_rejects_bad_updates():
+    pq = IndexedPriorityQueue()
+    pq.push("a", 5)
+    with pytest.raises(KeyError):
+        pq.push("a", 1)
+    with pytest.raises(ValueError):
+        pq.decrease_key("a", 10)
+
+
+def test_dijkstra_city_distances():
+    wg = city_graph()
+    distances, path_dict = dijkstra(wg, "Los Angeles")
+    named = distance_array_to_vertex_dict(wg, distances)
+    assert named["Boston"] == 2605
+    assert named["Seattle"] == 1026
+    assert named["Miami"] == 2340
+    path = path_dict_to_path(wg.index_of("Los Angeles"), wg.index_of("Boston"), path_dict)
+    assert [wg.vertex_at(e.v) for e in path] == ["Riverside", "Chicago", "Detroit", "Boston"]
+    assert total_weight(path) == 2605
+
+
+def test_dijkstra_matches_lazy_heap_on_random_graph():
+    wg = random_weighted_graph(2000, 8000, seed=3)
+    distances, _ = dijkstra(wg, 0)
+    assert distances == lazy_dijkstra_stats(wg, 0)[0]
+
+
+def test_csr_graph_matches_weighted_graph():
+    wg = city_graph()
+    csr = CSRGraph.from_graph(wg)
+    assert csr.vertex_count == wg.vertex_count and csr.edge_count == wg.edge_count
+    for i in range(wg.vertex_count):
+        assert list(csr.neighbors_for_index(i)) == [e.v for e in wg.edges_for_index(i)]
+        assert list(csr.weights_for_index(i)) == [e.weight for e in wg.edges_for_index(i)]
+    edges = [(wg.index_of(a), wg.index_of(b), w) for a, b, w in CITY_EDGES]
+    from_edges = CSRGraph.from_edges(CITIES, edges)
+    assert from_edges.offsets == csr.offsets and from_edges.targets == csr.targets
+    assert from_edges.weights == csr.weights
+
+
+def test_csr_dijkstra_and_mst():
+    wg = city_graph()
+    csr = CSRGraph.from_graph(wg)
+    la, boston = csr.index_of("Los Angeles"), csr.index_of("Boston")
+    distances, parents = csr_dijkstra(csr, la)
+    assert distances == dijkstra(wg, "Los Angeles")[0]
+    path = csr_weighted_path(csr, parents, la, boston)
+    assert [csr.vertex_at(e.v) for e in path] == ["Riverside", "Chicago", "Detroit", "Boston"]
+    assert total_weight(path) == 2605
+    assert total_weight(csr_mst(csr)) == total_weight(mst(wg))
+
+    random_graph = random_weighted_graph(2000, 8000, seed=4)
+    random_csr = CSRGraph.from_graph(random_graph)
+    assert csr_dijkstra(random_csr, 0)[0] == dijkstra(random_graph, 0)[0]
+    assert total_weight(csr_mst(random_csr)) == total_weight(mst(random_graph))
+
+
+def test_csr_bfs():
+    g = Graph(list(CITIES))
+    for first, second, _ in CITY_EDGES:
+        g.add_edge_by_vertices(first, second)
+    csr = CSRGraph.from_graph(g)
+    assert not csr.weighted
+    boston, miami = csr.index_of("Boston"), csr.index_of("Miami")
+    hops, parents = csr_bfs(csr, boston)
+    path = csr_path(parents, boston, miami)
+    assert [csr.vertex_at(i) for i in path] == ["Boston", "Detroit", "Washington", "Miami"]
+    assert hops[miami] == 3
+    isolated = CSRGraph.from_edges(["a", "b", "c"], [(0, 1, 1.0)])
+    assert csr_path(csr_bfs(isolated, 0)[1], 0, 2) is None
+
+
+def test_csr_graph_from_weighted_directed_graph():
+    wdg = WeightedDirectedGraph(["a", "b", "c", "a"])
+    wdg.add_edge_by_vertices("a", "b", 4)
+    wdg.add_edge_by_vertices("b", "c", 1)
+    wdg.add_edge_by_vertices("a", "c", 7)
+    csr = CSRGraph.from_graph(wdg)
+    assert csr.weighted
+    distances, parents = csr_dijkstra(csr, csr.index_of("a"))
+    assert distances == [0, 4, 5, None]
+    assert total_weight(csr_weighted_path(csr, parents, 0, 2)) == 5
+    assert csr.index_of("a") == 0 # 중복된 정점은 Graph와 같이 처음 인덱스
+    with pytest.raises(ValueError):
+        csr.index_of("d")
+    assert CSRGraph.from_graph(WeightedDirectedGraph(["x"])).weighted
+
+
+def test_vertex_index_stays_consistent():
+    g = Graph(["a", "b", "c"])
+    assert [g.index_of(v) for v in "abc"] == [0, 1, 2]
+    assert g.add_vertex("d") == 3 and g.index_of("d") == 3
+    g.add_edge_by_vertices("a", "d")
+    g.add_edge_by_vertices("c", "d")
+    g.remove_vertex(1)
+    assert [g.index_of(v) for v in "acd"] == [0, 2, 3]
+    assert g.neighbors_for_vertex("d") == ["a", "c"]
+    with pytest.raises(ValueError):
+        g.index_of("b")
+    assert g.compact() == [0, -1, 1, 2]
+    assert [g.index_of(v) for v in "acd"] == [0, 1, 2]
+    # 기본 인자로 만든 그래프끼리 정점 리스트를 공유하지 않음
+    first, second = WeightedGraph(), WeightedGraph()
+    first.add_vertex("x")
+    assert second.vertex_count == 0
+    with pytest.raises(ValueError):
+        second.add_edge_by_vertices("x", "x", 1)
+
+
+def test_remove_vertex_with_duplicate_values():
+    g = Graph(["a", "b", "a", "a"])
+    assert g.index_of("a") == 0
+    g.remove_vertex(0)
+    assert g.index_of("a") == 2
+    g.remove_vertex(3) # 사전이 가리키지 않는 중복 정점은 사전에 영향 없음
+    assert g.index_of("a") == 2
+    g.remove_vertex(2)
+    with pytest.raises(ValueError):
+        g.index_of("a")
+    assert g.add_vertex("a") == 4 and g.index_of("a") == 4
+    g.add_vertex("b")
+    g.remove_vertex(g.index_of("b"))
+    assert g.index_of("b") == 5
+    assert g.compact() == [-1, -1, -1, -1, 0, 1] and [g.index_of(v) for v in "ab"] == [0, 1]
+
+
+def test_tombstone_removal_keeps_indices_and_weights():
+    wg = city_graph()
+    chicago = wg.index_of("Chicago")
+    detroit = wg.index_of("Detroit")
+    edge_count = wg.edge_count
+    degree = len(wg.edges_for_index(chicago))
+    wg.remove_vertex(chicago)
+    assert wg.is_removed(chicago) and wg.removed_count == 1
+    assert wg.edge_count == edge_count - 2 * degree
+    assert wg.index_of("Detroit") == detroit
+    assert "Chicago" not in wg.neighbors_for_vertex("Detroit")
+    assert "Chicago" not in str(wg)
+    with pytest.raises(IndexError):
+        wg.remove_vertex(chicago)
+    distances, _ = dijkstra(wg, "Los Angeles")
+    assert distances[chicago] is None
+    assert distance_array_to_vertex_dict(wg, distances)["Boston"] == 2902  # Washington, Philadelphia, New York 경유
+
+    wg.remove_edge_by_vertices("Boston", "New York")
+    assert "New York" not in wg.neighbors_for_vertex("Boston")
+    assert "Boston" not in wg.neighbors_for_vertex("New York")
+    distances, _ = dijkstra(wg, "Los Angeles")
+    mapping = wg.compact()
+    assert mapping[chicago] == -1 and wg.vertex_count == len(CITIES) - 1
+    assert wg.index_of("Detroit") == mapping[detroit]
+    # 압축해도 가중치가 남아 있어 거리가 같음
+    assert dijkstra(wg, "Los Angeles")[0] == [d for i, d in enumerate(distances) if i != chicago]
+
+
+def test_directed_graph_removal_drops_incoming_edges():
+    dg = DirectedGraph(["a", "b", "c"])
+    dg.add_edge_by_vertices("a", "c")
+    dg.add_edge_by_vertices("b", "c")
+    dg.add_edge_by_vertices("c", "a")
+    dg.remove_vertex(dg.index_of("c"))
+    assert dg.edge_count == 0
+
+
+def test_point_to_point_dijkstra_variants():
+    wg = city_graph()
+    for search in (dijkstra_to, bidirectional_dijkstra):
+        path, settled = search(wg, "Los Angeles", "Boston")
+        assert [wg.vertex_at(e.v) for e in path] == ["Riverside", "Chicago", "Detroit", "Boston"]
+        assert total_weight(path) == 2605 and settled <= wg.vertex_count
+        assert search(wg, "Boston", "Boston")[0] == []
+    # 가까운 목적지는 그래프 전체를 확정하지 않음
+    assert dijkstra_to(wg, "Los Angeles", "Riverside")[1] == 2
+
+    rg = random_weighted_graph(1500, 4000, seed=5)
+    lonely = rg.add_vertex(1500)
+    rng = random.Random(5)
+    for _ in range(30):
+        root, target = rng.randrange(1500), rng.randrange(1500)
+        expected = dijkstra(rg, root)[0][target]
+        for search in (dijkstra_to, bidirectional_dijkstra):
+            path, _ = search(rg, root, target)
+            assert total_weight(path) == expected
+            assert all(a.v == b.u for a, b in zip(path, path[1:]))
+        assert dijkstra_to(rg, root, lonely)[0] is None
+        assert bidirectional_dijkstra(rg, root, lonely)[0] is None
+
+
+def test_dijkstra_cache_reuses_source_trees():
+    wg = city_graph()
+    cache = DijkstraCache(wg, maxsize=2)
+    assert cache.distance("Los Angeles", "Boston") == 2605
+    assert total_weight(cache.path("Los Angeles", "Boston")) == 2605
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.distance("Seattle", "Miami")
+    cache.distance("Los Angeles", "Miami")  # 최근에 썼으므로 남아 있음
+    cache.distance("Boston", "Miami")  # 가장 오래된 Seattle을 밀어냄
+    assert len(cache) == 2 and (cache.hits, cache.misses) == (2, 3)
+    cache.distance("Seattle", "Miami")
+    assert cache.misses == 4
+    assert cache.path("Boston", "Boston") == []
+
+
+def assert_connected_path(wg, path, root, target):
+    assert path[0].u == wg.index_of(root) and path[-1].v == wg.index_of(target)
+    for a, b in zip(path, path[1:]):
+        assert a.v == b.u
+    for e in path:
+        assert e.weight in [we.weight for we in wg.edges_for_index(e.u) if we.v == e.v]
+
+
+def test_contraction_hierarchy_matches_dijkstra(tmp_path):
+    wg = city_graph()
+    ch = ContractionHierarchy.build(wg)
+    assert ch.distance("Los Angeles", "Boston") == 2605
+    path = ch.path("Los Angeles", "Boston")
+    assert_connected_path(wg, path, "Los Angeles", "Boston")
+    assert total_weight(path) == 2605
+
+    for graph in (grid_road_graph(12, 15, seed=2), random_weighted_graph(300, 900, seed=6)):
+        lonely = graph.add_vertex(graph.vertex_count)
+        ch = ContractionHierarchy.build(graph)
+        saved = tmp_path / "ch.json"
+        ch.save(str(saved))
+        loaded = ContractionHierarchy.load(str(saved))
+        rng = random.Random(7)
+        for _ in range(40):
+            root, target = rng.randrange(lonely), rng.randrange(lonely)
+            expected = dijkstra(graph, root)[0][target]
+            for hierarchy in (ch, loaded):
+                assert hierarchy.distance(root, target) == expected
+                path = hierarchy.path(root, target)
+                assert total_weight(path) == expected
+                if root != target:
+                    assert_connected_path(graph, path, root, target)
+            assert ch.distance(root, lonely) is None and ch.path(root, lonely) is None
+
+
+def test_contraction_hierarchy_round_trips_tuple_vertices(tmp_path):
+    wg = WeightedGraph([(0, 0), (0, 1), (1, 1)])
+    wg.add_edge_by_vertices((0, 0), (0, 1), 2)
+    wg.add_edge_by_vertices((0, 1), (1, 1), 3)
+    saved = tmp_path / "ch.json"
+    ContractionHierarchy.build(wg).save(str(saved))
+    loaded = ContractionHierarchy.load(str(saved))
+    assert loaded.vertex_at(0) == (0, 0) and loaded.index_of((1, 1)) == 2
+    assert loaded.distance((0, 0), (1, 1)) == 5
+
+
+def test_alt_search_matches_dijkstra_and_settles_fewer_vertices():
+    for wg in (city_graph(), grid_road_graph(20, 20, seed=2), random_weighted_graph(300, 900, seed=3)):
+        landmarks = select_landmarks(wg, 4)
+        assert len(set(landmarks)) == 4
+        table = LandmarkTable(wg, landmarks)
+        rng = random.Random(4)
+        alt_settled = to_settled = 0
+        for _ in range(30):
+            root = wg.vertex_at(rng.randrange(wg.vertex_count))
+            target = wg.vertex_at(rng.randrange(wg.vertex_count))
+            distances, _ = dijkstra(wg, root)
+            last = wg.index_of(target)
+            path, settled = alt_search(wg, table, root, target)
+            if distances[last] is None:
+                assert path is None
+            else:
+                # 하한은 실제 거리를 넘지 않아야 함
+                assert table.heuristic_for(target)(root) <= distances[last]
+                assert total_weight(path) == distances[last]
+                if path:
+                    assert_connected_path(wg, path, root, target)
+            alt_settled += settled
+            to_settled += dijkstra_to(wg, root, target)[1]
+        assert alt_settled < to_settled
+
+
+def test_alt_search_unreachable_and_directed():
+    wg = WeightedGraph(["A", "B", "C", "D"])
+    wg.add_edge_by_vertices("A", "B", 1)
+    wg.add_edge_by_vertices("C", "D", 2)
+    table = LandmarkTable.build(wg, 3)
+    assert alt_search(wg, table, "A", "D") == (None, 2)
+    assert alt_search(wg, table, "C", "D")[0] is not None
+    assert alt_search(wg, table, "A", "A") == ([], 1)
+    with pytest.raises(ValueError):
+        LandmarkTable(WeightedDirectedGraph(["A"]), [0])
+
+
+def test_union_find():
+    uf = UnionFind(6)
+    assert uf.union(0, 1) and uf.union(2, 3) and uf.union(1, 3)
+    assert not uf.union(0, 2)
+    assert uf.find(0) == uf.find(3) != uf.find(4)
+    assert uf.count == 3
+
+
+def spanning_keys(tree):
+    return sorted((e.weight, min(e.u, e.v), max(e.u, e.v)) for e in tree)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_kruskal_and_boruvka_match_prim(workers):
+    wg = city_graph()
+    assert total_weight(kruskal(wg)) == total_weight(boruvka(wg, workers)) == total_weight(mst(wg)) == 5372
+    # 가중치가 겹치는 에지가 많아도 동률 규칙이 같으므로 두 알고리즘이 같은 트리를 고름
+    wg = random_weighted_graph(400, 1600, seed=5, max_weight=5)
+    tree = kruskal(wg)
+    assert len(tree) == wg.vertex_count - 1
+    assert spanning_keys(tree) == spanning_keys(boruvka(wg, workers))
+    assert total_weight(tree) == total_weight(mst(wg))
+
+
+def test_spanning_forest_of_disconnected_graph():
+    wg = WeightedGraph(["A", "B", "C", "D", "E"])
+    wg.add_edge_by_vertices("A", "B", 3)
+    wg.add_edge_by_vertices("B", "C", 1)
+    wg.add_edge_by_vertices("A", "C", 2)
+    wg.add_edge_by_vertices("D", "E", 4)
+    assert spanning_keys(kruskal(wg)) == spanning_keys(boruvka(wg)) == [(1, 1, 2), (2, 0, 2), (4, 3, 4)]
+    with pytest.raises(ValueError):
+        kruskal(WeightedDirectedGraph(["A"]))
+
+
+def test_minimum_spanning_forest():
+    wg = WeightedGraph(["A", "B", "C", "D", "E", "F"])
+    wg.add_edge_by_vertices("A", "B", 3)
+    wg.add_edge_by_vertices("B", "C", 1)
+    wg.add_edge_by_vertices("A", "C", 2)
+    wg.add_edge_by_vertices("D", "F", 4)
+    forest = minimum_spanning_forest(wg)
+    assert [(root, total) for root, _, total in forest] == [(0, 3), (3, 4), (4, 0)]
+    assert forest[0][1] == mst(wg) # mst는 시작 정점의 연결 요소만 다룸
+    assert spanning_keys(forest[1][1]) == [(4, 3, 5)] and forest[2][1] == []
+    assert sum(total for _, _, total in forest) == total_weight(kruskal(wg))
+
+    wg.remove_vertex(wg.index_of("E"))
+    assert [root for root, _, _ in minimum_spanning_forest(wg)] == [0, 3]
+    connected = city_graph()
+    assert [(root, total) for root, _, total in minimum_spanning_forest(connected)] == [(0, 5372)]
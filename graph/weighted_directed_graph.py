@@ -5,11 +5,10 @@ from weighted_edge import WeightedEdge
 V = TypeVar('V')
 
 class WeightedDirectedGraph(Generic[V], Graph[V]):
+    _directed: bool = True
+
     def __init__(self, vertices: List[V] = None) -> None:
-        if vertices is None:
-            vertices = []
-        self._vertices: List[V] = vertices
-        self._edges: List[List[WeightedEdge]] = [[] for _ in vertices]
+        super().__init__(vertices)
 
     # 🔴 유향 그래프: u -> v 한 방향만 추가
     def add_edge(self, edge: WeightedEdge) -> None:
@@ -20,8 +19,8 @@ class WeightedDirectedGraph(Generic[V], Graph[V]):
         self.add_edge(edge)
 
     def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
-        u = self._vertices.index(first)
-        v = self._vertices.index(second)
+        u = self.index_of(first)
+        v = self.index_of(second)
         self.add_edge_by_indices(u, v, weight)
 
     def neighbors_for_index_with_weights(self, index: int) -> List[Tuple[V, float]]:
@@ -33,6 +32,8 @@ class WeightedDirectedGraph(Generic[V], Graph[V]):
     def __str__(self) -> str:
         desc = ""
         for i in range(self.vertex_count):
+            if self.is_removed(i):
+                continue
             desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index_with_weights(i)}\n"
             # 예: Seattle -> [('Chicago', 1737.0), ('SF', 678.0)]
         return desc
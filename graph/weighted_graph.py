@@ -5,17 +5,16 @@ from weighted_edge import WeightedEdge
 V = TypeVar('V') # 그래프 정점(vertex) 타입
 
 class WeightedGraph(Generic[V], Graph[V]):
-    def __init__(self, vertices: List[V] = []) -> None:
-        self._vertices: List[V] = vertices
-        self._edges: List[List[WeightedEdge]] = [[] for _ in vertices]
+    def __init__(self, vertices: List[V] = None) -> None:
+        super().__init__(vertices)
 
     def add_edge_by_indices(self, u: int, v: int, weight: float) -> None:
         edge: WeightedEdge = WeightedEdge(u, v, weight)
         self.add_edge(edge) # 슈퍼클래스 메서드 호출
 
     def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self.index_of(first)
+        v: int = self.index_of(second)
         self.add_edge_by_indices(u, v, weight)
 
     def neighbors_for_index_with_weights(self, index: int) -> List[Tuple[V, float]]:
@@ -27,6 +26,8 @@ class WeightedGraph(Generic[V], Graph[V]):
     def __str__(self) -> str:
         desc: str = ""
         for i in range(self.vertex_count):
+            if self.is_removed(i):
+                continue
             desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index_with_weights(i)}\n"
         return desc
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import product, repeat
+from operator import lshift, or_
+import io
+import random
+import time
+from codon_stream import encode_codon, iter_codon_chunks, INVALID_CODON
+from dna_search import Gene, Codon, Nucleotide, string_to_gene, linear_contains, binary_contains, benchmark
+
+MAX_K: int = 10 # 64^10 = 2^60이므로 k-mer 키가 부호 없는 64비트에 들어감
+_INVALID_KEY: int = 1 << (6 * MAX_K) # 잘못된 코돈이 들어간 k-mer
+
+# 코돈 문자열("ACGGAT"), Nucleotide 코돈 하나, 또는 코돈의 나열
+KmerKey = Union[str, Codon, Sequence[Codon]]
+
+# Nucleotide 코돈 -> 코돈 번호 (IntEnum 튜플은 같은 값의 int 튜플과 해시와 비교가 같음)
+_GENE_CODES: Dict[Codon, int] = {codon: encode_codon(codon)
+                                 for codon in product(Nucleotide, repeat=3)} # type: ignore
+
+class _KmerTable:
+    """길이 k인 k-mer 키를 정렬한 배열과, 같은 순서로 늘어놓은 시작 위치(코돈 단위) 배열.
+    같은 키의 위치는 연속된 구간에 오름차순으로 모여 있다."""
+
+    def __init__(self, codons: bytes, k: int) -> None:
+        # i번째 키 = codons[i:i + k]를 코돈 하나에 6비트씩 이어 붙인 값. map으로 한 자리씩 늘려 C 수준에서 계산
+        keys: List[int] = list(codons[:len(codons) - k + 1])
+        for j in range(1, k):
+            keys = list(map(or_, map(lshift, keys, repeat(6)), codons[j:]))
+        # 잘못된 코돈이 들어간 구간은 어떤 키보다 큰 값으로 바꿔 정렬했을 때 맨 뒤로 보냄
+        position: int = codons.find(INVALID_CODON)
+        while position >= 0:
+            for start in range(max(0, position - k + 1), min(position + 1, len(keys))):
+                keys[start] = _INVALID_KEY
+            position = codons.find(INVALID_CODON, position + 1)
+        # 안정 정렬이므로 같은 키 안에서는 시작 위치가 오름차순
+        order: List[int] = sorted(range(len(keys)), key=keys.__getitem__)
+        valid: int = len(keys) - keys.count(_INVALID_KEY)
+        sorted_keys: List[int] = list(map(keys.__getitem__, order[:valid]))
+        self.keys: array = array('Q', sorted_keys)
+        self.positions: array = array('i', order[:valid])
+        # 키 -> 구간 사전은 hash_range를 처음 부를 때 만듦 (이진 검색만 쓰면 메모리를 쓰지 않음)
+        self._begins: Optional[Dict[int, int]] = None
+        self._ends: Optional[Dict[int, int]] = None
+
+    def bisect_range(self, key: int, lo: int = 0) -> Tuple[int, int]:
+        begin: int = bisect_left(self.keys, key, lo)
+        return begin, bisect_right(self.keys, key, begin)
+
+    def hash_range(self, key: int) -> Tuple[int, int]:
+        if self._begins is None or self._ends is None:
+            sorted_keys: List[int] = self.keys.tolist()
+            valid: int = len(sorted_keys)
+            # 키마다 구간 [처음, 끝). 뒤에 나온 값이 덮어쓰므로 끝은 정순으로, 처음은 역순으로 채움
+            self._ends = dict(zip(sorted_keys, range(1, valid + 1)))
+            self._begins = dict(zip(reversed(sorted_keys), range(valid - 1, -1, -1)))
+        return self._begins.get(key, 0), self._ends.get(key, 0)
+
+class CodonIndex:
+    """유전자 하나에 대해 한 번 만들어 두고 계속 쓰는 코돈/k-mer 색인.
+    k마다 정렬된 키 배열과 위치 목록을 처음 질의할 때 만들어 캐시하며,
+    hashed가 True면 키 -> 구간 사전으로, False면 정렬된 배열의 이진 검색으로 찾는다."""
+
+    def __init__(self, codons: bytes, hashed: bool = True) -> None:
+        self._codons: bytes = bytes(codons)
+        self.hashed: bool = hashed
+        self._tables: Dict[int, _KmerTable] = {}
+
+    @classmethod
+    def from_gene(cls, gene: Gene, hashed: bool = True) -> CodonIndex:
+        return cls(bytes(map(_GENE_CODES.__getitem__, gene)), hashed)
+
+    @classmethod
+    def from_sequence(cls, s: str, hashed: bool = True) -> CodonIndex:
+        return cls(b"".join(iter_codon_chunks(io.BytesIO(s.encode()))), hashed)
+
+    def __len__(self) -> int:
+        return len(self._codons)
+
+    # 질의를 (k, 키)로 바꿈
+    def _key(self, kmer: KmerKey) -> Tuple[int, int]:
+        if isinstance(kmer, str):
+            if len(kmer) % 3 != 0:
+                raise ValueError(f"k-mer length must be a multiple of 3: {kmer!r}")
+            codes: List[int] = [encode_codon(kmer[i:i + 3]) for i in range(0, len(kmer), 3)]
+        elif len(kmer) > 0 and isinstance(kmer[0], int): # Nucleotide 코돈 하나
+            codes = [encode_codon(kmer)]
+        else:
+            codes = [encode_codon(codon) for codon in kmer]
+        if not 1 <= len(codes) <= MAX_K:
+            raise ValueError(f"k-mer must have 1 to {MAX_K} codons")
+        key: int = 0
+        for code in codes:
+            key = (key << 6) | code
+        return len(codes), key
+
+    def _table(self, k: int) -> _KmerTable:
+        if k not in self._tables:
+            self._tables[k] = _KmerTable(self._codons, k)
+        return self._tables[k]
+
+    def _range(self, kmer: KmerKey) -> Tuple[_KmerTable, int, int]:
+        k, key = self._key(kmer)
+        table: _KmerTable = self._table(k)
+        begin, end = table.hash_range(key) if self.hashed else table.bisect_range(key)
+        return table, begin, end
+
+    def contains(self, kmer: KmerKey) -> bool:
+        _, begin, end = self._range(kmer)
+        return end > begin
+
+    def count(self, kmer: KmerKey) -> int:
+        _, begin, end = self._range(kmer)
+        return end - begin
+
+    # k-mer가 시작하는 코돈 위치 (오름차순)
+    def positions(self, kmer: KmerKey) -> List[int]:
+        table, begin, end = self._range(kmer)
+        return table.positions[begin:end].tolist()
+
+    # 여러 질의를 한꺼번에 처리. 이진 검색일 때는 같은 k의 키를 정렬해 두고
+    # 앞 질의가 끝난 곳부터 찾으므로 검색 범위가 점점 줄어듦
+    def _ranges(self, kmers: Iterable[KmerKey]) -> List[Tuple[_KmerTable, int, int]]:
+        queries: List[Tuple[int, int]] = [self._key(kmer) for kmer in kmers]
+        if self.hashed:
+            return [(self._table(k), *self._table(k).hash_range(key)) for k, key in queries]
+        results: List[Tuple[_KmerTable, int, int]] = [None] * len(queries) # type: ignore
+        lo: Dict[int, int] = {}
+        for i in sorted(range(len(queries)), key=queries.__getitem__):
+            k, key = queries[i]
+            table: _KmerTable = self._table(k)
+            begin, end = table.bisect_range(key, lo.get(k, 0))
+            lo[k] = begin
+            results[i] = (table, begin, end)
+        return results
+
+    def contains_many(self, kmers: Iterable[KmerKey]) -> List[bool]:
+        return [end > begin for _, begin, end in self._ranges(kmers)]
+
+    def count_many(self, kmers: Iterable[KmerKey]) -> List[int]:
+        return [end - begin for _, begin, end in self._ranges(kmers)]
+
+    def positions_many(self, kmers: Iterable[KmerKey]) -> List[List[int]]:
+        return [table.positions[begin:end].tolist() for table, begin, end in self._ranges(kmers)]
+
+def run_index_benchmark(num_codons: int = 300000, num_queries: int = 64, seed: int = 0) -> None:
+    random.seed(seed)
+    gene: Gene = string_to_gene("".join(random.choices("ACGT", k=num_codons * 3)))
+    # 유전자에 없는 코돈(GGG)으로 선형 검색이 끝까지 돌게 함
+    gene = [codon for codon in gene if codon != (Nucleotide.G, Nucleotide.G, Nucleotide.G)]
+    queries: List[Codon] = [tuple(random.choices(list(Nucleotide), k=3)) for _ in range(num_queries)] # type: ignore
+    print(f"코돈 {len(gene)}개, 질의 {num_queries}개")
+
+    t: float = benchmark(lambda: [linear_contains(gene, q) for q in queries])
+    print(f"linear_contains: {t * 1000:.3f} ms")
+    t = benchmark(lambda: sorted(gene))
+    print(f"sorted(gene) 1회: {t * 1000:.3f} ms (binary_contains를 쓰려면 질의마다 다시 정렬해 왔음)")
+    sorted_gene: Gene = sorted(gene)
+    t = benchmark(lambda: [binary_contains(sorted_gene, q) for q in queries], repeat=20)
+    print(f"binary_contains (정렬된 유전자): {t * 1000:.3f} ms")
+    begin: float = time.perf_counter()
+    hashed: CodonIndex = CodonIndex.from_gene(gene)
+    hashed.contains(queries[0])
+    bisected: CodonIndex = CodonIndex(hashed._codons, hashed=False)
+    bisected.contains(queries[0])
+    print(f"CodonIndex 만들기 (두 가지): {(time.perf_counter() - begin) * 1000:.3f} ms")
+    t = benchmark(lambda: hashed.contains_many(queries), repeat=20)
+    print(f"CodonIndex.contains_many (사전): {t * 1000:.3f} ms")
+    t = benchmark(lambda: bisected.contains_many(queries), repeat=20)
+    print(f"CodonIndex.contains_many (이진 검색): {t * 1000:.3f} ms")
+    t = benchmark(lambda: hashed.count_many(["ACGTTA", "GATACA", "CCCAAATTT"]), repeat=1)
+    print(f"k-mer count_many (k = 2, 3, 처음 만들기 포함): {t * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    run_index_benchmark()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union, BinaryIO
+import os
+import random
+import tempfile
+import time
+
+# 코돈 하나를 0 ~ 63의 정수로 표현 (A=0, C=1, G=2, T=3, 첫 염기가 가장 높은 자리)
+# A, C, G, T가 아닌 염기(N 등)가 섞인 코돈은 INVALID_CODON
+INVALID_CODON: int = 64
+BASES: str = "ACGT"
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+
+CodonKey = Union[str, Sequence[int]] # "ACG" 또는 Nucleotide 튜플 (A=1 ~ T=4)
+
+_INVALID_BASE: int = 4
+_WHITESPACE: bytes = b" \t\r\n"
+# 문자 -> 염기 번호 (0 ~ 3, 그 밖의 문자는 4)
+_BASE_TABLE: bytes = bytes(BASES.index(chr(b).upper()) if chr(b).upper() in BASES else _INVALID_BASE
+                           for b in range(256))
+# 염기 번호 -> 코돈 안에서의 자리 값. 잘못된 염기는 어느 자리에서든 64
+_FIRST: bytes = bytes([0, 16, 32, 48, INVALID_CODON]) + bytes(251)
+_SECOND: bytes = bytes([0, 4, 8, 12, INVALID_CODON]) + bytes(251)
+_THIRD: bytes = bytes([0, 1, 2, 3, INVALID_CODON]) + bytes(251)
+# 세 자리 값의 합 -> 코돈 번호 (64 이상이면 잘못된 염기가 있었던 것)
+_CLAMP: bytes = bytes(range(INVALID_CODON)) + bytes([INVALID_CODON]) * (256 - INVALID_CODON)
+
+def encode_codon(codon: CodonKey) -> int:
+    if isinstance(codon, str):
+        if len(codon) != 3 or any(base not in BASES for base in codon.upper()):
+            raise ValueError(f"not a codon: {codon!r}")
+        bases: List[int] = [BASES.index(base) for base in codon.upper()]
+    else:
+        bases = [int(n) - 1 for n in codon] # Nucleotide는 1부터 시작
+        if len(bases) != 3 or any(not 0 <= b < 4 for b in bases):
+            raise ValueError(f"not a codon: {codon!r}")
+    return bases[0] * 16 + bases[1] * 4 + bases[2]
+
+def decode_codon(code: int) -> str:
+    if not 0 <= code < INVALID_CODON:
+        raise ValueError(f"not a codon code: {code}")
+    return BASES[code >> 4] + BASES[(code >> 2) & 3] + BASES[code & 3]
+
+# 길이가 3의 배수인 염기 번호 버퍼를 코돈 번호 버퍼로 바꿈
+def _pack(bases: bytes) -> bytes:
+    n: int = len(bases) // 3
+    # 자리 값의 합은 바이트마다 최대 192라서 자리올림이 없으므로,
+    # 세 버퍼를 큰 정수로 보고 한 번에 더하면 바이트별 덧셈이 됨
+    total: int = (int.from_bytes(bases[0::3].translate(_FIRST), "big") +
+                  int.from_bytes(bases[1::3].translate(_SECOND), "big") +
+                  int.from_bytes(bases[2::3].translate(_THIRD), "big"))
+    return total.to_bytes(n, "big").translate(_CLAMP)
+
+# FASTA(또는 헤더 없는 서열) 스트림에서 서열 부분만 조각조각 돌려줌
+# 새 레코드의 헤더(">"로 시작하는 줄)를 만나면 None으로 경계를 알림
+def _sequence_pieces(stream: BinaryIO, chunk_size: int) -> Iterator[Optional[bytes]]:
+    in_header: bool = False
+    at_line_start: bool = True
+    while True:
+        chunk: bytes = stream.read(chunk_size)
+        if not chunk:
+            return
+        pos: int = 0
+        while pos < len(chunk):
+            if in_header:
+                end: int = chunk.find(b"\n", pos)
+                if end < 0: # 헤더가 다음 조각까지 이어짐
+                    break
+                pos = end + 1
+                in_header = False
+                at_line_start = True
+            elif at_line_start and chunk[pos] == ord(">"):
+                in_header = True
+                yield None
+            else:
+                header: int = chunk.find(b"\n>", pos)
+                end = len(chunk) if header < 0 else header + 1
+                yield chunk[pos:end]
+                at_line_start = chunk[end - 1] == ord("\n")
+                pos = end
+
+# 스트림을 chunk_size 바이트씩 읽으며 코돈 번호 버퍼를 차례로 돌려줌
+# 각 레코드는 처음부터 세 염기씩 끊고, 레코드 끝에 남는 한두 염기는 버림 (string_to_gene과 같음)
+def iter_codon_chunks(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    carry: bytes = b""
+    for piece in _sequence_pieces(stream, chunk_size):
+        if piece is None:
+            carry = b""
+            continue
+        bases: bytes = carry + piece.translate(_BASE_TABLE, _WHITESPACE)
+        usable: int = len(bases) - len(bases) % 3
+        carry = bases[usable:]
+        if usable > 0:
+            yield _pack(bases[:usable])
+
+# 파일 전체를 코돈 번호 버퍼 하나로 읽음 (코돈 하나에 1바이트)
+def read_codons(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bytearray:
+    codons: bytearray = bytearray()
+    with open(path, "rb") as stream:
+        for chunk in iter_codon_chunks(stream, chunk_size):
+            codons += chunk
+    return codons
+
+# 여러 코돈의 등장 횟수를 파일을 한 번만 훑어서 셈
+def count_codons(path: str, codons: Iterable[CodonKey],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[CodonKey, int]:
+    keys: List[CodonKey] = list(codons)
+    needles: Dict[int, bytes] = {code: bytes([code]) for code in map(encode_codon, keys)}
+    counts: Dict[int, int] = dict.fromkeys(needles, 0)
+    with open(path, "rb") as stream:
+        for chunk in iter_codon_chunks(stream, chunk_size):
+            for code, needle in needles.items():
+                counts[code] += chunk.count(needle)
+    return {key: counts[encode_codon(key)] for key in keys}
+
+# 여러 코돈이 들어 있는지 한 번에 확인. 모두 찾으면 파일을 끝까지 읽지 않음
+def contains_codons(path: str, codons: Iterable[CodonKey],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[CodonKey, bool]:
+    keys: List[CodonKey] = list(codons)
+    missing: Dict[int, bytes] = {code: bytes([code]) for code in map(encode_codon, keys)}
+    with open(path, "rb") as stream:
+        for chunk in iter_codon_chunks(stream, chunk_size):
+            for code in [code for code, needle in missing.items() if needle in chunk]:
+                del missing[code]
+            if not missing:
+                break
+    return {key: encode_codon(key) not in missing for key in keys}
+
+if __name__ == "__main__":
+    random.seed(0)
+    path: str = os.path.join(tempfile.mkdtemp(), "genome.fa")
+    with open(path, "w") as out:
+        for record in range(4):
+            out.write(f">chr{record + 1}\n")
+            for _ in range(50000): # 레코드마다 염기 300만 개 (한 줄에 60개)
+                out.write("".join(random.choices("ACGT", k=60)) + "\n")
+    print(f"{path}: {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+
+    begin: float = time.perf_counter()
+    counts: Dict[CodonKey, int] = count_codons(path, ["ACG", "GAT", "TTT", "CCC"])
+    print(f"count_codons: {counts} ({time.perf_counter() - begin:.3f} 초)")
+    begin = time.perf_counter()
+    found: Dict[CodonKey, bool] = contains_codons(path, [decode_codon(code) for code in range(INVALID_CODON)])
+    print(f"contains_codons (64개): {sum(found.values())}개 찾음 ({time.perf_counter() - begin:.3f} 초)")
+    begin = time.perf_counter()
+    buffer: bytearray = read_codons(path)
+    print(f"read_codons: 코돈 {len(buffer)}개, {len(buffer) / 1024 / 1024:.1f} MiB ({time.perf_counter() - begin:.3f} 초)")
@@ -23,14 +23,6 @@ def linear_contains(gene: Gene, key_codon: Codon) -> bool:
             return True
     return False
 
-gene_str: str = "ACGTGGCTCTCTAACGTACGTACGTACGGGGTTTATATATATACCCTAGGACTCCCTTT"
-my_gene: Gene = string_to_gene(gene_str)
-
-acg: Codon = (Nucleotide.A, Nucleotide.C, Nucleotide.G)
-gat: Codon = (Nucleotide.G, Nucleotide.A, Nucleotide.T)
-print(linear_contains(my_gene, acg)) # 참
-print(linear_contains(my_gene, gat)) # 거짓
-
 def binary_contains(gene: Gene, key_codon: Codon) -> bool:
     low: int = 0
     high: int = len(gene) - 1
@@ -51,16 +43,25 @@ def benchmark(func: Callable[[], Any], repeat: int = 1) -> float:
     end = time.perf_counter()
     return (end - start) / repeat
 
-# 파이썬 표준 라이브러리 bisect 모듈을 사용하여 이진 검색 가능
-my_sorted_gene: Gene = sorted(my_gene)
-print(binary_contains(my_sorted_gene, acg))
-print(binary_contains(my_sorted_gene, gat))
+if __name__ == "__main__":
+    gene_str: str = "ACGTGGCTCTCTAACGTACGTACGTACGGGGTTTATATATATACCCTAGGACTCCCTTT"
+    my_gene: Gene = string_to_gene(gene_str)
+
+    acg: Codon = (Nucleotide.A, Nucleotide.C, Nucleotide.G)
+    gat: Codon = (Nucleotide.G, Nucleotide.A, Nucleotide.T)
+    print(linear_contains(my_gene, acg)) # 참
+    print(linear_contains(my_gene, gat)) # 거짓
+
+    # 파이썬 표준 라이브러리 bisect 모듈을 사용하여 이진 검색 가능
+    my_sorted_gene: Gene = sorted(my_gene)
+    print(binary_contains(my_sorted_gene, acg))
+    print(binary_contains(my_sorted_gene, gat))
 
 
-# 숫자 100만 개 선형 검색 및 이진 검색 비교
-digit_list = [i for i in range(1, 1000000)]
-test_n_small = 30
-t1 = benchmark(lambda: linear_contains(digit_list, 900000), repeat=1)
-print(f"linear_contains({test_n_small}) 1회 평균: {t1 * 1000:.6f} ms")
-t2 = benchmark(lambda: binary_contains(digit_list, 900000), repeat=1)
-print(f"binary_contains({test_n_small}) 1회 평균: {t2 * 1000:.6f} ms")
\ No newline at end of file
+    # 숫자 100만 개 선형 검색 및 이진 검색 비교
+    digit_list = [i for i in range(1, 1000000)]
+    test_n_small = 30
+    t1 = benchmark(lambda: linear_contains(digit_list, 900000), repeat=1)
+    print(f"linear_contains({test_n_small}) 1회 평균: {t1 * 1000:.6f} ms")
+    t2 = benchmark(lambda: binary_contains(digit_list, 900000), repeat=1)
+    print(f"binary_contains({test_n_small}) 1회 평균: {t2 * 1000:.6f} ms")
@@ -0,0 +1,104 @@
+import io
+import random
+from itertools import product
+import pytest
+from dna_search import string_to_gene, Nucleotide, linear_contains, binary_contains
+from codon_stream import (iter_codon_chunks, read_codons, count_codons, contains_codons,
+                          encode_codon, decode_codon, INVALID_CODON)
+from codon_index import CodonIndex
+
+
+def random_bases(seed, length):
+    random.seed(seed)
+    return "".join(random.choices("ACGT", k=length))
+
+
+def codons_of(text, chunk_size):
+    return b"".join(iter_codon_chunks(io.BytesIO(text.encode()), chunk_size))
+
+
+def test_encode_decode():
+    assert encode_codon("AAA") == 0
+    assert encode_codon("TTT") == 63
+    assert encode_codon("acg") == encode_codon((Nucleotide.A, Nucleotide.C, Nucleotide.G))
+    for code in range(INVALID_CODON):
+        assert encode_codon(decode_codon(code)) == code
+    with pytest.raises(ValueError):
+        encode_codon("AN")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+def test_matches_string_to_gene(chunk_size):
+    bases = random_bases(chunk_size, 1000)
+    # 60자씩 줄을 나눈 FASTA와 줄바꿈 없는 서열이 같은 결과를 내야 함
+    fasta = ">seq1 test\n" + "\n".join(bases[i:i + 60] for i in range(0, len(bases), 60)) + "\n"
+    expected = bytes(encode_codon(codon) for codon in string_to_gene(bases))
+    assert codons_of(fasta, chunk_size) == expected
+    assert codons_of(bases, chunk_size) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 5, 1 << 20])
+def test_records_restart_reading_frame(chunk_size):
+    fasta = ">a\nACGTA\n>b > not a header\nGGGTTTC\n>c\n\nCC\n"
+    assert codons_of(fasta, chunk_size) == bytes([encode_codon("ACG"), encode_codon("GGG"),
+                                                  encode_codon("TTT")])
+
+
+def test_invalid_bases_are_marked():
+    assert codons_of("ACGNNNtttACn", 4) == bytes([encode_codon("ACG"), INVALID_CODON,
+                                                  encode_codon("TTT"), INVALID_CODON])
+
+
+def test_file_queries(tmp_path):
+    bases = random_bases(0, 3000)
+    path = tmp_path / "gene.fa"
+    path.write_text(">gene\n" + "\n".join(bases[i:i + 70] for i in range(0, len(bases), 70)) + "\n")
+    gene = string_to_gene(bases)
+    keys = ["ACG", "GAT", (Nucleotide.T, Nucleotide.T, Nucleotide.T)]
+    counts = count_codons(str(path), keys, chunk_size=100)
+    for key in keys:
+        codon = tuple(Nucleotide[b] for b in key) if isinstance(key, str) else key
+        assert counts[key] == gene.count(codon)
+    assert len(read_codons(str(path), chunk_size=100)) == len(gene)
+    found = contains_codons(str(path), ["ACG", "GAT"], chunk_size=100)
+    assert found == {"ACG": True, "GAT": True}
+
+    path.write_text("ACGACG\n")
+    assert contains_codons(str(path), ["ACG", "GAT"]) == {"ACG": True, "GAT": False}
+
+
+@pytest.mark.parametrize("hashed", [True, False])
+def test_codon_index_matches_linear_scan(hashed):
+    bases = random_bases(1, 1500)
+    gene = string_to_gene(bases)
+    index = CodonIndex.from_gene(gene, hashed=hashed)
+    assert len(index) == len(gene)
+    for codon in product(Nucleotide, repeat=3):
+        assert index.contains(codon) == linear_contains(gene, codon)
+        assert index.contains(codon) == binary_contains(sorted(gene), codon)
+        assert index.positions(codon) == [i for i, c in enumerate(gene) if c == codon]
+    for kmer in ["ACGTTA", "GATACA", "CCCAAATTT", "AAAAAAAAAAAA"]:
+        codons = [kmer[i:i + 3] for i in range(0, len(kmer), 3)]
+        expected = [i for i in range(len(gene) - len(codons) + 1)
+                    if all(gene[i + j] == tuple(Nucleotide[b] for b in codons[j]) for j in range(len(codons)))]
+        assert index.positions(kmer) == expected
+        assert index.count(kmer) == len(expected)
+
+
+@pytest.mark.parametrize("hashed", [True, False])
+def test_codon_index_batch_queries(hashed):
+    index = CodonIndex.from_sequence("ACGACGNNNGATACGTTT", hashed=hashed)
+    kmers = ["TTT", "ACG", "GGG", "ACGACG", "ACGGAT", "GATACG"]
+    assert index.count_many(kmers) == [1, 3, 0, 1, 0, 1]
+    assert index.contains_many(kmers) == [True, True, False, True, False, True]
+    assert index.positions_many(kmers) == [[5], [0, 1, 4], [], [0], [], [3]]
+    with pytest.raises(ValueError):
+        index.count("ACGT")
+
+
+def test_binary_search_index_builds_no_hash_tables():
+    index = CodonIndex.from_sequence("ACGACGNNNGATACGTTT", hashed=False)
+    assert index.count_many(["ACG", "ACGACG"]) == [3, 1]
+    assert all(table._begins is None and table._ends is None for table in index._tables.values())
+    hashed = CodonIndex.from_sequence("ACGACGNNNGATACGTTT")
+    assert hashed.count("ACG") == 3 and hashed._tables[1]._begins is not None
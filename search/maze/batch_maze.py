@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import List, Optional
+import time
+from maze import Maze, MazeLocation
+from grid_maze import GridMaze
+
+try:
+    import numpy as np
+except ImportError: # numpy가 없으면 벡터화 생성 경로를 쓸 수 없음
+    np = None
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for vectorized maze generation")
+
+# 시드 하나로 (rows, columns) 크기의 0/1 마스크를 한 번에 뽑음 (1이면 막힌 칸)
+# 같은 시드면 항상 같은 마스크이므로 샘플별로 재현 가능
+def random_blocked_mask(rows: int, columns: int, sparseness: float, seed: int) -> "np.ndarray":
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    return (rng.random((rows, columns)) < sparseness).view(np.uint8)
+
+# 미로 num_samples개의 마스크를 연속된 3차원 버퍼 (num_samples, rows, columns) 하나에 채움
+# i번째 마스크는 random_blocked_mask(..., first_seed + i)와 같음
+def random_blocked_masks(num_samples: int, rows: int, columns: int,
+                         sparseness: float, first_seed: int = 0) -> "np.ndarray":
+    _require_numpy()
+    masks = np.empty((num_samples, rows, columns), dtype=np.uint8)
+    for i in range(num_samples):
+        rng = np.random.default_rng(first_seed + i)
+        np.less(rng.random((rows, columns)), sparseness, out=masks[i].view(np.bool_))
+    return masks
+
+def maze_from_mask(mask: "np.ndarray",
+                   start: MazeLocation = MazeLocation(0, 0),
+                   goal: Optional[MazeLocation] = None) -> Maze:
+    rows, columns = mask.shape
+    if goal is None:
+        goal = MazeLocation(rows - 1, columns - 1)
+    return Maze(rows=rows, columns=columns, start=start, goal=goal, blocked=mask)
+
+def grid_maze_from_mask(mask: "np.ndarray",
+                        start: MazeLocation = MazeLocation(0, 0),
+                        goal: Optional[MazeLocation] = None) -> GridMaze:
+    rows, columns = mask.shape
+    if goal is None:
+        goal = MazeLocation(rows - 1, columns - 1)
+    # 마스크 버퍼를 그대로 복사하므로 칸마다 파이썬 반복을 하지 않음
+    return GridMaze(rows, columns, np.ascontiguousarray(mask).tobytes(), start, goal)
+
+# 3차원 마스크 배치에서 Maze 목록을 만듦
+def mazes_from_masks(masks: "np.ndarray") -> List[Maze]:
+    return [maze_from_mask(mask) for mask in masks]
+
+def grid_mazes_from_masks(masks: "np.ndarray") -> List[GridMaze]:
+    return [grid_maze_from_mask(mask) for mask in masks]
+
+if __name__ == "__main__":
+    rows = columns = 1000
+    begin: float = time.perf_counter()
+    Maze(rows=rows, columns=columns, goal=MazeLocation(rows - 1, columns - 1))
+    print(f"Maze (random.uniform): {time.perf_counter() - begin:.3f} 초")
+    begin = time.perf_counter()
+    maze_from_mask(random_blocked_mask(rows, columns, 0.2, seed=0))
+    print(f"Maze (numpy 마스크): {time.perf_counter() - begin:.3f} 초")
+    begin = time.perf_counter()
+    batch = random_blocked_masks(20, rows, columns, 0.2)
+    grid_mazes_from_masks(batch)
+    print(f"GridMaze 20개 (numpy 배치): {time.perf_counter() - begin:.3f} 초, 버퍼 {batch.nbytes / 1024 / 1024:.1f} MiB")
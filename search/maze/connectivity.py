@@ -0,0 +1,67 @@
+from __future__ import annotations
+from array import array
+from typing import List
+from maze import Maze, MazeLocation, Cell
+
+class UnionFind:
+    """경로 압축(path halving)과 크기 기준 합치기를 쓰는 분리 집합 (정수 원소 0 ~ size - 1)."""
+
+    def __init__(self, size: int) -> None:
+        self._parents: array = array('i', range(size))
+        self._sizes: array = array('i', [1]) * size
+
+    def find(self, x: int) -> int:
+        parents: array = self._parents
+        while parents[x] != x:
+            parents[x] = parents[parents[x]] # 할아버지를 가리키게 하여 경로를 절반으로 줄임
+            x = parents[x]
+        return x
+
+    # 두 원소의 집합을 합치고, 실제로 합쳤다면 True
+    def union(self, a: int, b: int) -> bool:
+        root_a: int = self.find(a)
+        root_b: int = self.find(b)
+        if root_a == root_b:
+            return False
+        if self._sizes[root_a] < self._sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parents[root_b] = root_a # 작은 집합을 큰 집합 아래에 붙임
+        self._sizes[root_a] += self._sizes[root_b]
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+class ConnectivityIndex:
+    """미로의 열린 칸들을 연결 요소로 묶어 두는 인덱스.
+    격자를 한 번 훑어(선형 시간) 만들고 나면, 두 칸이 서로 도달 가능한지
+    탐색 없이 거의 상수 시간에 답한다."""
+
+    def __init__(self, maze: Maze) -> None:
+        self._maze: Maze = maze
+        self._columns: int = maze._columns
+        self._sets: UnionFind = UnionFind(maze._rows * maze._columns)
+        grid: List[List[Cell]] = maze._grid
+        # 각 열린 칸을 위쪽, 왼쪽의 열린 칸과 합침 (모든 인접 쌍을 한 번씩 봄)
+        for row in range(maze._rows):
+            for column in range(maze._columns):
+                if grid[row][column] == Cell.BLOCKED:
+                    continue
+                index: int = row * self._columns + column
+                if row > 0 and grid[row - 1][column] != Cell.BLOCKED:
+                    self._sets.union(index, index - self._columns)
+                if column > 0 and grid[row][column - 1] != Cell.BLOCKED:
+                    self._sets.union(index, index - 1)
+
+    def _index_of(self, ml: MazeLocation) -> int:
+        return ml.row * self._columns + ml.column
+
+    def connected(self, a: MazeLocation, b: MazeLocation) -> bool:
+        if self._maze.is_blocked(a) or self._maze.is_blocked(b):
+            return a == b
+        return self._sets.connected(self._index_of(a), self._index_of(b))
+
+    # 막혀 있던 칸이 열렸을 때 이웃과 합쳐 인덱스를 갱신 (칸이 막히는 경우는 다시 만들어야 함)
+    def open(self, ml: MazeLocation) -> None:
+        for neighbor in self._maze.successors(ml):
+            self._sets.union(self._index_of(ml), self._index_of(neighbor))
@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple, Dict, Iterable
+import random
+from generic_search import IndexedPriorityQueue
+from maze import Maze, MazeLocation
+
+INFINITY: float = float("inf")
+
+Key = Tuple[float, float] # D* Lite의 우선순위 키 (k1, k2)
+
+class DStarLite:
+    """미로가 바뀌어도 탐색 상태(g, rhs, 우선순위 큐)를 유지하는 증분 경로 계획기 (D* Lite).
+    목표 위치에서 거꾸로 탐색하므로, 칸이 막히거나 열리면 영향을 받는 곳만 다시 계산하고
+    시작 위치가 움직여도 처음부터 다시 탐색하지 않는다."""
+
+    def __init__(self, maze: Maze) -> None:
+        self._maze: Maze = maze
+        self.start: MazeLocation = maze.start
+        self.goal: MazeLocation = maze.goal
+        self._g: Dict[MazeLocation, float] = {}
+        self._rhs: Dict[MazeLocation, float] = {self.goal: 0.0}
+        self._km: float = 0.0 # 시작 위치가 움직인 만큼 키에 더하는 보정값
+        self._last_start: MazeLocation = self.start
+        self._queue: IndexedPriorityQueue[MazeLocation] = IndexedPriorityQueue()
+        self._queue.push(self.goal, self._calculate_key(self.goal))
+
+    def _h(self, a: MazeLocation, b: MazeLocation) -> float:
+        return abs(a.row - b.row) + abs(a.column - b.column)
+
+    def _g_of(self, ml: MazeLocation) -> float:
+        return self._g.get(ml, INFINITY)
+
+    def _rhs_of(self, ml: MazeLocation) -> float:
+        return self._rhs.get(ml, INFINITY)
+
+    # 막힌 칸도 포함한 상하좌우 이웃 (막힌 칸으로의 이동 비용은 무한대)
+    def _neighbors(self, ml: MazeLocation) -> List[MazeLocation]:
+        locations: List[MazeLocation] = []
+        if ml.row + 1 < self._maze._rows:
+            locations.append(MazeLocation(ml.row + 1, ml.column))
+        if ml.row - 1 >= 0:
+            locations.append(MazeLocation(ml.row - 1, ml.column))
+        if ml.column + 1 < self._maze._columns:
+            locations.append(MazeLocation(ml.row, ml.column + 1))
+        if ml.column - 1 >= 0:
+            locations.append(MazeLocation(ml.row, ml.column - 1))
+        return locations
+
+    def _cost(self, a: MazeLocation, b: MazeLocation) -> float:
+        if self._maze.is_blocked(a) or self._maze.is_blocked(b):
+            return INFINITY
+        return 1.0
+
+    def _calculate_key(self, ml: MazeLocation) -> Key:
+        best: float = min(self._g_of(ml), self._rhs_of(ml))
+        return best + self._h(self.start, ml) + self._km, best
+
+    # 이웃을 통해 ml에서 목표까지 가는 가장 싼 비용으로 rhs를 다시 계산
+    def _recompute_rhs(self, ml: MazeLocation) -> None:
+        if ml == self.goal:
+            return
+        self._rhs[ml] = min((self._cost(ml, n) + self._g_of(n) for n in self._neighbors(ml)),
+                            default=INFINITY)
+
+    # g와 rhs가 다른(일관되지 않은) 칸만 우선순위 큐에 둠
+    def _update_vertex(self, ml: MazeLocation) -> None:
+        consistent: bool = self._g_of(ml) == self._rhs_of(ml)
+        if not consistent and ml in self._queue:
+            self._queue.update(ml, self._calculate_key(ml))
+        elif not consistent:
+            self._queue.push(ml, self._calculate_key(ml))
+        elif ml in self._queue:
+            self._queue.remove(ml)
+
+    def _compute_shortest_path(self) -> int:
+        expanded: int = 0
+        while not self._queue.empty:
+            u, old_key = self._queue.peek()
+            start_key: Key = self._calculate_key(self.start)
+            if not (old_key < start_key or self._rhs_of(self.start) > self._g_of(self.start)):
+                break
+            expanded += 1
+            new_key: Key = self._calculate_key(u)
+            if old_key < new_key:
+                self._queue.update(u, new_key) # km이 바뀌어 키가 오래된 경우
+            elif self._g_of(u) > self._rhs_of(u):
+                # 과대 추정(overconsistent): g를 rhs로 낮추고 이웃에 전파
+                self._g[u] = self._rhs_of(u)
+                self._queue.remove(u)
+                for n in self._neighbors(u):
+                    if n != self.goal:
+                        self._rhs[n] = min(self._rhs_of(n), self._cost(n, u) + self._g[u])
+                    self._update_vertex(n)
+            else:
+                # 과소 추정(underconsistent): g를 무한대로 올리고 u와 이웃을 다시 계산
+                self._g[u] = INFINITY
+                for n in self._neighbors(u) + [u]:
+                    self._recompute_rhs(n)
+                    self._update_vertex(n)
+        return expanded
+
+    # 현재 미로에서의 최단 경로와 이번 계산에서 확장한 칸 수
+    def plan(self) -> Tuple[Optional[List[MazeLocation]], int]:
+        expanded: int = self._compute_shortest_path()
+        # 시작 위치는 과대 추정 상태로 남을 수 있으므로 g 대신 rhs로 도달 가능 여부를 판단
+        if self._rhs_of(self.start) == INFINITY:
+            return None, expanded
+        path: List[MazeLocation] = [self.start]
+        current: MazeLocation = self.start
+        while current != self.goal:
+            # 비용 + g가 가장 작은 이웃으로 한 칸씩 이동
+            current = min(self._neighbors(current), key=lambda n: self._cost(current, n) + self._g_of(n))
+            path.append(current)
+        return path, expanded
+
+    # 칸 하나를 막거나 비우고, 바뀐 칸과 이웃의 rhs만 고쳐 둠 (다음 plan()에서 복구)
+    def set_blocked(self, ml: MazeLocation, blocked: bool) -> None:
+        if self._maze.is_blocked(ml) == blocked:
+            return
+        # 미로의 처음 시작 위치가 아니라 플래너의 현재 시작 위치와 목표 위치를 막지 못하게 함
+        if ml == self.start or ml == self.goal:
+            raise ValueError("cannot block the current start or goal location")
+        self._maze._set_cell(ml, blocked)
+        for n in self._neighbors(ml) + [ml]:
+            self._recompute_rhs(n)
+            self._update_vertex(n)
+
+    # (위치, 막힘 여부) 목록을 한꺼번에 적용
+    def apply_edits(self, edits: Iterable[Tuple[MazeLocation, bool]]) -> None:
+        for ml, blocked in edits:
+            self.set_blocked(ml, blocked)
+
+    # 경로를 따라 움직인 뒤 새 시작 위치에서 계속 계획
+    def move_start(self, ml: MazeLocation) -> None:
+        if self._maze.is_blocked(ml):
+            raise ValueError("cannot move the start onto a blocked location")
+        self._km += self._h(self._last_start, ml)
+        self._last_start = ml
+        self.start = ml
+
+if __name__ == "__main__":
+    random.seed(0)
+    m: Maze = Maze(rows=20, columns=20, sparseness=0.2, goal=MazeLocation(19, 19))
+    planner: DStarLite = DStarLite(m)
+    path, expanded = planner.plan()
+    print(f"처음 계획: 확장한 칸 수 {expanded}")
+    if path is not None:
+        m.mark(path)
+        print(m)
+        m.clear(path)
+        # 경로 중간의 칸을 막고 영향을 받은 부분만 다시 계획
+        planner.apply_edits([(path[len(path) // 2], True)])
+        path, expanded = planner.plan()
+        print(f"다시 계획: 확장한 칸 수 {expanded}")
+        if path is None:
+            print("길을 찾을 수 없습니다!")
+        else:
+            m.mark(path)
+            print(m)
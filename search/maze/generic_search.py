@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import TypeVar, Iterable, Sequence, Generic, List, Callable, Set, Deque, Dict, Any, Optional, Protocol
+from typing import TypeVar, Iterable, Sequence, Generic, List, Callable, Set, Deque, Dict, Any, Optional, Protocol, Tuple, Iterator
 from heapq import heappush, heappop
+from dataclasses import dataclass, field
+from time import perf_counter
 
 T = TypeVar('T')
 
@@ -52,10 +54,16 @@ class Stack(Generic[T]):
     def pop(self) -> T:
         return self._container.pop()
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
 class Node(Generic[T]):
+    # __dict__ 없이 네 개의 속성만 저장하여 노드 하나당 메모리를 줄임
+    __slots__ = ("state", "parent", "cost", "heuristic")
+
     def __init__(self, state: T, parent: Optional[Node], cost: float = 0.0, heuristic: float = 0.0) -> None:
         self.state: T = state
         self.parent: Optional[Node] = parent
@@ -65,6 +73,59 @@ class Node(Generic[T]):
     def __lt__(self, other: Node) -> bool:
         return(self.cost + self.heuristic) < (other.cost + other.heuristic)
 
+@dataclass
+class SearchStats:
+    """dfs, bfs, astar에 stats로 넘기면 탐색 중 통계를 기록하는 수집기.
+    넘기지 않으면(None) 탐색은 계측 코드 없이 그대로 실행된다."""
+    expansions: int = 0 # 확장(pop)한 노드 수 (visited_count와 같음)
+    peak_frontier: int = 0 # frontier의 최대 크기
+    explored_size: int = 0 # 탐색이 끝났을 때 explored의 크기
+    successors_calls: int = 0
+    heuristic_calls: int = 0
+    successors_time: float = 0.0 # successors 호출에 쓴 시간(초)
+    heuristic_time: float = 0.0 # heuristic 호출에 쓴 시간(초)
+    total_time: float = 0.0 # 탐색 전체 시간(초)
+    _started: float = field(default=0.0, repr=False)
+
+    @property
+    def bookkeeping_time(self) -> float:
+        # frontier, explored 관리 등 successors와 heuristic 이외에 쓴 시간
+        return self.total_time - self.successors_time - self.heuristic_time
+
+    @property
+    def expansions_per_second(self) -> float:
+        return self.expansions / self.total_time if self.total_time > 0 else 0.0
+
+    def start(self) -> None:
+        self._started = perf_counter()
+
+    def finish(self, expansions: int, explored_size: int) -> None:
+        self.total_time = perf_counter() - self._started
+        self.expansions = expansions
+        self.explored_size = explored_size
+
+    def observe_frontier(self, size: int) -> None:
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def timed_successors(self, successors: Callable[[T], List[T]]) -> Callable[[T], List[T]]:
+        def wrapper(state: T) -> List[T]:
+            begin: float = perf_counter()
+            result: List[T] = successors(state)
+            self.successors_time += perf_counter() - begin
+            self.successors_calls += 1
+            return result
+        return wrapper
+
+    def timed_heuristic(self, heuristic: Callable[[T], float]) -> Callable[[T], float]:
+        def wrapper(state: T) -> float:
+            begin: float = perf_counter()
+            result: float = heuristic(state)
+            self.heuristic_time += perf_counter() - begin
+            self.heuristic_calls += 1
+            return result
+        return wrapper
+
 # def dfs(initial: T, goal_test: Callable[[T], bool], successors: Callable[[T], List[T]]) -> Optional[Node[T]]:
 #     # frontier는 아직 방문하지 않은 곳
 #     frontier: Stack[Node[T]] = Stack()
@@ -90,7 +151,15 @@ class Node(Generic[T]):
 # counter 추가
 def dfs(initial: T,
         goal_test: Callable[[T], bool],
-        successors: Callable[[T], List[T]]) -> Tuple[Optional[Node[T]], int]:
+        successors: Callable[[T], List[T]],
+        stats: Optional[SearchStats] = None,
+        reachable: Optional[Callable[[T], bool]] = None) -> Tuple[Optional[Node[T]], int]:
+    # 목표에 도달할 수 없다고 미리 알 수 있다면 (예: Maze.goal_reachable) 탐색하지 않음
+    if reachable is not None and not reachable(initial):
+        return None, 0
+    if stats is not None:
+        stats.start()
+        successors = stats.timed_successors(successors)
     # frontier는 아직 방문하지 않은 곳
     frontier: Stack[Node[T]] = Stack()
     frontier.push(Node(initial, None))
@@ -106,6 +175,8 @@ def dfs(initial: T,
         current_state: T = current_node.state
         # 목표 지점을 찾았다면 종료
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(visited_count, len(explored))
             return current_node, visited_count
         # 방문하지 않은 다음 장소가 있는지 확인
         for child in successors(current_state):
@@ -113,15 +184,23 @@ def dfs(initial: T,
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
-    return None, visited_count 
+        if stats is not None:
+            stats.observe_frontier(len(frontier))
+    if stats is not None:
+        stats.finish(visited_count, len(explored))
+    return None, visited_count
 
 def node_to_path(node: Node[T]) -> List[T]:
-    path: List[T] = [node.state]
-    # 노드 경로를 반전
-    while node.parent is not None:
+    # 먼저 경로 길이를 세고, 미리 할당한 리스트를 뒤에서부터 채움 (append나 reverse 없이)
+    length: int = 1
+    current: Node[T] = node
+    while current.parent is not None:
+        current = current.parent
+        length += 1
+    path: List[T] = [node.state] * length
+    for i in range(length - 2, -1, -1):
         node = node.parent
-        path.append(node.state)
-    path.reverse()
+        path[i] = node.state
     return path
 
 class Queue(Generic[T]):
@@ -138,6 +217,9 @@ class Queue(Generic[T]):
     def pop(self) -> T:
         return self._container.popleft() # 선입선출(FIFO)
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
@@ -166,7 +248,15 @@ class Queue(Generic[T]):
 # counter 추가
 def bfs(initial: T,
         goal_test: Callable[[T], bool],
-        successors: Callable[[T], List[T]]) -> Tuple[Optional[Node[T]], int]:
+        successors: Callable[[T], List[T]],
+        stats: Optional[SearchStats] = None,
+        reachable: Optional[Callable[[T], bool]] = None) -> Tuple[Optional[Node[T]], int]:
+    # 목표에 도달할 수 없다고 미리 알 수 있다면 (예: Maze.goal_reachable) 탐색하지 않음
+    if reachable is not None and not reachable(initial):
+        return None, 0
+    if stats is not None:
+        stats.start()
+        successors = stats.timed_successors(successors)
     # frontier는 아직 방문하지 않은 곳
     frontier: Queue[Node[T]] = Queue()
     frontier.push(Node(initial, None))
@@ -182,6 +272,8 @@ def bfs(initial: T,
         current_state: T = current_node.state
         # 목표 지점을 찾았다면 종료
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(visited_count, len(explored))
             return current_node, visited_count
         # 방문하지 않은 다음 장소가 있는지 확인
         for child in successors(current_state):
@@ -189,6 +281,10 @@ def bfs(initial: T,
                 continue
             explored.add(child)
             frontier.push(Node(child, current_node))
+        if stats is not None:
+            stats.observe_frontier(len(frontier))
+    if stats is not None:
+        stats.finish(visited_count, len(explored))
     return None, visited_count
 
 class PriorityQueue(Generic[T]):
@@ -205,9 +301,132 @@ class PriorityQueue(Generic[T]):
     def pop(self) -> T:
         return heappop(self._container) # 우선순위 pop
 
+    def peek(self) -> T:
+        return self._container[0] # 꺼내지 않고 가장 우선순위가 높은 항목을 확인
+
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
+K = TypeVar('K') # 인덱스 힙의 키 타입
+
+class IndexedPriorityQueue(Generic[K]):
+    """키마다 항목을 하나만 유지하는 이진 힙.
+    키의 힙 위치를 딕셔너리로 기억하므로 contains와 decrease_key가 가능하고,
+    같은 상태가 중복으로 쌓이거나 오래된 항목을 pop하는 일이 없다."""
+
+    def __init__(self) -> None:
+        self._keys: List[K] = []
+        self._priorities: List[Any] = []
+        self._positions: Dict[K, int] = {} # 키 -> 힙 배열에서의 위치
+
+    @property
+    def empty(self) -> bool:
+        return not self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._positions
+
+    def contains(self, key: K) -> bool:
+        return key in self._positions
+
+    def priority(self, key: K) -> Any:
+        return self._priorities[self._positions[key]]
+
+    def push(self, key: K, priority: Any) -> None:
+        if key in self._positions:
+            raise KeyError(f"{key!r} is already in the queue")
+        self._keys.append(key)
+        self._priorities.append(priority)
+        self._positions[key] = len(self._keys) - 1
+        self._sift_up(len(self._keys) - 1)
+
+    def decrease_key(self, key: K, priority: Any) -> None:
+        position: int = self._positions[key]
+        if self._priorities[position] < priority:
+            raise ValueError("new priority is greater than the current priority")
+        self._priorities[position] = priority
+        self._sift_up(position)
+
+    # 우선순위를 올리거나 내리는 일반적인 갱신
+    def update(self, key: K, priority: Any) -> None:
+        position: int = self._positions[key]
+        self._priorities[position] = priority
+        self._sift_up(position)
+        self._sift_down(self._positions[key])
+
+    def remove(self, key: K) -> None:
+        position: int = self._positions.pop(key)
+        last_key: K = self._keys.pop()
+        last_priority: Any = self._priorities.pop()
+        if position < len(self._keys): # 지운 자리에 마지막 항목을 옮기고 위치를 바로잡음
+            self._keys[position] = last_key
+            self._priorities[position] = last_priority
+            self._positions[last_key] = position
+            self._sift_up(position)
+            self._sift_down(self._positions[last_key])
+
+    def peek(self) -> Tuple[K, Any]:
+        return self._keys[0], self._priorities[0]
+
+    def pop(self) -> Tuple[K, Any]:
+        key: K = self._keys[0]
+        priority: Any = self._priorities[0]
+        last_key: K = self._keys.pop()
+        last_priority: Any = self._priorities.pop()
+        del self._positions[key]
+        if self._keys: # 마지막 항목을 루트로 옮기고 아래로 내림
+            self._keys[0] = last_key
+            self._priorities[0] = last_priority
+            self._positions[last_key] = 0
+            self._sift_down(0)
+        return key, priority
+
+    def _sift_up(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        key: K = keys[position]
+        priority: Any = priorities[position]
+        while position > 0:
+            parent: int = (position - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            keys[position] = keys[parent]
+            priorities[position] = priorities[parent]
+            positions[keys[position]] = position
+            position = parent
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+    def _sift_down(self, position: int) -> None:
+        keys, priorities, positions = self._keys, self._priorities, self._positions
+        size: int = len(keys)
+        key: K = keys[position]
+        priority: Any = priorities[position]
+        while True:
+            child: int = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            keys[position] = keys[child]
+            priorities[position] = priorities[child]
+            positions[keys[position]] = position
+            position = child
+        keys[position] = key
+        priorities[position] = priority
+        positions[key] = position
+
+    def __repr__(self) -> str:
+        return repr(list(zip(self._keys, self._priorities)))
+
 # def astar(initial: T, goal_test: Callable[[T], bool], successors: Callable[[T], List[T]], heuristic: Callable[[T], float]) -> Optional[Node[T]]:
 #     # frontier는 방문하지 않은 곳
 #     frontier: PriorityQueue[Node[T]] = PriorityQueue()
@@ -236,33 +455,242 @@ class PriorityQueue(Generic[T]):
 def astar(initial: T,
           goal_test: Callable[[T], bool],
           successors: Callable[[T], List[T]],
-          heuristic: Callable[[T], float]) -> Tuple[Optional[Node[T]], int]:
-    # frontier는 방문하지 않은 곳
-    frontier: PriorityQueue[Node[T]] = PriorityQueue()
-    frontier.push(Node(initial, None, 0.0, heuristic(initial)))
-    # explored는 이미 방문한 곳 (각 state까지의 최소 cost)
-    explored: Dict[T, float] = {initial: 0.0}
+          heuristic: Callable[[T], float],
+          stats: Optional[SearchStats] = None,
+          reachable: Optional[Callable[[T], bool]] = None) -> Tuple[Optional[Node[T]], int]:
+    # 목표에 도달할 수 없다고 미리 알 수 있다면 (예: Maze.goal_reachable) 탐색하지 않음
+    if reachable is not None and not reachable(initial):
+        return None, 0
+    if stats is not None:
+        stats.start()
+        successors = stats.timed_successors(successors)
+        heuristic = stats.timed_heuristic(heuristic)
+    # frontier는 방문하지 않은 곳 (state마다 항목 하나, 비용이 줄면 decrease_key)
+    frontier: IndexedPriorityQueue[T] = IndexedPriorityQueue()
+    start_node: Node[T] = Node(initial, None, 0.0, heuristic(initial))
+    frontier.push(initial, start_node.cost + start_node.heuristic)
+    # explored는 이미 방문한 곳 (각 state까지의 최소 cost를 가진 노드)
+    explored: Dict[T, Node[T]] = {initial: start_node}
 
     visited_count: int = 0  # 🔹 탐색한 지점 수
 
     # 방문할 곳이 더 있는지 탐색
     while not frontier.empty:
-        current_node: Node[T] = frontier.pop()
+        current_state, _ = frontier.pop()
+        current_node: Node[T] = explored[current_state]
         visited_count += 1
-        current_state: T = current_node.state
         # 목표 지점을 찾았다면 종료
         if goal_test(current_state):
+            if stats is not None:
+                stats.finish(visited_count, len(explored))
             return current_node, visited_count
         # 방문하지 않은 다음 장소가 있는지 확인    
         for child in successors(current_state):
             # 현재 장소에서 갈 수 있는 다음 장소의 비용은 1이라고 가정
             new_cost: float = current_node.cost + 1
 
-            if child not in explored or explored[child] > new_cost:
-                explored[child] = new_cost
-                frontier.push(Node(child, current_node, new_cost, heuristic(child)))
+            if child not in explored:
+                child_node: Node[T] = Node(child, current_node, new_cost, heuristic(child))
+            elif explored[child].cost > new_cost:
+                # 휴리스틱 값은 state에만 의존하므로 다시 계산하지 않음
+                child_node = Node(child, current_node, new_cost, explored[child].heuristic)
+            else:
+                continue
+            explored[child] = child_node
+            if child in frontier:
+                frontier.decrease_key(child, new_cost + child_node.heuristic)
+            else:
+                frontier.push(child, new_cost + child_node.heuristic)
+        if stats is not None:
+            stats.observe_frontier(len(frontier))
+    if stats is not None:
+        stats.finish(visited_count, len(explored))
+    return None, visited_count
+
+# 양쪽에서 만난 두 노드 체인을 initial -> goal 하나의 체인으로 이어 붙임
+def _join_nodes(forward: Node[T], backward: Node[T]) -> Node[T]:
+    node: Node[T] = forward
+    previous: Node[T] = backward
+    while previous.parent is not None:
+        step: Node[T] = previous.parent
+        node = Node(step.state, node, node.cost + (previous.cost - step.cost))
+        previous = step
+    return node
+
+# frontier의 한 층(level)을 통째로 확장하고, 가장 짧은 만남 지점을 반환
+def _expand_level(frontier: Queue[Node[T]],
+                  explored: Dict[T, Node[T]],
+                  other_explored: Dict[T, Node[T]],
+                  neighbors: Callable[[T], List[T]]) -> Tuple[Optional[Tuple[Node[T], Node[T]]], int]:
+    meeting: Optional[Tuple[Node[T], Node[T]]] = None
+    expanded: int = 0
+    for _ in range(len(frontier)):
+        current_node: Node[T] = frontier.pop()
+        expanded += 1
+        for child in neighbors(current_node.state):
+            if child in explored:
+                continue
+            child_node: Node[T] = Node(child, current_node, current_node.cost + 1)
+            explored[child] = child_node
+            frontier.push(child_node)
+            # 반대쪽에서 이미 도달한 곳이라면 두 탐색이 만남
+            if child in other_explored:
+                other: Node[T] = other_explored[child]
+                if meeting is None or child_node.cost + other.cost < meeting[0].cost + meeting[1].cost:
+                    meeting = (child_node, other)
+    return meeting, expanded
+
+def bidirectional_bfs(initial: T,
+                      goal: T,
+                      successors: Callable[[T], List[T]],
+                      predecessors: Optional[Callable[[T], List[T]]] = None) -> Tuple[Optional[Node[T]], int]:
+    # 무향 상태 공간이라면 역방향 이웃은 순방향 이웃과 같음
+    if predecessors is None:
+        predecessors = successors
+    if initial == goal:
+        return Node(initial, None), 1
+    # 각 방향의 frontier와 explored (explored는 state -> 해당 방향의 노드)
+    forward_start: Node[T] = Node(initial, None)
+    backward_start: Node[T] = Node(goal, None)
+    forward_frontier: Queue[Node[T]] = Queue()
+    backward_frontier: Queue[Node[T]] = Queue()
+    forward_frontier.push(forward_start)
+    backward_frontier.push(backward_start)
+    forward_explored: Dict[T, Node[T]] = {initial: forward_start}
+    backward_explored: Dict[T, Node[T]] = {goal: backward_start}
+
+    visited_count: int = 0
+
+    # 한쪽이라도 더 갈 곳이 없으면 두 탐색은 만날 수 없음
+    while not forward_frontier.empty and not backward_frontier.empty:
+        # 더 작은 쪽 frontier를 한 층 확장
+        if len(forward_frontier) <= len(backward_frontier):
+            meeting, expanded = _expand_level(forward_frontier, forward_explored, backward_explored, successors)
+            visited_count += expanded
+            if meeting is not None:
+                return _join_nodes(meeting[0], meeting[1]), visited_count
+        else:
+            meeting, expanded = _expand_level(backward_frontier, backward_explored, forward_explored, predecessors)
+            visited_count += expanded
+            if meeting is not None:
+                return _join_nodes(meeting[1], meeting[0]), visited_count
     return None, visited_count
 
+def bidirectional_astar(initial: T,
+                        goal: T,
+                        successors: Callable[[T], List[T]],
+                        heuristic: Callable[[T], float],
+                        reverse_heuristic: Callable[[T], float],
+                        predecessors: Optional[Callable[[T], List[T]]] = None) -> Tuple[Optional[Node[T]], int]:
+    # heuristic은 goal까지, reverse_heuristic은 initial까지의 추정 거리
+    if predecessors is None:
+        predecessors = successors
+    forward_frontier: PriorityQueue[Node[T]] = PriorityQueue()
+    backward_frontier: PriorityQueue[Node[T]] = PriorityQueue()
+    forward_start: Node[T] = Node(initial, None, 0.0, heuristic(initial))
+    backward_start: Node[T] = Node(goal, None, 0.0, reverse_heuristic(goal))
+    forward_frontier.push(forward_start)
+    backward_frontier.push(backward_start)
+    forward_explored: Dict[T, Node[T]] = {initial: forward_start}
+    backward_explored: Dict[T, Node[T]] = {goal: backward_start}
+    # 지금까지 찾은 가장 짧은 경로와 그 비용
+    best: Optional[Tuple[Node[T], Node[T]]] = (forward_start, backward_start) if initial == goal else None
+    best_cost: float = 0.0 if best is not None else float("inf")
+
+    visited_count: int = 0
+
+    while not forward_frontier.empty and not backward_frontier.empty:
+        # 어느 한쪽의 최소 f 값이 best_cost 이상이면 더 짧은 경로는 없음 (일관된 휴리스틱 가정)
+        forward_top: Node[T] = forward_frontier.peek()
+        backward_top: Node[T] = backward_frontier.peek()
+        if max(forward_top.cost + forward_top.heuristic,
+               backward_top.cost + backward_top.heuristic) >= best_cost:
+            break
+        # 더 작은 쪽 frontier를 한 노드 확장
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, explored, other_explored = forward_frontier, forward_explored, backward_explored
+            neighbors, estimate, forward = successors, heuristic, True
+        else:
+            frontier, explored, other_explored = backward_frontier, backward_explored, forward_explored
+            neighbors, estimate, forward = predecessors, reverse_heuristic, False
+        current_node: Node[T] = frontier.pop()
+        if explored[current_node.state] is not current_node:
+            continue # 더 싼 비용으로 다시 넣어진 오래된 항목
+        visited_count += 1
+        for child in neighbors(current_node.state):
+            # 현재 장소에서 갈 수 있는 다음 장소의 비용은 1이라고 가정
+            new_cost: float = current_node.cost + 1
+            if child not in explored or explored[child].cost > new_cost:
+                child_node: Node[T] = Node(child, current_node, new_cost, estimate(child))
+                explored[child] = child_node
+                frontier.push(child_node)
+                if child in other_explored and new_cost + other_explored[child].cost < best_cost:
+                    best_cost = new_cost + other_explored[child].cost
+                    best = (child_node, other_explored[child]) if forward else (other_explored[child], child_node)
+    if best is None:
+        return None, visited_count
+    return _join_nodes(best[0], best[1]), visited_count
+
+# 자식 반복자가 끝났음을 나타내는 표식
+_EXHAUSTED: Any = object()
+
+# 반복적 깊이 심화 A* (IDA*): f = g + h 한계를 늘려가며 깊이 우선 탐색
+# explored나 우선순위 큐 없이 현재 경로만 저장하므로 메모리는 O(깊이)
+def ida_star(initial: T,
+             goal_test: Callable[[T], bool],
+             successors: Callable[[T], List[T]],
+             heuristic: Callable[[T], float],
+             reachable: Optional[Callable[[T], bool]] = None) -> Tuple[Optional[Node[T]], int]:
+    # 목표에 도달할 수 없다고 미리 알 수 있다면 (예: Maze.goal_reachable) 탐색하지 않음
+    if reachable is not None and not reachable(initial):
+        return None, 0
+    bound: float = heuristic(initial) # 첫 번째 f 한계
+
+    visited_count: int = 0  # 🔹 탐색한 지점 수 (반복마다 다시 방문한 지점도 셈)
+
+    while True:
+        visited_count += 1
+        if goal_test(initial):
+            return Node(initial, None), visited_count
+        # 다음 반복에서 쓸 한계: 이번 한계를 넘은 f 값 중 가장 작은 값
+        next_bound: float = float("inf")
+        # 현재 경로와 경로 위 상태들 (경로 위의 상태로 되돌아가는 순환은 건너뜀)
+        path: List[T] = [initial]
+        on_path: Set[T] = {initial}
+        # 경로의 각 상태마다 (그 상태까지의 비용, 아직 보지 않은 자식 반복자)
+        stack: List[Tuple[float, Iterator[T]]] = [(0.0, iter(successors(initial)))]
+        while stack:
+            cost, children = stack[-1]
+            child: T = next(children, _EXHAUSTED)
+            if child is _EXHAUSTED:
+                # 모든 자식을 봤으므로 한 단계 되돌아감
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+            if child in on_path:
+                continue
+            # 현재 장소에서 갈 수 있는 다음 장소의 비용은 1이라고 가정
+            new_cost: float = cost + 1
+            f: float = new_cost + heuristic(child)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+            visited_count += 1
+            path.append(child)
+            on_path.add(child)
+            if goal_test(child):
+                return _path_to_node(path), visited_count
+            stack.append((new_cost, iter(successors(child))))
+        if next_bound == float("inf"):
+            return None, visited_count # 한계를 넘은 곳도 없으므로 목표에 도달할 수 없음
+        bound = next_bound
+
+def _path_to_node(path: List[T]) -> Node[T]:
+    node: Node[T] = Node(path[0], None)
+    for state in path[1:]:
+        node = Node(state, node, node.cost + 1)
+    return node
+
 if __name__ == "__main__":
     print(linear_contains([1, 5, 15, 15, 15, 15, 20], 5))
     print(binary_contains(["a", "d,", "e", "f", "z"], "f"))
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple, Sequence
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+import random
+from maze import Maze, MazeLocation, Cell
+
+# bytearray 한 칸의 값
+OPEN: int = 0
+BLOCKED: int = 1
+
+class GridMaze:
+    """Maze의 격자를 테두리가 막힌 bytearray 하나로 펼친 표현.
+    위치는 MazeLocation 대신 정수 인덱스(flat index)로 다루고,
+    이웃은 미리 계산한 오프셋 테이블로 찾으므로 경계 검사가 필요 없다."""
+
+    def __init__(self, rows: int, columns: int, blocked: Sequence[int],
+                 start: MazeLocation, goal: MazeLocation) -> None:
+        self._rows: int = rows
+        self._columns: int = columns
+        # 좌우에 한 칸씩 테두리를 둔 너비
+        self._width: int = columns + 2
+        # 테두리까지 포함한 (rows + 2) x (columns + 2) 격자를 막힌 칸으로 채움
+        self._cells: bytearray = bytearray([BLOCKED]) * (self._width * (rows + 2))
+        # blocked는 행 우선(row-major) 순서의 0/1 값
+        for row in range(rows):
+            begin: int = (row + 1) * self._width + 1
+            self._cells[begin:begin + columns] = bytes(blocked[row * columns:(row + 1) * columns])
+        # 아래, 위, 오른쪽, 왼쪽 (Maze.successors와 같은 순서)
+        self._offsets: Tuple[int, ...] = (self._width, -self._width, 1, -1)
+        self.start: int = self.index_of(start)
+        self.goal: int = self.index_of(goal)
+        # 시작 위치와 목표 위치는 항상 열려 있음
+        self._cells[self.start] = OPEN
+        self._cells[self.goal] = OPEN
+
+    @classmethod
+    def from_maze(cls, maze: Maze) -> GridMaze:
+        blocked: bytearray = bytearray(BLOCKED if cell == Cell.BLOCKED else OPEN
+                                       for row in maze._grid for cell in row)
+        return cls(maze._rows, maze._columns, blocked, maze.start, maze.goal)
+
+    @classmethod
+    def random(cls, rows: int = 10, columns: int = 10, sparseness: float = 0.2,
+               start: MazeLocation = MazeLocation(0, 0),
+               goal: MazeLocation = MazeLocation(9, 9)) -> GridMaze:
+        # Maze._randomly_fill과 같은 순서로 난수를 뽑으므로 같은 시드면 같은 미로가 만들어짐
+        blocked: bytearray = bytearray(BLOCKED if random.uniform(0, 1.0) < sparseness else OPEN
+                                       for _ in range(rows * columns))
+        return cls(rows, columns, blocked, start, goal)
+
+    @property
+    def size(self) -> int:
+        return len(self._cells) # 테두리를 포함한 전체 칸 수
+
+    def index_of(self, ml: MazeLocation) -> int:
+        return (ml.row + 1) * self._width + ml.column + 1
+
+    def location_at(self, index: int) -> MazeLocation:
+        row, column = divmod(index, self._width)
+        return MazeLocation(row - 1, column - 1)
+
+    def is_open(self, index: int) -> bool:
+        return self._cells[index] == OPEN
+
+    def goal_test(self, index: int) -> bool:
+        return index == self.goal
+
+    # generic_search의 함수에도 그대로 넘길 수 있는 정수 버전 successors
+    def successors(self, index: int) -> List[int]:
+        cells: bytearray = self._cells
+        return [index + offset for offset in self._offsets if cells[index + offset] == OPEN]
+
+    def manhattan_distance(self, index: int) -> int:
+        row, column = divmod(index, self._width)
+        goal_row, goal_column = divmod(self.goal, self._width)
+        return abs(row - goal_row) + abs(column - goal_column)
+
+    # 부모 인덱스 배열을 따라가며 MazeLocation 경로로 변환 (Maze.mark/clear에 사용)
+    def path_to(self, parents: array, index: int) -> List[MazeLocation]:
+        path: List[MazeLocation] = [self.location_at(index)]
+        while parents[index] != index:
+            index = parents[index]
+            path.append(self.location_at(index))
+        path.reverse()
+        return path
+
+    def __str__(self) -> str:
+        output: str = ""
+        for row in range(self._rows):
+            begin: int = (row + 1) * self._width + 1
+            output += "".join(Cell.BLOCKED.value if c == BLOCKED else Cell.EMPTY.value
+                              for c in self._cells[begin:begin + self._columns]) + "\n"
+        return output
+
+# 아직 도달하지 못한(또는 도달할 수 없는) 칸의 거리
+UNREACHABLE: int = -1
+
+class DistanceField:
+    """하나 이상의 출발점(보통 목표 위치들)에서 BFS로 퍼져 나간 거리를 칸마다 저장한 배열.
+    한 번 만들어 두면 어떤 시작 위치에서든 거리가 1씩 줄어드는 이웃을 따라가는
+    O(경로 길이) 걸음으로 가장 가까운 출발점까지의 최단 경로를 얻을 수 있다."""
+
+    def __init__(self, gm: GridMaze, sources: Sequence[MazeLocation]) -> None:
+        self._maze: GridMaze = gm
+        self.sources: List[MazeLocation] = list(sources)
+        self._distances: array = array('i', [UNREACHABLE]) * gm.size
+        cells: bytearray = gm._cells
+        offsets: Tuple[int, ...] = gm._offsets
+        distances: array = self._distances
+        # 모든 출발점을 거리 0으로 하는 다중 출발점 BFS (flood fill)
+        frontier: deque = deque()
+        for source in self.sources:
+            index: int = gm.index_of(source)
+            if cells[index] == OPEN and distances[index] == UNREACHABLE:
+                distances[index] = 0
+                frontier.append(index)
+        while frontier:
+            current: int = frontier.popleft()
+            next_distance: int = distances[current] + 1
+            for offset in offsets:
+                child: int = current + offset
+                if cells[child] == OPEN and distances[child] == UNREACHABLE:
+                    distances[child] = next_distance
+                    frontier.append(child)
+
+    def distance(self, ml: MazeLocation) -> Optional[int]:
+        d: int = self._distances[self._maze.index_of(ml)]
+        return None if d == UNREACHABLE else d
+
+    # ml에서 가장 가까운 출발점까지 거리가 줄어드는 방향으로 걸어가는 경로
+    def path_from(self, ml: MazeLocation) -> Optional[List[MazeLocation]]:
+        gm: GridMaze = self._maze
+        distances: array = self._distances
+        index: int = gm.index_of(ml)
+        if distances[index] == UNREACHABLE:
+            return None
+        path: List[MazeLocation] = [ml]
+        while distances[index] > 0:
+            target: int = distances[index] - 1
+            for offset in gm._offsets:
+                if distances[index + offset] == target:
+                    index += offset
+                    break
+            path.append(gm.location_at(index))
+        return path
+
+def _new_parents(gm: GridMaze) -> array:
+    parents: array = array('i', [-1]) * gm.size
+    parents[gm.start] = gm.start # 시작 위치는 자기 자신을 부모로 가짐
+    return parents
+
+def grid_dfs(gm: GridMaze) -> Tuple[Optional[List[MazeLocation]], int]:
+    cells: bytearray = gm._cells
+    offsets: Tuple[int, ...] = gm._offsets
+    goal: int = gm.goal
+    parents: array = _new_parents(gm)
+    frontier: List[int] = [gm.start]
+
+    visited_count: int = 0
+    while frontier:
+        current: int = frontier.pop()
+        visited_count += 1
+        if current == goal:
+            return gm.path_to(parents, current), visited_count
+        for offset in offsets:
+            child: int = current + offset
+            # 막힌 칸이거나 이미 방문한 칸은 건너뜀
+            if cells[child] != OPEN or parents[child] != -1:
+                continue
+            parents[child] = current
+            frontier.append(child)
+    return None, visited_count
+
+def grid_bfs(gm: GridMaze) -> Tuple[Optional[List[MazeLocation]], int]:
+    cells: bytearray = gm._cells
+    offsets: Tuple[int, ...] = gm._offsets
+    goal: int = gm.goal
+    parents: array = _new_parents(gm)
+    frontier: deque = deque([gm.start])
+
+    visited_count: int = 0
+    while frontier:
+        current: int = frontier.popleft()
+        visited_count += 1
+        if current == goal:
+            return gm.path_to(parents, current), visited_count
+        for offset in offsets:
+            child: int = current + offset
+            if cells[child] != OPEN or parents[child] != -1:
+                continue
+            parents[child] = current
+            frontier.append(child)
+    return None, visited_count
+
+def grid_astar(gm: GridMaze) -> Tuple[Optional[List[MazeLocation]], int]:
+    cells: bytearray = gm._cells
+    offsets: Tuple[int, ...] = gm._offsets
+    width: int = gm._width
+    goal: int = gm.goal
+    goal_row, goal_column = divmod(goal, width)
+    parents: array = _new_parents(gm)
+    # 시작 위치에서 각 칸까지의 최소 비용 (-1은 아직 모름)
+    costs: array = array('i', [-1]) * gm.size
+    costs[gm.start] = 0
+    closed: bytearray = bytearray(gm.size)
+    # (f = g + h, 인덱스) 튜플을 힙에 저장
+    frontier: List[Tuple[int, int]] = [(gm.manhattan_distance(gm.start), gm.start)]
+
+    visited_count: int = 0
+    while frontier:
+        _, current = heappop(frontier)
+        if closed[current]:
+            continue # 더 싼 비용으로 이미 방문한 칸
+        closed[current] = 1
+        visited_count += 1
+        if current == goal:
+            return gm.path_to(parents, current), visited_count
+        new_cost: int = costs[current] + 1 # 이웃 칸까지의 비용은 1
+        for offset in offsets:
+            child: int = current + offset
+            if cells[child] != OPEN or closed[child]:
+                continue
+            if costs[child] == -1 or costs[child] > new_cost:
+                costs[child] = new_cost
+                parents[child] = current
+                row, column = divmod(child, width)
+                heappush(frontier, (new_cost + abs(row - goal_row) + abs(column - goal_column), child))
+    return None, visited_count
+
+if __name__ == "__main__":
+    m: Maze = Maze()
+    gm: GridMaze = GridMaze.from_maze(m)
+    path, visited = grid_astar(gm)
+    if path is None:
+        print("A* 알고리즘으로 길을 찾을 수 없습니다!")
+    else:
+        m.mark(path)
+        print(f"방문한 지점 수: {visited}")
+        print(m)
@@ -1,9 +1,14 @@
 from enum import Enum
-from typing import List, NamedTuple, Callable, Optional
+from typing import List, NamedTuple, Callable, Optional, Tuple, Dict, Set, Any, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from heapq import heappush, heappop
 import random
+import time
+import argparse
 from math import sqrt
 import statistics
-from generic_search import dfs, bfs, node_to_path, astar, Node
+from generic_search import dfs, bfs, node_to_path, astar, Node, bidirectional_bfs, bidirectional_astar
 # from generic_search import dfs, Node, node_to_path, bfs
 
 class Cell(str, Enum):
@@ -17,23 +22,35 @@ class MazeLocation(NamedTuple):
     row: int
     column: int
 
+# 마스크 값(0 또는 1)에 해당하는 칸
+_MASK_CELLS: Tuple[Cell, Cell] = (Cell.EMPTY, Cell.BLOCKED)
+
 class Maze:
     def __init__(self, rows: int = 10, columns: int = 10,
                  sparseness: float = 0.2,
                  start: MazeLocation = MazeLocation(0, 0),
-                 goal: MazeLocation = MazeLocation(9, 9)) -> None:
+                 goal: MazeLocation = MazeLocation(9, 9),
+                 blocked: Optional[Sequence[Sequence[int]]] = None) -> None:
         # 기본 인스턴스 변수 초기화
         self._rows: int = rows
         self._columns: int = columns
         self.start: MazeLocation = start
         self.goal: MazeLocation = goal
-        # 격자를 빈 공간으로 채움
-        self._grid: List[List[Cell]] = [[Cell.EMPTY for c in range(columns)] for r in range(rows)]
-        # 격자에 막힌 공간을 무작위로 채움
-        self._randomly_fill(rows, columns, sparseness)
+        if blocked is None:
+            # 격자를 빈 공간으로 채움
+            self._grid: List[List[Cell]] = [[Cell.EMPTY for c in range(columns)] for r in range(rows)]
+            # 격자에 막힌 공간을 무작위로 채움
+            self._randomly_fill(rows, columns, sparseness)
+        else:
+            # 미리 만든 0/1 마스크(행 목록, 1이면 막힌 칸)로 격자를 채움 (sparseness는 무시)
+            self._grid = [list(map(_MASK_CELLS.__getitem__, bytes(row))) for row in blocked]
         # 시작 위치와 목표 위치를 설정
         self._grid[start.row][start.column] = Cell.START
         self._grid[goal.row][goal.column] = Cell.GOAL
+        # 막힌 칸 배치가 같은 동안 재사용하는 거리 필드 (출발점 목록 -> DistanceField)
+        self._distance_fields: Dict[Tuple[MazeLocation, ...], Any] = {}
+        # 한 번 만들어 두는 연결 요소 인덱스 (ConnectivityIndex)
+        self._connectivity: Optional[Any] = None
 
     def _randomly_fill(self, rows: int, columns: int, sparseness: float):
         for row in range(rows):
@@ -74,6 +91,43 @@ class Maze:
         self._grid[self.start.row][self.start.column] = Cell.START
         self._grid[self.goal.row][self.goal.column] = Cell.GOAL
 
+    # 칸을 막거나(blocked=True) 다시 비움. 시작 위치와 목표 위치는 바꿀 수 없음
+    def set_blocked(self, ml: MazeLocation, blocked: bool) -> None:
+        if ml == self.start or ml == self.goal:
+            raise ValueError("cannot block the start or goal location")
+        self._set_cell(ml, blocked)
+
+    # 시작, 목표 위치 검사 없이 칸을 바꾸고 캐시를 정리 (시작 위치가 움직이는 DStarLite가 직접 씀)
+    def _set_cell(self, ml: MazeLocation, blocked: bool) -> None:
+        self._grid[ml.row][ml.column] = Cell.BLOCKED if blocked else Cell.EMPTY
+        self._distance_fields.clear() # 막힌 칸 배치가 바뀌었으므로 캐시된 거리 필드는 무효
+        if blocked:
+            self._connectivity = None # 연결 요소가 나뉠 수 있으므로 다음에 다시 만듦
+        elif self._connectivity is not None:
+            self._connectivity.open(ml) # 열린 칸은 이웃과 합치기만 하면 됨
+
+    def is_blocked(self, ml: MazeLocation) -> bool:
+        return self._grid[ml.row][ml.column] == Cell.BLOCKED
+
+    def connectivity(self) -> Any:
+        from connectivity import ConnectivityIndex # connectivity가 maze를 import하므로 여기서 import
+        if self._connectivity is None:
+            self._connectivity = ConnectivityIndex(self)
+        return self._connectivity
+
+    # ml에서 목표 위치까지 길이 있는지 (탐색 함수의 reachable 인자로 넘길 수 있음)
+    def goal_reachable(self, ml: MazeLocation) -> bool:
+        return self.connectivity().connected(ml, self.goal)
+
+    # goals(기본값은 목표 위치)에서 퍼져 나간 거리 필드를 만들고 캐시에 저장
+    # 이후 임의의 시작 위치에 대한 질의는 field.path_from(location)으로 탐색 없이 답할 수 있음
+    def distance_field(self, goals: Optional[List[MazeLocation]] = None) -> Any:
+        from grid_maze import GridMaze, DistanceField # grid_maze가 maze를 import하므로 여기서 import
+        key: Tuple[MazeLocation, ...] = tuple(sorted(set(goals if goals is not None else [self.goal])))
+        if key not in self._distance_fields:
+            self._distance_fields[key] = DistanceField(GridMaze.from_maze(self), key)
+        return self._distance_fields[key]
+
 def euclidean_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
     def distance(ml: MazeLocation) -> float:
         xdist: int = ml.column - goal.column
@@ -88,53 +142,199 @@ def manhattan_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
         return (xdist + ydist)
     return distance
 
-def run_maze_experiments(num_samples: int = 100,
-                         rows: int = 10,
-                         columns: int = 10,
-                         sparseness: float = 0.2) -> None:
-    dfs_counts: List[int] = []
-    bfs_counts: List[int] = []
-    astar_counts: List[int] = []
+# 점프 포인트 탐색(Jump Point Search): 비용이 균일한 4방향 격자 전용 A*
+# 대칭인 경로를 가지치기하고, 방향이 바뀔 수 있는 점프 포인트만 우선순위 큐에 넣음
+def jps(maze: Maze) -> Tuple[Optional[List[MazeLocation]], int]:
+    grid: List[List[Cell]] = maze._grid
+    rows: int = maze._rows
+    columns: int = maze._columns
+    goal: Tuple[int, int] = (maze.goal.row, maze.goal.column)
+
+    def walkable(row: int, column: int) -> bool:
+        return 0 <= row < rows and 0 <= column < columns and grid[row][column] != Cell.BLOCKED
+
+    # 가로로 계속 전진하다가 점프 포인트를 만나면 반환
+    def jump_horizontal(row: int, column: int, dc: int) -> Optional[Tuple[int, int]]:
+        while walkable(row, column):
+            if (row, column) == goal:
+                return row, column
+            # 뒤쪽에서 막혀 있던 위/아래 칸이 열렸다면 강제 이웃(forced neighbor)
+            if ((walkable(row - 1, column) and not walkable(row - 1, column - dc)) or
+                    (walkable(row + 1, column) and not walkable(row + 1, column - dc))):
+                return row, column
+            column += dc
+        return None
+
+    # 세로로 전진하면서, 각 칸에서 가로 방향 점프 포인트가 있는지도 확인
+    def jump_vertical(row: int, column: int, dr: int) -> Optional[Tuple[int, int]]:
+        while walkable(row, column):
+            if (row, column) == goal:
+                return row, column
+            if ((walkable(row, column - 1) and not walkable(row - dr, column - 1)) or
+                    (walkable(row, column + 1) and not walkable(row - dr, column + 1))):
+                return row, column
+            if (jump_horizontal(row, column + 1, 1) is not None or
+                    jump_horizontal(row, column - 1, -1) is not None):
+                return row, column
+            row += dr
+        return None
+
+    def jump(row: int, column: int, dr: int, dc: int) -> Optional[Tuple[int, int]]:
+        if dc != 0:
+            return jump_horizontal(row + dr, column + dc, dc)
+        return jump_vertical(row + dr, column + dc, dr)
+
+    # 부모에서 온 방향을 보고 가지치기된 탐색 방향만 반환
+    def directions(point: Tuple[int, int]) -> List[Tuple[int, int]]:
+        parent: Optional[Tuple[int, int]] = parents[point]
+        if parent is None:
+            return [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        dr: int = (point[0] > parent[0]) - (point[0] < parent[0])
+        dc: int = (point[1] > parent[1]) - (point[1] < parent[1])
+        if dc != 0:
+            return [(1, 0), (-1, 0), (0, dc)]
+        return [(0, 1), (0, -1), (dr, 0)]
+
+    def h(point: Tuple[int, int]) -> int:
+        return abs(point[0] - goal[0]) + abs(point[1] - goal[1])
 
-    dfs_fail = bfs_fail = astar_fail = 0
+    start: Tuple[int, int] = (maze.start.row, maze.start.column)
+    parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+    costs: Dict[Tuple[int, int], int] = {start: 0}
+    closed: Set[Tuple[int, int]] = set()
+    frontier: List[Tuple[int, Tuple[int, int]]] = [(h(start), start)]
 
-    for i in range(num_samples):
+    visited_count: int = 0  # 🔹 확장한 점프 포인트 수
+
+    while frontier:
+        _, current = heappop(frontier)
+        if current in closed:
+            continue
+        closed.add(current)
+        visited_count += 1
+        if current == goal:
+            return _jump_points_to_path(current, parents), visited_count
+        for dr, dc in directions(current):
+            if not walkable(current[0] + dr, current[1] + dc):
+                continue
+            point: Optional[Tuple[int, int]] = jump(current[0], current[1], dr, dc)
+            if point is None or point in closed:
+                continue
+            # 점프 포인트까지는 직선이므로 맨해튼 거리가 곧 비용
+            new_cost: int = costs[current] + abs(point[0] - current[0]) + abs(point[1] - current[1])
+            if point not in costs or costs[point] > new_cost:
+                costs[point] = new_cost
+                parents[point] = current
+                heappush(frontier, (new_cost + h(point), point))
+    return None, visited_count
+
+# 점프 포인트 사이의 직선 구간을 채워 Maze.mark에 쓸 수 있는 칸 단위 경로로 변환
+def _jump_points_to_path(point: Tuple[int, int],
+                         parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]]) -> List[MazeLocation]:
+    path: List[MazeLocation] = [MazeLocation(*point)]
+    parent: Optional[Tuple[int, int]] = parents[point]
+    while parent is not None:
+        dr: int = (parent[0] > point[0]) - (parent[0] < point[0])
+        dc: int = (parent[1] > point[1]) - (parent[1] < point[1])
+        row, column = point
+        while (row, column) != parent:
+            row += dr
+            column += dc
+            path.append(MazeLocation(row, column))
+        point, parent = parent, parents[parent]
+    path.reverse()
+    return path
+
+# 실험에서 비교할 탐색 알고리즘 목록: (이름, 미로를 받아 (해, 방문 수)를 반환하는 함수)
+MAZE_SEARCHES: List[Tuple[str, Callable[[Maze], Tuple[Optional[Any], int]]]] = [
+    ("DFS", lambda m: dfs(m.start, m.goal_test, m.successors)),
+    ("BFS", lambda m: bfs(m.start, m.goal_test, m.successors)),
+    ("A*", lambda m: astar(m.start, m.goal_test, m.successors, manhattan_distance(m.goal))),
+    ("양방향 BFS", lambda m: bidirectional_bfs(m.start, m.goal, m.successors)),
+    ("양방향 A*", lambda m: bidirectional_astar(m.start, m.goal, m.successors,
+                                             manhattan_distance(m.goal), manhattan_distance(m.start))),
+    ("JPS", jps),
+]
+
+# 시드 하나로 미로를 만들고 모든 탐색을 실행 (프로세스 풀에서도 쓰는 작업 단위)
+# 각 탐색마다 (이름, 방문 수 또는 실패 시 None, 실행 시간)을 반환
+def run_maze_sample(seed: int,
+                    rows: int = 10,
+                    columns: int = 10,
+                    sparseness: float = 0.2,
+                    vectorized: bool = False,
+                    precheck: bool = True) -> List[Tuple[str, Optional[int], float]]:
+    blocked: Optional[Any] = None
+    if vectorized:
+        # numpy로 막힌 칸 마스크를 한 번에 뽑음 (batch_maze가 maze를 import하므로 여기서 import)
+        from batch_maze import random_blocked_mask
+        blocked = random_blocked_mask(rows, columns, sparseness, seed)
+    else:
         # 재현 가능하게 하려면 시드 고정
-        random.seed(i)
-
-        m = Maze(
-            rows=rows,
-            columns=columns,
-            sparseness=sparseness,
-            start=MazeLocation(0, 0),
-            goal=MazeLocation(rows - 1, columns - 1)
-        )
-
-        # DFS
-        sol_dfs, visited_dfs = dfs(m.start, m.goal_test, m.successors)
-        if sol_dfs is None:
-            dfs_fail += 1
-        else:
-            dfs_counts.append(visited_dfs)
+        random.seed(seed)
 
-        # BFS
-        sol_bfs, visited_bfs = bfs(m.start, m.goal_test, m.successors)
-        if sol_bfs is None:
-            bfs_fail += 1
-        else:
-            bfs_counts.append(visited_bfs)
+    m = Maze(
+        rows=rows,
+        columns=columns,
+        sparseness=sparseness,
+        start=MazeLocation(0, 0),
+        goal=MazeLocation(rows - 1, columns - 1),
+        blocked=blocked
+    )
 
-        # A*
-        distance = manhattan_distance(m.goal)
-        sol_astar, visited_astar = astar(m.start, m.goal_test, m.successors, distance)
-        if sol_astar is None:
-            astar_fail += 1
-        else:
-            astar_counts.append(visited_astar)
+    results: List[Tuple[str, Optional[int], float]] = []
+    # 사전 검사(연결 요소 구성) 시간은 모든 탐색의 실행 시간에 더해서, 사전 검사를 켜고 끈
+    # 실험의 평균 실행 시간을 같은 기준으로 비교할 수 있게 함
+    precheck_time: float = 0.0
+    if precheck:
+        begin: float = time.perf_counter()
+        reachable: bool = m.goal_reachable(m.start)
+        precheck_time = time.perf_counter() - begin
+        if not reachable:
+            # 목표에 도달할 수 없는 미로는 탐색을 실행하지 않고 모두 실패로 기록
+            return [(name, None, precheck_time) for name, _ in MAZE_SEARCHES]
+    for name, search in MAZE_SEARCHES:
+        begin = time.perf_counter()
+        solution, visited = search(m)
+        elapsed: float = time.perf_counter() - begin + precheck_time
+        results.append((name, None if solution is None else visited, elapsed))
+    return results
+
+def run_maze_experiments(num_samples: int = 100,
+                         rows: int = 10,
+                         columns: int = 10,
+                         sparseness: float = 0.2,
+                         workers: int = 1,
+                         vectorized: bool = False,
+                         precheck: bool = True) -> Tuple[Dict[str, List[int]], Dict[str, int]]:
+    counts: Dict[str, List[int]] = {name: [] for name, _ in MAZE_SEARCHES}
+    times: Dict[str, List[float]] = {name: [] for name, _ in MAZE_SEARCHES}
+    fails: Dict[str, int] = {name: 0 for name, _ in MAZE_SEARCHES}
+
+    def collect(samples: Iterator[List[Tuple[str, Optional[int], float]]]) -> None:
+        # 결과는 항상 시드 순서대로 도착하므로 워커 수와 관계없이 같은 통계가 나옴
+        for sample in samples:
+            for name, visited, elapsed in sample:
+                times[name].append(elapsed)
+                if visited is None:
+                    fails[name] += 1
+                else:
+                    counts[name].append(visited)
+
+    run_sample: Callable[[int], List[Tuple[str, Optional[int], float]]] = \
+        partial(run_maze_sample, rows=rows, columns=columns, sparseness=sparseness,
+                vectorized=vectorized, precheck=precheck)
+    if workers > 1:
+        # 시드를 워커들에 나눠 주고, 끝난 결과부터 순서대로 받아서 집계
+        chunksize: int = max(1, num_samples // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            collect(executor.map(run_sample, range(num_samples), chunksize=chunksize))
+    else:
+        collect(map(run_sample, range(num_samples)))
 
     print(f"\n=== 통계 실험 결과 ({num_samples}개 미로) ===")
 
-    def summarize(name: str, data: List[int], fail_count: int) -> None:
+    def summarize(name: str, data: List[int], fail_count: int, elapsed: List[float]) -> None:
         if not data:
             print(f"{name}: 해를 찾은 미로가 하나도 없음 (실패 {fail_count}개)")
             return
@@ -142,16 +342,28 @@ def run_maze_experiments(num_samples: int = 100,
         print(f"  - 성공한 미로 수: {len(data)} / {num_samples} (실패 {fail_count}개)")
         print(f"  - 평균 방문 노드 수: {statistics.mean(data):.2f}")
         print(f"  - 중앙값: {statistics.median(data):.2f}")
-        print(f"  - 최소 / 최대: {min(data)} / {max(data)}\n")
+        print(f"  - 최소 / 최대: {min(data)} / {max(data)}")
+        print(f"  - 평균 실행 시간: {statistics.mean(elapsed) * 1000:.4f} ms\n")
 
-    summarize("DFS", dfs_counts, dfs_fail)
-    summarize("BFS", bfs_counts, bfs_fail)
-    summarize("A*", astar_counts, astar_fail)
+    for name, _ in MAZE_SEARCHES:
+        summarize(name, counts[name], fails[name], times[name])
+
+    return counts, fails
 
 # maze: Maze = Maze()
 # print(maze)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="미로 탐색 알고리즘 비교 실험")
+    parser.add_argument("--samples", type=int, default=100, help="실험할 미로 수")
+    parser.add_argument("--workers", type=int, default=1, help="프로세스 풀의 워커 수 (1이면 직렬 실행)")
+    parser.add_argument("--rows", type=int, default=10)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--sparseness", type=float, default=0.2)
+    parser.add_argument("--numpy", action="store_true", help="numpy로 미로를 생성 (큰 미로에서 빠름)")
+    parser.add_argument("--no-precheck", action="store_true", help="연결성 검사 없이 모든 미로를 탐색")
+    args = parser.parse_args()
+
     # 깊이 우선 탐색(DFS)
     # m: Maze = Maze()
     # print(m)
@@ -228,5 +440,7 @@ if __name__ == "__main__":
         print(f"방문한 지점 수: {visited3}")
         print(m)
 
-    # 🔸 2) 100개 랜덤 미로에 대한 통계 실험
-    run_maze_experiments(num_samples=100, rows=10, columns=10, sparseness=0.2)
\ No newline at end of file
+    # 🔸 2) 랜덤 미로에 대한 통계 실험 (기본값: 10x10 미로 100개, 워커 1개)
+    run_maze_experiments(num_samples=args.samples, rows=args.rows, columns=args.columns,
+                         sparseness=args.sparseness, workers=args.workers, vectorized=args.numpy,
+                         precheck=not args.no_precheck)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+from typing import List, Optional, Iterable, BinaryIO
+import mmap
+import os
+import random
+import struct
+import tempfile
+from maze import Maze, MazeLocation, Cell
+
+# 미로 파일 형식
+#   헤더 32바이트: 매직 b"MAZE", 버전, 칸 인코딩, (패딩 2바이트),
+#                 행 수, 열 수, 시작 행, 시작 열, 목표 행, 목표 열 (각각 부호 없는 32비트, 리틀 엔디언)
+#   본문: 행 우선(row-major)으로 한 행씩 저장. 막힌 칸이 1
+#     BYTE_CELLS - 칸 하나에 1바이트 (행 하나가 columns 바이트)
+#     BIT_CELLS  - 칸 하나에 1비트, 하위 비트부터 (행 하나가 (columns + 7) // 8 바이트)
+MAGIC: bytes = b"MAZE"
+VERSION: int = 1
+BYTE_CELLS: int = 0
+BIT_CELLS: int = 1
+HEADER: struct.Struct = struct.Struct("<4sBBxx6I")
+
+def _row_stride(columns: int, encoding: int) -> int:
+    return columns if encoding == BYTE_CELLS else (columns + 7) // 8
+
+def _encode_row(blocked: Iterable[bool], columns: int, encoding: int) -> bytes:
+    if encoding == BYTE_CELLS:
+        return bytes(1 if b else 0 for b in blocked)
+    row: bytearray = bytearray(_row_stride(columns, encoding))
+    for column, b in enumerate(blocked):
+        if b:
+            row[column >> 3] |= 1 << (column & 7)
+    return bytes(row)
+
+def _write(out: BinaryIO, rows: int, columns: int, start: MazeLocation, goal: MazeLocation,
+           blocked_rows: Iterable[Iterable[bool]], encoding: int) -> None:
+    if encoding not in (BYTE_CELLS, BIT_CELLS):
+        raise ValueError(f"unknown cell encoding: {encoding}")
+    out.write(HEADER.pack(MAGIC, VERSION, encoding, rows, columns,
+                          start.row, start.column, goal.row, goal.column))
+    # 한 행씩 써서 전체 격자를 한꺼번에 메모리에 만들지 않음
+    for blocked in blocked_rows:
+        out.write(_encode_row(blocked, columns, encoding))
+
+# 메모리의 Maze를 파일로 저장
+def write_maze(maze: Maze, path: str, encoding: int = BYTE_CELLS) -> None:
+    with open(path, "wb") as out:
+        _write(out, maze._rows, maze._columns, maze.start, maze.goal,
+               ([cell == Cell.BLOCKED for cell in row] for row in maze._grid), encoding)
+
+# Maze.__str__ 형식의 텍스트(" ", "X", "S", "G", "*")를 파일로 저장
+def write_maze_text(text: str, path: str, encoding: int = BYTE_CELLS) -> None:
+    lines: List[str] = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop() # __str__은 마지막 행 뒤에도 줄바꿈이 있음
+    rows: int = len(lines)
+    columns: int = max((len(line) for line in lines), default=0)
+    start: Optional[MazeLocation] = None
+    goal: Optional[MazeLocation] = None
+    for row, line in enumerate(lines):
+        if Cell.START.value in line:
+            start = MazeLocation(row, line.index(Cell.START.value))
+        if Cell.GOAL.value in line:
+            goal = MazeLocation(row, line.index(Cell.GOAL.value))
+    if start is None or goal is None:
+        raise ValueError("maze text must contain a start (S) and a goal (G)")
+    with open(path, "wb") as out:
+        _write(out, rows, columns, start, goal,
+               ([c == Cell.BLOCKED.value for c in line.ljust(columns)] for line in lines), encoding)
+
+class MappedMaze:
+    """미로 파일을 mmap으로 열어, 격자 전체를 읽어 들이지 않고 필요한 칸만 매핑에서 직접 읽는 미로.
+    Maze와 같은 start, goal, goal_test, successors를 제공하므로 generic_search의 함수에 그대로 쓸 수 있다."""
+
+    def __init__(self, path: str) -> None:
+        self._file: BinaryIO = open(path, "rb")
+        # 빈 파일은 mmap할 수 없으므로 매핑 전에 헤더 길이부터 확인
+        if os.fstat(self._file.fileno()).st_size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is too short to be a maze file")
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, encoding, rows, columns, start_row, start_column, goal_row, goal_column = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} maze file")
+        if encoding not in (BYTE_CELLS, BIT_CELLS):
+            self.close()
+            raise ValueError(f"unknown cell encoding: {encoding}")
+        self._rows: int = rows
+        self._columns: int = columns
+        self._encoding: int = encoding
+        self._stride: int = _row_stride(columns, encoding)
+        self.start: MazeLocation = MazeLocation(start_row, start_column)
+        self.goal: MazeLocation = MazeLocation(goal_row, goal_column)
+        if len(self._map) < HEADER.size + rows * self._stride:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def _blocked(self, row: int, column: int) -> bool:
+        if self._encoding == BYTE_CELLS:
+            return self._map[HEADER.size + row * self._stride + column] != 0
+        return (self._map[HEADER.size + row * self._stride + (column >> 3)] >> (column & 7)) & 1 == 1
+
+    def is_blocked(self, ml: MazeLocation) -> bool:
+        return self._blocked(ml.row, ml.column)
+
+    def goal_test(self, ml: MazeLocation) -> bool:
+        return ml == self.goal
+
+    def successors(self, ml: MazeLocation) -> List[MazeLocation]:
+        locations: List[MazeLocation] = []
+        if ml.row + 1 < self._rows and not self._blocked(ml.row + 1, ml.column):
+            locations.append(MazeLocation(ml.row + 1, ml.column))
+        if ml.row - 1 >= 0 and not self._blocked(ml.row - 1, ml.column):
+            locations.append(MazeLocation(ml.row - 1, ml.column))
+        if ml.column + 1 < self._columns and not self._blocked(ml.row, ml.column + 1):
+            locations.append(MazeLocation(ml.row, ml.column + 1))
+        if ml.column - 1 >= 0 and not self._blocked(ml.row, ml.column - 1):
+            locations.append(MazeLocation(ml.row, ml.column - 1))
+        return locations
+
+    # 작은 미로를 Maze로 읽어 들여 mark/clear/print에 사용
+    def to_maze(self) -> Maze:
+        blocked: List[bytes] = [bytes(1 if self._blocked(row, column) else 0 for column in range(self._columns))
+                                for row in range(self._rows)]
+        return Maze(rows=self._rows, columns=self._columns, start=self.start, goal=self.goal, blocked=blocked)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> MappedMaze:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+if __name__ == "__main__":
+    from generic_search import astar, node_to_path
+    from maze import manhattan_distance
+    random.seed(0)
+    m: Maze = Maze(rows=20, columns=30, goal=MazeLocation(19, 29))
+    path: str = os.path.join(tempfile.mkdtemp(), "maze.bin")
+    write_maze(m, path, encoding=BIT_CELLS)
+    print(f"{path}: {os.path.getsize(path)} 바이트")
+    with MappedMaze(path) as mapped:
+        solution, visited = astar(mapped.start, mapped.goal_test, mapped.successors,
+                                  manhattan_distance(mapped.goal))
+        if solution is None:
+            print("A* 알고리즘으로 길을 찾을 수 없습니다!")
+        else:
+            m.mark(node_to_path(solution))
+            print(f"방문한 지점 수: {visited}")
+            print(m)
@@ -0,0 +1,65 @@
+from typing import List, Optional, Tuple, Callable, Any
+import random
+import time
+import tracemalloc
+from generic_search import bfs, node_to_path, Node
+from grid_maze import GridMaze, grid_bfs
+from maze import Maze, MazeLocation
+
+# 비교용: __slots__가 없는 예전 방식의 노드 (속성을 __dict__에 저장)
+class DictNode:
+    def __init__(self, state: Any, parent: Optional["DictNode"], cost: float = 0.0, heuristic: float = 0.0) -> None:
+        self.state = state
+        self.parent = parent
+        self.cost = cost
+        self.heuristic = heuristic
+
+# func를 실행하는 동안의 (최대 메모리 바이트, 실행 시간 초, 반환값)
+def measure(func: Callable[[], Any]) -> Tuple[int, float, Any]:
+    tracemalloc.start()
+    begin: float = time.perf_counter()
+    result: Any = func()
+    elapsed: float = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, result
+
+# 노드 count개를 부모 체인으로 만들었을 때의 노드 하나당 바이트 수
+def bytes_per_node(node_class: Callable[..., Any], count: int = 100_000) -> float:
+    def build() -> Any:
+        node = node_class(0, None)
+        for i in range(1, count):
+            node = node_class(i, node, float(i))
+        return node
+    peak, _, _ = measure(build)
+    return peak / count
+
+def run_memory_benchmark(rows: int = 1000, columns: int = 1000, sparseness: float = 0.2, seed: int = 0) -> None:
+    random.seed(seed)
+    m: Maze = Maze(rows=rows, columns=columns, sparseness=sparseness,
+                   start=MazeLocation(0, 0), goal=MazeLocation(rows - 1, columns - 1))
+    gm: GridMaze = GridMaze.from_maze(m)
+
+    print(f"=== {rows}x{columns} 미로 메모리 비교 ===")
+    print(f"노드 하나당 메모리: __dict__ 노드 {bytes_per_node(DictNode):.1f} B, "
+          f"__slots__ 노드 {bytes_per_node(Node):.1f} B")
+
+    def generic() -> Optional[List[MazeLocation]]:
+        solution, _ = bfs(m.start, m.goal_test, m.successors)
+        return None if solution is None else node_to_path(solution)
+
+    def grid() -> Optional[List[MazeLocation]]:
+        path, _ = grid_bfs(gm)
+        return path
+
+    results: List[Optional[List[MazeLocation]]] = []
+    for name, func in (("bfs (Node 체인)", generic), ("grid_bfs (부모 인덱스 배열)", grid)):
+        peak, elapsed, path = measure(func)
+        results.append(path)
+        print(f"{name}: 최대 메모리 {peak / 1024 / 1024:.1f} MiB, 시간 {elapsed:.2f} 초")
+    # 두 방식 모두 최단 경로를 찾으므로 길이가 같아야 함
+    if results[0] is not None and results[1] is not None:
+        assert len(results[0]) == len(results[1])
+
+if __name__ == "__main__":
+    run_memory_benchmark()
@@ -0,0 +1,342 @@
+import random
+import pytest
+from maze import Maze, MazeLocation, Cell, manhattan_distance, jps, run_maze_experiments, run_maze_sample
+from generic_search import dfs, bfs, astar, node_to_path, bidirectional_bfs, bidirectional_astar, ida_star, SearchStats
+from grid_maze import GridMaze, grid_dfs, grid_bfs, grid_astar
+from dstar_lite import DStarLite
+from maze_file import write_maze, write_maze_text, MappedMaze, BYTE_CELLS, BIT_CELLS
+
+
+def random_maze(seed: int, rows: int = 20, columns: int = 20) -> Maze:
+    random.seed(seed)
+    return Maze(rows=rows, columns=columns, sparseness=0.25,
+                start=MazeLocation(0, 0), goal=MazeLocation(rows - 1, columns - 1))
+
+
+def assert_valid_path(m: Maze, path):
+    assert path[0] == m.start
+    assert path[-1] == m.goal
+    for a, b in zip(path, path[1:]):
+        assert b in m.successors(a)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_grid_searches_match_generic(seed):
+    m = random_maze(seed)
+    gm = GridMaze.from_maze(m)
+    solution, _ = bfs(m.start, m.goal_test, m.successors)
+    for search in (grid_dfs, grid_bfs, grid_astar):
+        path, visited = search(gm)
+        if solution is None:
+            assert path is None
+            continue
+        assert visited > 0
+        assert_valid_path(m, path)
+    if solution is not None:
+        shortest = len(node_to_path(solution))
+        assert len(grid_bfs(gm)[0]) == shortest
+        assert len(grid_astar(gm)[0]) == shortest
+
+
+def test_grid_random_matches_maze_with_same_seed():
+    random.seed(7)
+    m = Maze(rows=15, columns=12, sparseness=0.3, goal=MazeLocation(14, 11))
+    random.seed(7)
+    gm = GridMaze.random(rows=15, columns=12, sparseness=0.3, goal=MazeLocation(14, 11))
+    assert str(gm) == str(m).replace(Cell.START.value, " ").replace(Cell.GOAL.value, " ")
+
+
+def test_grid_path_can_be_marked():
+    m = random_maze(3)
+    path, _ = grid_astar(GridMaze.from_maze(m))
+    if path is None:
+        pytest.skip("unsolvable maze")
+    m.mark(path)
+    assert str(m).count(Cell.PATH.value) == len(path) - 2
+    m.clear(path)
+    assert Cell.PATH.value not in str(m)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_bidirectional_searches_find_shortest_paths(seed):
+    m = random_maze(seed, rows=25, columns=30)
+    solution, _ = bfs(m.start, m.goal_test, m.successors)
+    bi_bfs, _ = bidirectional_bfs(m.start, m.goal, m.successors)
+    bi_astar, _ = bidirectional_astar(m.start, m.goal, m.successors,
+                                      manhattan_distance(m.goal), manhattan_distance(m.start))
+    if solution is None:
+        assert bi_bfs is None and bi_astar is None
+        return
+    shortest = len(node_to_path(solution))
+    for node in (bi_bfs, bi_astar):
+        path = node_to_path(node)
+        assert_valid_path(m, path)
+        assert len(path) == shortest
+        assert node.cost == shortest - 1
+
+
+def test_bidirectional_same_start_and_goal():
+    m = random_maze(0)
+    node, _ = bidirectional_bfs(m.start, m.start, m.successors)
+    assert node_to_path(node) == [m.start]
+    node, _ = bidirectional_astar(m.start, m.start, m.successors,
+                                  manhattan_distance(m.start), manhattan_distance(m.start))
+    assert node_to_path(node) == [m.start]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ida_star_finds_shortest_paths(seed):
+    m = random_maze(seed, rows=8, columns=8)
+    solution, _ = bfs(m.start, m.goal_test, m.successors)
+    if solution is None:
+        pytest.skip("unsolvable maze (IDA* enumerates every simple path)")
+    node, visited = ida_star(m.start, m.goal_test, m.successors, manhattan_distance(m.goal))
+    path = node_to_path(node)
+    assert_valid_path(m, path)
+    assert len(path) == len(node_to_path(solution))
+    assert visited >= len(path)
+
+
+def test_ida_star_reports_unreachable_goal():
+    m = random_maze(0, rows=4, columns=4)
+    m._grid[3][2] = m._grid[2][3] = Cell.BLOCKED
+    node, visited = ida_star(m.start, m.goal_test, m.successors, manhattan_distance(m.goal))
+    assert node is None
+    assert visited > 0
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_jps_finds_shortest_paths(seed):
+    m = random_maze(seed, rows=15 + seed % 7, columns=12 + seed % 11)
+    solution, _ = bfs(m.start, m.goal_test, m.successors)
+    path, visited = jps(m)
+    if solution is None:
+        assert path is None
+        return
+    assert_valid_path(m, path)
+    assert len(path) == len(node_to_path(solution))
+    m.mark(path)
+    m.clear(path)
+
+
+def test_parallel_experiments_match_serial(capsys):
+    serial = run_maze_experiments(num_samples=24, rows=12, columns=12, workers=1)
+    parallel = run_maze_experiments(num_samples=24, rows=12, columns=12, workers=3)
+    assert serial == parallel
+    counts, fails = serial
+    assert all(len(counts[name]) + fails[name] == 24 for name in counts)
+
+
+def test_search_stats_are_recorded():
+    m = random_maze(4, rows=30, columns=30)
+    for search in (dfs, bfs, astar):
+        args = (m.start, m.goal_test, m.successors)
+        if search is astar:
+            args += (manhattan_distance(m.goal),)
+        stats = SearchStats()
+        node, visited = search(*args, stats=stats)
+        plain_node, plain_visited = search(*args)
+        assert visited == plain_visited == stats.expansions
+        assert (node is None) == (plain_node is None)
+        assert stats.successors_calls == visited - (node is not None)
+        assert stats.peak_frontier > 0 and stats.explored_size >= visited
+        assert stats.total_time >= stats.successors_time + stats.heuristic_time
+        assert stats.bookkeeping_time >= 0 and stats.expansions_per_second > 0
+        assert (stats.heuristic_calls > 0) == (search is astar)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_distance_field_answers_queries_from_any_start(seed):
+    m = random_maze(seed, rows=25, columns=25)
+    field = m.distance_field()
+    assert m.distance_field() is field
+    rng = random.Random(seed)
+    for _ in range(20):
+        start = MazeLocation(rng.randrange(25), rng.randrange(25))
+        if m._grid[start.row][start.column] == Cell.BLOCKED:
+            continue
+        solution, _ = bfs(start, m.goal_test, m.successors)
+        path = field.path_from(start)
+        if solution is None:
+            assert path is None and field.distance(start) is None
+            continue
+        assert len(path) == len(node_to_path(solution)) == field.distance(start) + 1
+        assert path[0] == start and path[-1] == m.goal
+        for a, b in zip(path, path[1:]):
+            assert b in m.successors(a)
+
+
+def test_multi_goal_distance_field_uses_nearest_goal():
+    m = random_maze(5, rows=20, columns=20)
+    goals = [MazeLocation(19, 19), MazeLocation(0, 19), MazeLocation(10, 10)]
+    combined = m.distance_field(goals)
+    singles = [m.distance_field([goal]) for goal in goals]
+    for row in range(20):
+        for column in range(20):
+            ml = MazeLocation(row, column)
+            known = [d for d in (f.distance(ml) for f in singles) if d is not None]
+            assert combined.distance(ml) == (min(known) if known else None)
+            path = combined.path_from(ml)
+            if path is not None:
+                assert path[-1] in goals
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_dstar_lite_repairs_paths_after_edits(seed):
+    m = random_maze(seed, rows=15, columns=15)
+    planner = DStarLite(m)
+    rng = random.Random(seed)
+    for step in range(12):
+        path, _ = planner.plan()
+        solution, _ = bfs(planner.start, m.goal_test, m.successors)
+        if solution is None:
+            assert path is None
+        else:
+            assert path is not None and len(path) == len(node_to_path(solution))
+            assert path[0] == planner.start and path[-1] == m.goal
+            for a, b in zip(path, path[1:]):
+                assert b in m.successors(a)
+            if step % 3 == 2 and len(path) > 2:
+                planner.move_start(path[1])
+        edits = []
+        for _ in range(4):
+            ml = MazeLocation(rng.randrange(15), rng.randrange(15))
+            if ml not in (planner.start, m.goal, m.start):
+                edits.append((ml, rng.random() < 0.6))
+        planner.apply_edits(edits)
+
+
+def test_dstar_lite_blocks_relative_to_moved_start():
+    m = Maze(rows=3, columns=3, sparseness=0.0, start=MazeLocation(0, 0), goal=MazeLocation(2, 2))
+    planner = DStarLite(m)
+    path, _ = planner.plan()
+    planner.move_start(path[1])
+    old_start = m.start
+    planner.set_blocked(old_start, True) # 처음 시작 위치는 이제 막을 수 있음
+    assert m.is_blocked(old_start)
+    with pytest.raises(ValueError):
+        planner.set_blocked(planner.start, True)
+    with pytest.raises(ValueError):
+        planner.set_blocked(m.goal, True)
+    path, _ = planner.plan()
+    assert path[0] == planner.start and path[-1] == m.goal and old_start not in path
+    assert len(path) == len(node_to_path(bfs(planner.start, m.goal_test, m.successors)[0]))
+
+
+def test_vectorized_masks_are_reproducible_per_sample():
+    np = pytest.importorskip("numpy")
+    from batch_maze import random_blocked_mask, random_blocked_masks, maze_from_mask, grid_maze_from_mask
+    batch = random_blocked_masks(5, 30, 40, 0.3, first_seed=10)
+    assert batch.shape == (5, 30, 40) and batch.flags["C_CONTIGUOUS"]
+    for i in range(5):
+        mask = random_blocked_mask(30, 40, 0.3, seed=10 + i)
+        assert np.array_equal(batch[i], mask)
+        m = maze_from_mask(mask)
+        gm = grid_maze_from_mask(batch[i])
+        assert str(gm) == str(m).replace(Cell.START.value, " ").replace(Cell.GOAL.value, " ")
+        blocked = sum(row.count(Cell.BLOCKED) for row in m._grid)
+        assert blocked == int(mask.sum()) - int(mask[0, 0]) - int(mask[29, 39])
+        assert grid_bfs(gm)[1] == bfs(m.start, m.goal_test, m.successors)[1]
+
+
+def test_vectorized_experiments_are_deterministic(capsys):
+    pytest.importorskip("numpy")
+    first = run_maze_experiments(num_samples=10, rows=15, columns=15, vectorized=True)
+    second = run_maze_experiments(num_samples=10, rows=15, columns=15, workers=2, vectorized=True)
+    assert first == second
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_connectivity_index_matches_search(seed):
+    m = random_maze(seed, rows=20, columns=20)
+    rng = random.Random(seed)
+    for _ in range(30):
+        a = MazeLocation(rng.randrange(20), rng.randrange(20))
+        if m.is_blocked(a):
+            assert not m.goal_reachable(a)
+            continue
+        solution, _ = bfs(a, m.goal_test, m.successors)
+        assert m.goal_reachable(a) == (solution is not None)
+
+
+def test_connectivity_follows_edits_and_short_circuits_searches():
+    m = random_maze(0, rows=6, columns=6)
+    for row in range(6):
+        for column in range(6):
+            if MazeLocation(row, column) not in (m.start, m.goal):
+                m.set_blocked(MazeLocation(row, column), False)
+    assert m.goal_reachable(m.start)
+    wall = [MazeLocation(row, 3) for row in range(6)]
+    for ml in wall:
+        m.set_blocked(ml, True)
+    assert not m.goal_reachable(m.start)
+    for search in (dfs, bfs):
+        assert search(m.start, m.goal_test, m.successors, reachable=m.goal_reachable) == (None, 0)
+    assert astar(m.start, m.goal_test, m.successors, manhattan_distance(m.goal),
+                 reachable=m.goal_reachable) == (None, 0)
+    assert ida_star(m.start, m.goal_test, m.successors, manhattan_distance(m.goal),
+                    reachable=m.goal_reachable) == (None, 0)
+    m.set_blocked(wall[2], False)
+    assert m.goal_reachable(m.start)
+    node, _ = bfs(m.start, m.goal_test, m.successors, reachable=m.goal_reachable)
+    assert node is not None
+
+
+def test_precheck_does_not_change_experiment_statistics(capsys):
+    with_precheck = run_maze_experiments(num_samples=30, rows=10, columns=10, sparseness=0.3)
+    without_precheck = run_maze_experiments(num_samples=30, rows=10, columns=10, sparseness=0.3, precheck=False)
+    assert with_precheck == without_precheck
+
+
+def test_precheck_time_is_charged_to_every_search():
+    samples = [run_maze_sample(seed, sparseness=0.4) for seed in range(30)]
+    rejected = [sample for sample in samples if all(visited is None for _, visited, _ in sample)]
+    assert rejected and len(rejected) < len(samples)
+    # 사전 검사에서 걸러진 미로도 연결 요소를 만든 시간이 실행 시간으로 기록됨
+    for sample in samples:
+        assert all(elapsed > 0 for _, _, elapsed in sample)
+
+
+@pytest.mark.parametrize("encoding", [BYTE_CELLS, BIT_CELLS])
+def test_mapped_maze_matches_in_memory_maze(tmp_path, encoding):
+    m = random_maze(6, rows=17, columns=29)
+    path = str(tmp_path / "maze.bin")
+    write_maze(m, path, encoding=encoding)
+    text_path = str(tmp_path / "maze_from_text.bin")
+    write_maze_text(str(m), text_path, encoding=encoding)
+    with open(path, "rb") as a, open(text_path, "rb") as b:
+        assert a.read() == b.read()
+    with MappedMaze(path) as mapped:
+        assert (mapped.start, mapped.goal) == (m.start, m.goal)
+        for row in range(17):
+            for column in range(29):
+                ml = MazeLocation(row, column)
+                assert mapped.successors(ml) == m.successors(ml)
+        assert str(mapped.to_maze()) == str(m)
+        node, visited = bfs(mapped.start, mapped.goal_test, mapped.successors)
+        assert (node, visited)[1] == bfs(m.start, m.goal_test, m.successors)[1]
+
+
+def test_mapped_maze_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_maze.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        MappedMaze(str(path))
+
+
+@pytest.mark.parametrize("data", [b"", b"MAZ", b"MAZE\x01"])
+def test_mapped_maze_rejects_short_header(tmp_path, data):
+    path = tmp_path / "short.bin"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        MappedMaze(str(path))
+
+
+def test_mapped_maze_rejects_unknown_encoding(tmp_path):
+    path = tmp_path / "maze.bin"
+    write_maze_text("S X\n  G\n", str(path))
+    data = bytearray(path.read_bytes())
+    data[5] = 7 # 칸 인코딩 바이트
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="encoding"):
+        MappedMaze(str(path))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple
+from array import array
+from collections import deque
+from functools import lru_cache
+import time
+
+MCTuple = Tuple[int, int, bool] # (서쪽 선교사 수, 서쪽 식인종 수, 배가 서쪽에 있는지)
+
+UNREACHABLE: int = -1
+
+class MCStateSpace:
+    """선교사와 식인종이 각각 group_size명이고 배에 boat_capacity명까지 탈 수 있는 문제의 전체 상태 그래프.
+    상태는 ((서쪽 선교사 수) * (group_size + 1) + (서쪽 식인종 수)) * 2 + (배가 서쪽이면 1)인 정수로 다루고,
+    만들 때 목표 상태에서 BFS를 한 번 해 두므로 어떤 시작 상태에 대한 최단 해도 경로 길이만큼의 시간에 답한다."""
+
+    def __init__(self, group_size: int, boat_capacity: int) -> None:
+        if group_size < 0 or boat_capacity < 1:
+            raise ValueError("group_size must be >= 0 and boat_capacity >= 1")
+        self.group_size: int = group_size
+        self.boat_capacity: int = boat_capacity
+        self.size: int = (group_size + 1) * (group_size + 1) * 2
+        # 배에 태울 수 있는 (선교사, 식인종) 조합. 배 위에서도 선교사가 식인종보다 적으면 안 됨
+        self._moves: List[Tuple[int, int]] = [(m, c)
+                                              for m in range(boat_capacity + 1)
+                                              for c in range(boat_capacity + 1 - m)
+                                              if 0 < m + c and (m == 0 or m >= c)]
+        self.goal: int = self.encode(0, 0, False)
+        self.start: int = self.encode(group_size, group_size, True)
+        # 목표 상태까지의 (BFS 트리에서) 다음 상태와 남은 건너기 횟수
+        self._next: array = array('i', [UNREACHABLE]) * self.size
+        self._distance: array = array('i', [UNREACHABLE]) * self.size
+        self._build_tree()
+
+    def encode(self, missionaries: int, cannibals: int, boat: bool) -> int:
+        return (missionaries * (self.group_size + 1) + cannibals) * 2 + (1 if boat else 0)
+
+    def decode(self, state: int) -> MCTuple:
+        boat: int = state & 1
+        missionaries, cannibals = divmod(state >> 1, self.group_size + 1)
+        return missionaries, cannibals, boat == 1
+
+    def is_legal(self, missionaries: int, cannibals: int) -> bool:
+        east_missionaries: int = self.group_size - missionaries
+        east_cannibals: int = self.group_size - cannibals
+        if 0 < missionaries < cannibals:
+            return False
+        if 0 < east_missionaries < east_cannibals:
+            return False
+        return True
+
+    def successors(self, state: int) -> List[int]:
+        wm, wc, boat = self.decode(state)
+        n: int = self.group_size
+        sucs: List[int] = []
+        for m, c in self._moves:
+            # 배가 있는 쪽에서 반대쪽으로 m명, c명을 옮김
+            nm, nc = (wm - m, wc - c) if boat else (wm + m, wc + c)
+            if 0 <= nm <= n and 0 <= nc <= n and self.is_legal(nm, nc):
+                sucs.append(self.encode(nm, nc, not boat))
+        return sucs
+
+    # 이동은 되돌릴 수 있으므로(무향 그래프) 목표에서 한 번 BFS하면 모든 상태의 최단 해가 나옴
+    def _build_tree(self) -> None:
+        self._distance[self.goal] = 0
+        self._next[self.goal] = self.goal
+        frontier: deque = deque([self.goal])
+        while frontier:
+            current: int = frontier.popleft()
+            for neighbor in self.successors(current):
+                if self._distance[neighbor] == UNREACHABLE:
+                    self._distance[neighbor] = self._distance[current] + 1
+                    self._next[neighbor] = current
+                    frontier.append(neighbor)
+
+    # 최소 건너기 횟수 (해가 없으면 None)
+    def solution_length(self, start: Optional[MCTuple] = None) -> Optional[int]:
+        state: int = self.start if start is None else self.encode(*start)
+        distance: int = self._distance[state]
+        return None if distance == UNREACHABLE else distance
+
+    # 시작 상태(기본값: 모두 서쪽)에서 목표 상태까지의 최단 상태 목록 (해가 없으면 None)
+    def solve(self, start: Optional[MCTuple] = None) -> Optional[List[MCTuple]]:
+        state: int = self.start if start is None else self.encode(*start)
+        if self._distance[state] == UNREACHABLE:
+            return None
+        path: List[MCTuple] = [self.decode(state)]
+        while state != self.goal:
+            state = self._next[state]
+            path.append(self.decode(state))
+        return path
+
+# 같은 (group_size, boat_capacity)에 대한 상태 그래프는 한 번만 만듦
+@lru_cache(maxsize=None)
+def state_space(group_size: int, boat_capacity: int) -> MCStateSpace:
+    return MCStateSpace(group_size, boat_capacity)
+
+def display_solution(path: List[MCTuple], group_size: int) -> None:
+    for (wm, wc, boat), (nm, nc, _) in zip(path, path[1:]):
+        if boat:
+            print(f"{wm - nm}명의 선교사와 {wc - nc}명의 식인종이 서쪽 강둑에서 동쪽 강둑으로 갔다.")
+        else:
+            print(f"{nm - wm}명의 선교사와 {nc - wc}명의 식인종이 동쪽 강둑에서 서쪽 강둑으로 갔다.")
+    print(f"모두 {len(path) - 1}번 건넜다. (각 {group_size}명)")
+
+if __name__ == "__main__":
+    solution: Optional[List[MCTuple]] = state_space(3, 2).solve()
+    if solution is None:
+        print("답을 찾을 수 없습니다.")
+    else:
+        display_solution(solution, 3)
+
+    # 인원수와 배 정원을 바꿔 가며 최소 건너기 횟수를 구함
+    begin: float = time.perf_counter()
+    print("\n인원수  정원2  정원3  정원4  정원5")
+    for n in range(1, 101):
+        lengths: List[Optional[int]] = [state_space(n, capacity).solution_length() for capacity in range(2, 6)]
+        if n <= 10 or n % 10 == 0:
+            print(f"{n:>6} " + " ".join(f"{'-' if l is None else l:>6}" for l in lengths))
+    print(f"{time.perf_counter() - begin:.3f} 초")
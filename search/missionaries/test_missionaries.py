@@ -0,0 +1,48 @@
+import pytest
+from missionaries import MCState, MAX_NUM
+from generic_search import bfs, node_to_path
+from mc_solver import MCStateSpace, state_space
+
+
+def assert_valid_solution(space, path):
+    n = space.group_size
+    assert path[0] == (n, n, True)
+    assert path[-1] == (0, 0, False)
+    for (wm, wc, boat), (nm, nc, next_boat) in zip(path, path[1:]):
+        assert next_boat != boat
+        assert space.is_legal(nm, nc)
+        moved_m, moved_c = (wm - nm, wc - nc) if boat else (nm - wm, nc - wc)
+        assert moved_m >= 0 and moved_c >= 0
+        assert 0 < moved_m + moved_c <= space.boat_capacity
+
+
+def test_matches_mcstate_bfs():
+    solution, _ = bfs(MCState(MAX_NUM, MAX_NUM, True), MCState.goal_test, MCState.successors)
+    expected = node_to_path(solution)
+    path = state_space(MAX_NUM, 2).solve()
+    assert len(path) == len(expected)
+    assert_valid_solution(state_space(MAX_NUM, 2), path)
+
+
+@pytest.mark.parametrize("group_size, capacity, crossings", [
+    (1, 2, 1), (2, 2, 5), (3, 2, 11), (4, 2, None), (4, 3, 9), (5, 3, 11), (6, 3, None), (6, 4, 9),
+])
+def test_known_solution_lengths(group_size, capacity, crossings):
+    space = state_space(group_size, capacity)
+    assert space.solution_length() == crossings
+    path = space.solve()
+    if crossings is None:
+        assert path is None
+    else:
+        assert len(path) == crossings + 1
+        assert_valid_solution(space, path)
+
+
+def test_encode_decode_round_trip():
+    space = MCStateSpace(4, 3)
+    for state in range(space.size):
+        assert space.encode(*space.decode(state)) == state
+
+
+def test_state_space_is_cached():
+    assert state_space(7, 4) is state_space(7, 4)